@@ -0,0 +1 @@
+# 벤치마크 패키지 초기화 파일
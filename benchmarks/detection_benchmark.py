@@ -0,0 +1,196 @@
+"""
+색상 감지 처리량 벤치마크
+
+화면 캡처 없이 합성 프레임으로 감지 경로만 측정하고 결과를 JSON으로 출력합니다.
+
+사용 예:
+    python -m benchmarks.detection_benchmark --output bench.json
+    python -m benchmarks.detection_benchmark --sizes 300x300 1920x1080 --densities 0 0.1 --points 0 256
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+
+import numpy as np
+from PyQt5.QtCore import QPoint, QRect
+from PyQt5.QtGui import QColor
+
+from src.models.color_detector import ColorDetector
+from src.models.color_monitor_thread import ColorMonitorThread
+from src.models.frame_source import SyntheticFrameSource
+
+
+# 기본 측정 조건 (300x300은 MonitoringArea 기본 크기)
+DEFAULT_SIZES = ["300x300", "640x480", "1280x720", "1920x1080", "2560x1440", "3840x2160"]
+DEFAULT_DENSITIES = [0.0, 0.001, 0.01, 0.1, 0.5]
+DEFAULT_POINTS = [0, 16, 256]
+
+TARGET_RGB = (255, 0, 0)
+THRESHOLD = 10
+
+
+def parse_size(text):
+    """'WxH' 문자열을 (width, height)로 변환"""
+    width, height = text.lower().split("x")
+    return int(width), int(height)
+
+
+def latency_stats(samples):
+    """
+    프레임별 지연 시간 통계 계산
+
+    Args:
+        samples: 초 단위 지연 시간 목록
+
+    Returns:
+        dict: 밀리초 단위 백분위수와 초당 프레임 수
+    """
+    ms = np.asarray(samples) * 1000.0
+    total = float(np.sum(samples))
+    return {
+        "latency_ms": {
+            "min": float(ms.min()),
+            "p50": float(np.percentile(ms, 50)),
+            "p90": float(np.percentile(ms, 90)),
+            "p99": float(np.percentile(ms, 99)),
+            "max": float(ms.max()),
+            "mean": float(ms.mean()),
+        },
+        "fps": len(samples) / total if total > 0 else None,
+    }
+
+
+def make_points(count, width, height, rng):
+    """모니터링 영역 내부의 임의 QPoint 목록 생성"""
+    xs = rng.integers(0, width, count)
+    ys = rng.integers(0, height, count)
+    return [QPoint(int(x), int(y)) for x, y in zip(xs, ys)]
+
+
+def bench_detector(frames, points, engine, warmup, workers=None, pyramid_factor=None):
+    """ColorDetector 전체 스캔 경로 측정 (last_match_points 주변은 제외 영역)"""
+    detector = ColorDetector(QColor(*TARGET_RGB), THRESHOLD, vectorized=engine != "python",
+                             parallel=engine == "parallel", workers=workers,
+                             pyramid_factor=pyramid_factor if engine == "pyramid" else None)
+    samples = []
+    for index, frame in enumerate(frames):
+        detector.last_match_points = list(points)
+        start = time.perf_counter()
+        detector._check_colors_pixel_mode(frame, *TARGET_RGB, 0, 0)
+        elapsed = time.perf_counter() - start
+        if index >= warmup:
+            samples.append(elapsed)
+    if detector.parallel_matcher is not None:
+        detector.parallel_matcher.shutdown()
+    return samples
+
+
+def bench_monitor_thread(frames, points, warmup):
+    """ColorMonitorThread 검사 경로 측정 (highlighted_areas는 points 주변 10x10 영역)"""
+    thread = ColorMonitorThread(0, QColor(*TARGET_RGB), THRESHOLD)
+    height, width = frames[0].shape[:2]
+    thread.set_monitoring_area(QRect(0, 0, width, height))
+    for point in points:
+        thread.add_highlighted_area(point)
+
+    samples = []
+    for index, frame in enumerate(frames):
+        start = time.perf_counter()
+        thread._check_colors_pixel_mode(frame, *TARGET_RGB, 0, 0)
+        elapsed = time.perf_counter() - start
+        if index >= warmup:
+            samples.append(elapsed)
+    return samples
+
+
+def run(sizes, densities, point_counts, frame_count, warmup, engines, seed, workers=None, pyramid_factor=8):
+    """
+    모든 조건 조합에 대해 벤치마크 실행
+
+    Returns:
+        dict: 실행 환경 정보와 조건별 결과 목록
+    """
+    rng = np.random.default_rng(seed)
+    results = []
+
+    for width, height in sizes:
+        for density in densities:
+            # 캡처 비용을 제외하기 위해 측정 전에 프레임을 미리 생성
+            source = SyntheticFrameSource(width, height, TARGET_RGB, density=density, seed=seed)
+            frames = [source.grab((0, 0, width, height))[0] for _ in range(frame_count + warmup)]
+
+            for count in point_counts:
+                points = make_points(count, width, height, rng)
+                runs = [("ColorDetector", engine) for engine in engines]
+                runs.append(("ColorMonitorThread", "vectorized"))
+
+                for target, engine in runs:
+                    if target == "ColorDetector":
+                        samples = bench_detector(frames, points, engine, warmup, workers, pyramid_factor)
+                    else:
+                        samples = bench_monitor_thread(frames, points, warmup)
+
+                    result = {
+                        "target": target,
+                        "engine": engine,
+                        "width": width,
+                        "height": height,
+                        "density": density,
+                        "points": count,
+                        "frames": len(samples),
+                    }
+                    result.update(latency_stats(samples))
+                    results.append(result)
+                    print(f"{target:18s} {engine:10s} {width}x{height} density={density:<6} "
+                          f"points={count:<5} p50={result['latency_ms']['p50']:.2f}ms fps={result['fps']:.1f}",
+                          file=sys.stderr)
+
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "threshold": THRESHOLD,
+        },
+        "results": results,
+    }
+
+
+def main(argv=None):
+    """벤치마크 시작점"""
+    parser = argparse.ArgumentParser(description="색상 감지 처리량 벤치마크")
+    parser.add_argument("--sizes", nargs="+", default=DEFAULT_SIZES, help="측정할 영역 크기 (WxH)")
+    parser.add_argument("--densities", nargs="+", type=float, default=DEFAULT_DENSITIES, help="타겟 색상 픽셀 비율")
+    parser.add_argument("--points", nargs="+", type=int, default=DEFAULT_POINTS,
+                        help="last_match_points / highlighted_areas 개수")
+    parser.add_argument("--frames", type=int, default=20, help="조건별 측정 프레임 수")
+    parser.add_argument("--warmup", type=int, default=2, help="측정에서 제외할 워밍업 프레임 수")
+    parser.add_argument("--engine", choices=["vectorized", "python", "parallel", "pyramid", "both", "all"],
+                        default="vectorized",
+                        help="ColorDetector 전체 스캔 엔진 (both: vectorized+python, all: 모든 엔진)")
+    parser.add_argument("--workers", type=int, help="parallel 엔진의 쓰레드 풀 크기 (생략 시 CPU 수)")
+    parser.add_argument("--pyramid-factor", type=int, default=8, help="pyramid 엔진의 거친 검사 간격 (픽셀)")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (생략 시 표준 출력)")
+    args = parser.parse_args(argv)
+
+    engines = {
+        "both": ["vectorized", "python"],
+        "all": ["vectorized", "parallel", "pyramid", "python"],
+    }.get(args.engine, [args.engine])
+    report = run([parse_size(s) for s in args.sizes], args.densities, args.points,
+                 args.frames, args.warmup, engines, args.seed, args.workers, args.pyramid_factor)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,6 @@
 import sys
 import time
 import numpy as np
-from PIL import ImageGrab
 from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QColorDialog, QSlider, QSpinBox, QRadioButton, QButtonGroup
 from PyQt5.QtCore import Qt, QTimer, QRect, pyqtSignal, QObject, QPoint
 from PyQt5.QtGui import QColor, QPainter, QPen, QBrush, QCursor
@@ -9,14 +8,17 @@ import win32gui
 import win32con
 import win32api
 
+from src.models.frame_source import PILFrameSource
+
 class ColorDetector(QObject):
     """색상 감지 및 분석을 위한 클래스"""
     color_detected = pyqtSignal(list, QColor)  # 색상 감지 시 신호 발생 (위치 목록과 색상)
     
-    def __init__(self, target_color=QColor(255, 0, 0), threshold=10):
+    def __init__(self, target_color=QColor(255, 0, 0), threshold=10, frame_source=None):
         super().__init__()
         self.target_color = target_color
         self.threshold = threshold
+        self.frame_source = frame_source if frame_source is not None else PILFrameSource()
         self.monitoring_area = QRect(0, 0, 300, 300)
         self.is_monitoring = False
         self.timer = QTimer()
@@ -78,7 +80,7 @@ class ColorDetector(QObject):
             if self.last_match_points and self.last_target_color == self.target_color:
                 # 각 포인트의 현재 색상 확인
                 valid_points = []
-                screenshot = None  # 필요할 때만 스크린샷 캡처
+                img_array = None  # 필요할 때만 스크린샷 캡처
                 
                 for point in self.last_match_points:
                     # 이 포인트가 현재 모니터링 영역 내에 있는지 확인
@@ -86,9 +88,8 @@ class ColorDetector(QObject):
                         continue
                     
                     # 스크린샷이 아직 없으면 캡처
-                    if screenshot is None:
-                        screenshot = ImageGrab.grab(bbox=(x, y, x+w, y+h))
-                        img_array = np.array(screenshot)
+                    if img_array is None:
+                        img_array, _ = self.frame_source.grab(self.monitoring_area)
                     
                     # 화면 좌표에서 스크린샷 상대 좌표로 변환
                     px = point.x() - x
@@ -121,8 +122,7 @@ class ColorDetector(QObject):
                     return
             
             # 이전 포인트가 유효하지 않거나 처음 검사하는 경우 전체 검사 수행
-            screenshot = ImageGrab.grab(bbox=(x, y, x+w, y+h))
-            img_array = np.array(screenshot)
+            img_array, _ = self.frame_source.grab(self.monitoring_area)
             
             # 픽셀 검사
             match_points = self._check_colors_pixel_mode(img_array, target_r, target_g, target_b, x, y)
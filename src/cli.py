@@ -0,0 +1,226 @@
+"""
+화면 없이 녹화된 프레임에서 색상을 감지하는 명령행 도구 (Qt/win32 의존성 없음)
+
+사용 예:
+    python -m src.cli detect recordings/ --color "#FF0000" --threshold 10
+    python -m src.cli detect "shots/*.png" frames.npz --mode lab --workers 8 --output results.jsonl
+
+결과는 프레임마다 한 줄의 JSON으로 입력 순서대로 출력합니다.
+"""
+import argparse
+import json
+import multiprocessing
+import sys
+from functools import lru_cache, partial
+
+import numpy as np
+
+from src.models.blob_labeler import label_blobs, DEFAULT_MIN_AREA
+from src.models.frame_recorder import FrameRecording, RECORDING_EXTENSION
+from src.models.frame_source import collect_frame_paths, load_image_frame
+from src.models.grid_scanner import grid_sample_indices, sample_grid, find_first_matches
+from src.models.perceptual_matcher import get_mode_matcher, COLOR_MODES, MODE_RGB
+
+
+# NPZ 프레임 묶음을 작업 단위로 나누는 프레임 수
+DEFAULT_CHUNK_FRAMES = 16
+
+# 작업 프로세스마다 열어 두는 NPZ 프레임 묶음/녹화 파일 수
+NPZ_CACHE_SIZE = 2
+
+
+def parse_color(text):
+    """
+    '#RRGGBB', 'RRGGBB' 또는 'r,g,b' 문자열을 (r, g, b) 튜플로 변환
+
+    Raises:
+        argparse.ArgumentTypeError: 형식이 잘못된 경우
+    """
+    value = text.strip()
+    try:
+        if "," in value:
+            rgb = tuple(int(c) for c in value.split(","))
+        else:
+            value = value.lstrip("#")
+            if len(value) != 6:
+                raise ValueError(value)
+            rgb = tuple(int(value[i:i + 2], 16) for i in (0, 2, 4))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid color: {text!r} (expected #RRGGBB or r,g,b)")
+    if len(rgb) != 3 or not all(0 <= c <= 255 for c in rgb):
+        raise argparse.ArgumentTypeError(f"Invalid color: {text!r} (channels must be 0-255)")
+    return rgb
+
+
+def detect_frame(img_array, matcher, blobs=False, min_blob_area=DEFAULT_MIN_AREA):
+    """
+    한 프레임에서 ColorDetector 전체 스캔과 같은 규칙으로 일치 위치 검색 (격자당 최대 1개)
+
+    Args:
+        img_array: (H, W, 3) uint8 배열
+        matcher: match(array) -> bool 마스크를 제공하는 매처
+        blobs: True면 전체 해상도 일치 마스크의 연결 요소도 계산
+        min_blob_area: 이보다 픽셀 수가 적은 블롭은 제외
+
+    Returns:
+        dict: 프레임 크기, 일치 위치 목록 ((x, y), 프레임 좌표)과 선택적 블롭 목록
+    """
+    height, width = img_array.shape[:2]
+    ys, xs = grid_sample_indices(height, width)
+    mask = matcher.match(sample_grid(img_array, ys, xs))
+    points = [[int(x), int(y)] for x, y in find_first_matches(mask, ys, xs)]
+
+    result = {"width": width, "height": height, "count": len(points), "points": points}
+    if blobs:
+        result["blobs"] = [
+            {"rect": list(blob.rect()), "centroid": [round(blob.cx, 2), round(blob.cy, 2)], "area": blob.area}
+            for blob in label_blobs(matcher.match(img_array), min_blob_area)
+        ]
+    return result
+
+
+def build_tasks(inputs, chunk_frames=DEFAULT_CHUNK_FRAMES):
+    """
+    입력 경로 목록을 작업 목록으로 변환 (이미지 파일은 파일 단위, NPZ/녹화 파일은 chunk_frames 프레임 단위)
+
+    Returns:
+        list: ("image", 경로, 0, 1), ("npz", 경로, 시작, 끝) 또는 ("recording", 경로, 시작, 끝) 튜플 목록
+
+    Raises:
+        FileNotFoundError: 입력에서 프레임을 찾지 못한 경우
+    """
+    tasks = []
+    for path in inputs:
+        if path.lower().endswith((".npz", RECORDING_EXTENSION)):
+            if path.lower().endswith(".npz"):
+                kind = "npz"
+                with np.load(path) as data:
+                    count = len(data["frames"])
+            else:
+                kind = "recording"
+                with FrameRecording(path) as recording:
+                    count = len(recording)
+            tasks.extend((kind, path, start, min(start + chunk_frames, count))
+                         for start in range(0, count, chunk_frames))
+        else:
+            paths = collect_frame_paths(path)
+            if not paths:
+                raise FileNotFoundError(f"No frames found: {path}")
+            tasks.extend(("image", p, 0, 1) for p in paths)
+    return tasks
+
+
+@lru_cache(maxsize=NPZ_CACHE_SIZE)
+def _load_npz_frames(path):
+    """NPZ 프레임 묶음 로드 (작업 프로세스마다 캐시)"""
+    with np.load(path) as data:
+        return data["frames"]
+
+
+@lru_cache(maxsize=NPZ_CACHE_SIZE)
+def _open_recording(path):
+    """녹화 파일을 메모리 맵으로 열기 (작업 프로세스마다 캐시, 프레임은 필요할 때 청크 단위로 읽음)"""
+    return FrameRecording(path)
+
+
+def _load_frame(kind, path, index):
+    """작업 종류에 맞게 index 번째 프레임 로드"""
+    if kind == "image":
+        return load_image_frame(path)
+    if kind == "npz":
+        return _load_npz_frames(path)[index]
+    return _open_recording(path)[index]
+
+
+def run_task(task, color, threshold, mode=MODE_RGB, blobs=False, min_blob_area=DEFAULT_MIN_AREA):
+    """
+    작업 하나의 프레임을 모두 검사 (작업 프로세스에서 실행)
+
+    Returns:
+        list: 프레임별 결과 dict 목록 (입력 경로와 프레임 번호 포함)
+    """
+    kind, path, start, stop = task
+    # rgb 방식 임계값은 채널별 정수 차이
+    matcher = get_mode_matcher(mode, color, int(threshold) if mode == MODE_RGB else threshold)
+
+    results = []
+    for index in range(start, stop):
+        try:
+            frame = _load_frame(kind, path, index)
+            result = {"source": path, "frame": index}
+            result.update(detect_frame(frame[..., :3], matcher, blobs, min_blob_area))
+        except Exception as e:
+            result = {"source": path, "frame": index, "error": str(e)}
+        results.append(result)
+    return results
+
+
+def detect_command(args):
+    """detect 하위 명령 실행"""
+    try:
+        tasks = build_tasks(args.inputs, args.chunk_frames)
+    except (FileNotFoundError, KeyError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    worker = partial(run_task, color=args.color, threshold=args.threshold, mode=args.mode,
+                     blobs=args.blobs, min_blob_area=args.min_blob_area)
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    frames = errors = 0
+    try:
+        if args.workers > 1:
+            # 순서를 유지하는 imap으로 완료되는 대로 흘려보냄 (작업 프로세스가 프레임을 직접 로드)
+            with multiprocessing.Pool(args.workers) as pool:
+                for results in pool.imap(worker, tasks):
+                    frames, errors = _write_results(output, results, frames, errors)
+        else:
+            for task in tasks:
+                frames, errors = _write_results(output, worker(task), frames, errors)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    print(f"{frames} frames, {errors} errors", file=sys.stderr)
+    return 1 if errors else 0
+
+
+def _write_results(output, results, frames, errors):
+    """결과를 JSON 한 줄씩 기록하고 누적 프레임/오류 수 반환"""
+    for result in results:
+        output.write(json.dumps(result, separators=(",", ":")) + "\n")
+        frames += 1
+        errors += "error" in result
+    output.flush()
+    return frames, errors
+
+
+def build_parser():
+    """명령행 인자 파서 생성"""
+    parser = argparse.ArgumentParser(prog="python -m src.cli", description="녹화된 프레임 색상 감지 도구")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    detect = subparsers.add_parser("detect", help="이미지 파일/NPZ 프레임 묶음에서 색상 감지 (JSON Lines 출력)")
+    detect.add_argument("inputs", nargs="+",
+                        help="이미지 디렉터리, 글롭 패턴, 이미지 파일, (N, H, W, 3) 'frames' 배열을 담은 .npz 또는 .frec 녹화 파일")
+    detect.add_argument("--color", type=parse_color, default=(255, 0, 0), help="타겟 색상 (#RRGGBB 또는 r,g,b)")
+    detect.add_argument("--threshold", type=float, default=10,
+                        help="임계값 (rgb: 채널별 차이, lab: ΔE, hue: 색상각)")
+    detect.add_argument("--mode", choices=COLOR_MODES, default=MODE_RGB, help="색상 매칭 방식")
+    detect.add_argument("--blobs", action="store_true", help="연결 요소(블롭) 목록도 출력")
+    detect.add_argument("--min-blob-area", type=int, default=DEFAULT_MIN_AREA, help="블롭 최소 픽셀 수")
+    detect.add_argument("--workers", type=int, default=1, help="작업 프로세스 수 (1이면 현재 프로세스에서 실행)")
+    detect.add_argument("--chunk-frames", type=int, default=DEFAULT_CHUNK_FRAMES,
+                        help="NPZ/녹화 파일을 작업으로 나누는 프레임 수")
+    detect.add_argument("--output", help="결과 JSON Lines 파일 경로 (생략 시 표준 출력)")
+    detect.set_defaults(handler=detect_command)
+    return parser
+
+
+def main(argv=None):
+    """명령행 도구 시작점"""
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
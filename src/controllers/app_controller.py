@@ -2,15 +2,20 @@
 애플리케이션 컨트롤러 모듈
 """
 from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import QObject, Qt, QRect
+from PyQt5.QtCore import QObject, Qt, QRect, QTimer
 from PyQt5.QtGui import QCursor, QColor
 
 from src.models.color_detector import ColorDetector
+from src.models.instrumentation import get_instrumentation
 from src.views.control_panel import ControlPanel
 from src.views.monitoring_area import MonitoringArea
 from src.views.transparent_window import TransparentWindow
 
 
+# 상태 표시줄의 단계별 소요 시간 요약 갱신 간격 (ms)
+TIMING_REFRESH_MS = 500
+
+
 class AppController(QObject):
     """애플리케이션 컨트롤러"""
     
@@ -18,7 +23,7 @@ class AppController(QObject):
         super().__init__()
         
         # 컴포넌트 초기화
-        self.color_detector = ColorDetector()
+        self.color_detector = ColorDetector(threaded=True, adaptive=True)  # 작업 쓰레드에서 결과 변화에 맞춘 주기로 검사
         self.control_panel = ControlPanel()
         self.monitoring_area = MonitoringArea()
         self.overlay_window = TransparentWindow()
@@ -26,17 +31,28 @@ class AppController(QObject):
         # 컨트롤 패널 신호 연결
         self.control_panel.color_changed.connect(self.on_color_changed)
         self.control_panel.threshold_changed.connect(self.on_threshold_changed)
+        self.control_panel.color_mode_changed.connect(self.on_color_mode_changed)
+        self.control_panel.palette_changed.connect(self.on_palette_changed)
         self.control_panel.monitoring_toggled.connect(self.on_monitoring_toggled)
         self.control_panel.area_interaction_toggled.connect(self.on_area_interaction_toggled)
         self.control_panel.debug_mode_toggled.connect(self.on_debug_mode_toggled)
+        self.control_panel.blob_mode_toggled.connect(self.on_blob_mode_toggled)
+        self.control_panel.timing_stats_toggled.connect(self.on_timing_stats_toggled)
         self.control_panel.exit_requested.connect(self.on_exit_requested)
         
         # 모니터링 영역 신호 연결
         self.monitoring_area.area_changed.connect(self.on_area_changed)
         
         # 색상 감지기 신호 연결
-        self.color_detector.color_detected.connect(self.on_color_detected)
+        self.color_detector.detection_delta.connect(self.on_detection_delta)
         self.color_detector.debug_pixel_info.connect(self.on_debug_pixel_info)
+        self.color_detector.blobs_detected.connect(self.on_blobs_detected)
+        self.color_detector.palette_matched.connect(self.on_palette_matched)
+        
+        # 단계별 소요 시간 요약 갱신 타이머 (표시를 켰을 때만 동작)
+        self.instrumentation = get_instrumentation()
+        self.timing_timer = QTimer()
+        self.timing_timer.timeout.connect(self.on_timing_refresh)
         
         # 초기 모니터링 영역 설정
         initial_rect = self.monitoring_area.get_monitoring_rect()
@@ -58,6 +74,18 @@ class AppController(QObject):
         """임계값 변경 처리"""
         self.color_detector.set_threshold(value)
     
+    def on_color_mode_changed(self, mode):
+        """매칭 방식 변경 처리"""
+        self.color_detector.set_color_mode(mode)
+    
+    def on_palette_changed(self, entries):
+        """팔레트 변경 처리"""
+        self.color_detector.set_palette(entries)
+    
+    def on_palette_matched(self, points, indices):
+        """팔레트 일치 처리 (일치한 항목 번호 표시)"""
+        self.control_panel.update_palette_info(indices)
+    
     def on_monitoring_toggled(self, enabled):
         """모니터링 토글 처리"""
         if enabled:
@@ -77,14 +105,43 @@ class AppController(QObject):
         self.color_detector.set_debug_mode(enabled)
         self.overlay_window.set_debug_mode(enabled)
     
+    def on_blob_mode_toggled(self, enabled):
+        """블롭 모드 토글 처리 (이전 방식의 하이라이트를 지우고 다음 틱부터 새 방식으로 표시)"""
+        self.color_detector.set_blob_detection(enabled)
+        self.overlay_window.clear_highlight()
+    
     def on_area_changed(self, rect):
         """모니터링 영역 변경 처리"""
         self.color_detector.set_monitoring_area(rect)
         self.control_panel.update_selection_info(rect)
     
-    def on_color_detected(self, points, color):
-        """색상 감지 처리"""
-        self.overlay_window.highlight_area(points, color)
+    def on_timing_stats_toggled(self, enabled):
+        """단계별 소요 시간 측정 및 표시 토글"""
+        self.instrumentation.set_enabled(enabled)
+        if enabled:
+            self.timing_timer.start(TIMING_REFRESH_MS)
+        else:
+            self.timing_timer.stop()
+    
+    def on_timing_refresh(self):
+        """상태 표시줄의 단계별 소요 시간 요약 갱신"""
+        self.control_panel.update_timing_stats(self.instrumentation.summary_line())
+    
+    def dump_timing_stats(self, path=None):
+        """단계별 소요 시간 통계를 JSON으로 반환 (path를 지정하면 파일로도 저장)"""
+        return self.instrumentation.dump_json(path)
+    
+    def on_detection_delta(self, added, removed, color):
+        """색상 감지 결과 변화 처리 (결과가 바뀐 틱에만 호출됨)"""
+        # 신호 발생부터 GUI 쓰레드 수신까지의 지연 기록
+        self.instrumentation.record_since("signal", "detection_delta")
+        # 블롭 모드에서는 블롭 경계 상자로 표시하므로 포인트는 그리지 않음
+        if not self.color_detector.blob_detection:
+            self.overlay_window.apply_highlight_delta(added, removed, color)
+    
+    def on_blobs_detected(self, blobs, color):
+        """블롭 감지 처리"""
+        self.overlay_window.highlight_blob_areas(blobs, color)
     
     def on_debug_pixel_info(self, cursor_pos, pixel_color):
         """디버그 픽셀 정보 처리"""
@@ -92,6 +149,10 @@ class AppController(QObject):
     
     def on_exit_requested(self):
         """종료 요청 처리"""
+        # 감지 작업 쓰레드 정리
+        self.color_detector.stop_monitoring()
+        self.timing_timer.stop()
+        
         # 모든 창 닫기
         self.control_panel.close()
         self.monitoring_area.close()
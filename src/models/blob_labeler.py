@@ -0,0 +1,229 @@
+"""
+일치 마스크의 연결 요소(블롭) 추출 모듈 (Qt 의존성 없음)
+"""
+import numpy as np
+
+
+# 기본 최소 블롭 면적 (픽셀)
+DEFAULT_MIN_AREA = 4
+
+
+class Blob:
+    """연결된 일치 픽셀 묶음 (경계 상자, 무게 중심, 픽셀 수)"""
+
+    __slots__ = ("left", "top", "right", "bottom", "cx", "cy", "area")
+
+    def __init__(self, left, top, right, bottom, cx, cy, area):
+        """
+        Args:
+            left, top, right, bottom: 경계 상자 (양 끝 포함)
+            cx, cy: 무게 중심
+            area: 픽셀 수
+        """
+        self.left = left
+        self.top = top
+        self.right = right
+        self.bottom = bottom
+        self.cx = cx
+        self.cy = cy
+        self.area = area
+
+    @property
+    def width(self):
+        return self.right - self.left + 1
+
+    @property
+    def height(self):
+        return self.bottom - self.top + 1
+
+    def rect(self):
+        """(x, y, width, height) 튜플 반환"""
+        return self.left, self.top, self.width, self.height
+
+    def translated(self, dx, dy):
+        """좌표를 (dx, dy)만큼 옮긴 새 블롭 반환"""
+        return Blob(self.left + dx, self.top + dy, self.right + dx, self.bottom + dy,
+                    self.cx + dx, self.cy + dy, self.area)
+
+    def __eq__(self, other):
+        return isinstance(other, Blob) and all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self):
+        return (f"Blob(rect=({self.left}, {self.top}, {self.width}, {self.height}), "
+                f"centroid=({self.cx:.1f}, {self.cy:.1f}), area={self.area})")
+
+
+def label_blobs(mask, min_area=DEFAULT_MIN_AREA, connectivity=8):
+    """
+    bool 마스크에서 연결 요소를 찾아 블롭 목록 반환
+
+    행마다 연속된 True 구간(run)을 만들고, 위아래 행에서 겹치는 구간끼리 합집합-찾기로 묶습니다.
+    모든 단계가 구간 배열에 대한 NumPy 연산이므로 비용은 픽셀 수가 아니라 구간 수에 비례합니다.
+
+    Args:
+        mask: (H, W) bool 배열
+        min_area: 이보다 픽셀 수가 적은 블롭은 제외
+        connectivity: 4 (상하좌우) 또는 8 (대각선 포함)
+
+    Returns:
+        list: 픽셀 수가 큰 순서로 정렬된 Blob 목록 (마스크 좌표 기준)
+    """
+    if connectivity not in (4, 8):
+        raise ValueError(f"Connectivity must be 4 or 8, got {connectivity}")
+
+    rows, starts, ends = _find_runs(mask)
+    return _blobs_from_runs(rows, starts, ends, mask.shape[1], min_area, 1 if connectivity == 8 else 0)
+
+
+def _blobs_from_runs(rows, starts, ends, width, min_area, reach):
+    """
+    구간 목록을 연결 요소로 묶어 Blob 목록 생성
+
+    Args:
+        rows, starts, ends: 행과 시작 열 순서로 정렬되고 같은 행에서 겹치지 않는 구간 배열
+        width: 구간 좌표의 최대 너비 (ends의 상한)
+        min_area: 이보다 픽셀 수가 적은 블롭은 제외
+        reach: 8 연결이면 1, 4 연결이면 0
+
+    Returns:
+        list: 픽셀 수가 큰 순서로 정렬된 Blob 목록
+    """
+    if rows.size == 0:
+        return []
+
+    labels = _union_runs(rows, starts, ends, width, reach)
+
+    # 구간 통계를 블롭 단위로 집계
+    _, blob_ids = np.unique(labels, return_inverse=True)
+    blob_ids = blob_ids.ravel()
+    count = int(blob_ids.max()) + 1
+    lengths = (ends - starts).astype(np.int64)
+    area = np.bincount(blob_ids, weights=lengths, minlength=count)
+    sum_x = np.bincount(blob_ids, weights=(starts + ends - 1) * lengths / 2.0, minlength=count)
+    sum_y = np.bincount(blob_ids, weights=rows * lengths, minlength=count)
+
+    left = np.full(count, width, dtype=np.int64)
+    right = np.full(count, -1, dtype=np.int64)
+    top = np.full(count, int(rows.max()) + 1, dtype=np.int64)
+    bottom = np.full(count, -1, dtype=np.int64)
+    np.minimum.at(left, blob_ids, starts)
+    np.maximum.at(right, blob_ids, ends - 1)
+    np.minimum.at(top, blob_ids, rows)
+    np.maximum.at(bottom, blob_ids, rows)
+
+    keep = np.nonzero(area >= min_area)[0]
+    keep = keep[np.argsort(-area[keep], kind="stable")]
+    return [
+        Blob(int(left[i]), int(top[i]), int(right[i]), int(bottom[i]),
+             float(sum_x[i] / area[i]), float(sum_y[i] / area[i]), int(area[i]))
+        for i in keep
+    ]
+
+
+def _find_runs(mask):
+    """
+    행별 연속 True 구간 추출
+
+    Returns:
+        tuple: (rows, starts, ends) 배열 (ends는 미포함, 행과 시작 열 순서로 정렬)
+    """
+    height, width = mask.shape
+    padded = np.zeros((height, width + 2), dtype=np.int8)
+    padded[:, 1:-1] = mask
+    edges = np.diff(padded, axis=1)
+    rows, starts = np.nonzero(edges == 1)
+    _, ends = np.nonzero(edges == -1)
+    return rows.astype(np.int64), starts.astype(np.int64), ends.astype(np.int64)
+
+
+def _union_runs(rows, starts, ends, width, reach):
+    """
+    이웃 행에서 겹치는 구간을 묶어 구간별 대표 레이블 계산
+
+    Args:
+        rows, starts, ends: _find_runs() 결과
+        width: 마스크 너비
+        reach: 8 연결이면 1 (대각선 접촉 허용), 4 연결이면 0
+
+    Returns:
+        ndarray: 구간별 레이블 (같은 블롭이면 같은 값)
+    """
+    # 행과 열을 하나의 단조 증가 키로 합쳐 이전 행 구간을 이진 탐색
+    stride = width + 2
+    start_keys = rows * stride + starts
+    end_keys = rows * stride + ends
+
+    # 구간 j와 이전 행 구간 i가 겹치는 조건: end_i + reach > start_j 이고 start_i < end_j + reach
+    prev = (rows - 1) * stride
+    lo = np.searchsorted(end_keys, prev + starts - reach, side="right")
+    hi = np.searchsorted(start_keys, prev + ends + reach, side="left")
+    counts = np.maximum(hi - lo, 0)
+
+    labels = np.arange(rows.size)
+    if counts.sum() == 0:
+        return labels
+
+    # 겹치는 (i, j) 쌍 목록으로 펼침
+    b = np.repeat(np.arange(rows.size), counts)
+    a = np.repeat(lo, counts) + (np.arange(b.size) - np.repeat(np.cumsum(counts) - counts, counts))
+
+    # 루트끼리 작은 레이블로 연결하고 경로 압축을 반복 (변화가 없을 때까지)
+    while True:
+        root_a, root_b = labels[a], labels[b]
+        smaller = np.minimum(root_a, root_b)
+        hooked = labels.copy()
+        np.minimum.at(hooked, root_a, smaller)
+        np.minimum.at(hooked, root_b, smaller)
+        while True:
+            compressed = hooked[hooked]
+            if np.array_equal(compressed, hooked):
+                break
+            hooked = compressed
+        if np.array_equal(hooked, labels):
+            return labels
+        labels = hooked
+
+
+def merge_boxes(lefts, tops, widths, heights):
+    """
+    서로 겹치거나 맞닿은 사각형을 묶어 묶음별 경계 상자 목록 반환
+
+    사각형을 행별 구간으로 펼쳐 label_blobs와 같은 구간 합집합-찾기로 묶으므로
+    비용은 화면 크기가 아니라 사각형 수 x 높이에 비례합니다.
+
+    Args:
+        lefts, tops, widths, heights: 사각형 좌표와 크기 배열
+
+    Returns:
+        list: (x, y, width, height) 튜플 목록
+    """
+    lefts = np.asarray(lefts, dtype=np.int64)
+    tops = np.asarray(tops, dtype=np.int64)
+    rights = lefts + np.asarray(widths, dtype=np.int64)
+    bottoms = tops + np.asarray(heights, dtype=np.int64)
+    if lefts.size == 0:
+        return []
+
+    # 전체 경계 상자 기준 좌표로 옮겨 사각형을 행별 구간으로 펼침
+    origin_x, origin_y = int(lefts.min()), int(tops.min())
+    width = int(rights.max()) - origin_x
+    box_heights = bottoms - tops
+    rows = np.repeat(tops - origin_y, box_heights)
+    rows += np.arange(rows.size) - np.repeat(np.cumsum(box_heights) - box_heights, box_heights)
+    starts = np.repeat(lefts - origin_x, box_heights)
+    ends = np.repeat(rights - origin_x, box_heights)
+
+    # 같은 행에서 겹치거나 맞닿은 구간을 합침 (행/열 키로 정렬 후 누적 최대 끝점과 비교)
+    stride = width + 2
+    order = np.lexsort((starts, rows))
+    start_keys = rows[order] * stride + starts[order]
+    end_keys = np.maximum.accumulate(rows[order] * stride + ends[order])
+    is_new = np.ones(start_keys.size, dtype=bool)
+    is_new[1:] = start_keys[1:] > end_keys[:-1]
+    first = np.flatnonzero(is_new)
+    last = np.append(first[1:], start_keys.size) - 1
+    rows, starts = np.divmod(start_keys[first], stride)
+    ends = end_keys[last] - rows * stride
+
+    return [(blob.left + origin_x, blob.top + origin_y, blob.width, blob.height)
+            for blob in _blobs_from_runs(rows, starts, ends, width, 1, 0)]
@@ -0,0 +1,199 @@
+"""
+여러 감지기에 하나의 캡처 프레임을 나눠주는 캡처 브로커 모듈 (Qt 의존성 없음)
+"""
+import threading
+import time
+
+import numpy as np
+
+from src.models.frame_source import FrameSource, PILFrameSource, rect_to_tuple
+
+
+# 이 시간(초)보다 오래된 프레임은 재사용하지 않고 새로 캡처 (기본 검사 간격 100ms)
+DEFAULT_MAX_AGE = 0.1
+
+
+class SharedFrame:
+    """참조 카운트로 수명을 관리하는 공유 프레임"""
+
+    def __init__(self, buffer, rect, timestamp, sequence, image=None):
+        """
+        Args:
+            buffer: (h, w, 3) 프레임 버퍼 (재활용 단위)
+            rect: 캡처를 요청한 화면 영역 (x, y, w, h)
+            timestamp: 캡처 시각 (초)
+            sequence: 브로커 내 프레임 순번
+            image: 실제로 캡처된 버퍼 뷰 (화면 밖 영역은 잘려 rect보다 작을 수 있음, None이면 buffer 전체)
+        """
+        self.buffer = buffer
+        self.image = image if image is not None else buffer
+        self.rect = rect
+        self.timestamp = timestamp
+        self.sequence = sequence
+        self.refcount = 0
+
+    def contains(self, rect):
+        """영역이 프레임의 요청 영역 안에 완전히 들어가는지 확인 (잘려서 캡처됐어도 같은 요청이면 재사용)"""
+        x, y, w, h = rect
+        fx, fy, fw, fh = self.rect
+        return fx <= x and fy <= y and x + w <= fx + fw and y + h <= fy + fh
+
+    def view(self, rect):
+        """영역에 해당하는 복사 없는 뷰 (실제로 캡처된 범위로 잘림)"""
+        x, y, w, h = rect
+        left, top = x - self.rect[0], y - self.rect[1]
+        return self.image[top:top + h, left:left + w]
+
+
+class BrokerSubscription(FrameSource):
+    """브로커 프레임을 받는 구독자용 FrameSource"""
+
+    def __init__(self, broker):
+        self.broker = broker
+        self.rect = None
+        self.frame = None
+        self.last_sequence = -1
+
+    def grab(self, rect):
+        """
+        공유 프레임에서 영역 뷰를 가져옵니다.
+
+        반환된 배열은 복사본이 아니며 다음 grab() 또는 release() 호출 전까지만 유효합니다.
+        """
+        self.rect = rect_to_tuple(rect)
+        frame = self.broker._acquire(self)
+        self.release()
+        self.frame = frame
+        self.last_sequence = frame.sequence
+        return frame.view(self.rect), frame.timestamp
+
+    def grab_into(self, rect, out):
+        """공유 프레임 뷰를 그대로 반환 (out 버퍼는 사용하지 않음)"""
+        return self.grab(rect)
+
+    def release(self):
+        """보유 중인 프레임 반납"""
+        if self.frame is not None:
+            self.broker._release(self.frame)
+            self.frame = None
+
+    def close(self):
+        """구독 해제"""
+        self.broker.unsubscribe(self)
+
+
+class CaptureBroker:
+    """구독 영역의 합집합을 틱당 한 번 캡처해 각 구독자에게 뷰로 나눠주는 브로커"""
+
+    def __init__(self, frame_source=None, max_age=DEFAULT_MAX_AGE):
+        """
+        Args:
+            frame_source: 실제 캡처에 사용할 프레임 공급원 (None이면 PIL 화면 캡처)
+            max_age: 프레임 재사용 허용 시간 (초)
+        """
+        self.frame_source = frame_source if frame_source is not None else PILFrameSource()
+        self.max_age = max_age
+        self.subscriptions = []
+        self.current = None
+        self.free_buffers = []
+        self.sequence = 0
+        self.lock = threading.Lock()
+
+        # 통계
+        self.captures = 0
+        self.grabs = 0
+
+    def subscribe(self, rect=None):
+        """
+        구독자 등록
+
+        Args:
+            rect: 초기 구독 영역 (생략 시 첫 grab()에서 결정)
+
+        Returns:
+            BrokerSubscription: 감지기에 주입할 FrameSource
+        """
+        subscription = BrokerSubscription(self)
+        if rect is not None:
+            subscription.rect = rect_to_tuple(rect)
+        with self.lock:
+            self.subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        """구독 해제 (보유 중인 프레임도 반납)"""
+        subscription.release()
+        with self.lock:
+            if subscription in self.subscriptions:
+                self.subscriptions.remove(subscription)
+
+    def union_rect(self):
+        """모든 구독 영역을 감싸는 최소 사각형 (x, y, w, h)"""
+        rects = [s.rect for s in self.subscriptions if s.rect is not None]
+        if not rects:
+            return None
+        left = min(r[0] for r in rects)
+        top = min(r[1] for r in rects)
+        right = max(r[0] + r[2] for r in rects)
+        bottom = max(r[1] + r[3] for r in rects)
+        return left, top, right - left, bottom - top
+
+    def stats(self):
+        """캡처 통계 반환"""
+        return {
+            "captures": self.captures,
+            "grabs": self.grabs,
+            "captures_per_grab": self.captures / self.grabs if self.grabs else 0.0,
+            "subscribers": len(self.subscriptions),
+            "pooled_buffers": len(self.free_buffers),
+        }
+
+    def _acquire(self, subscription):
+        """구독자에게 줄 프레임을 골라 참조 카운트 증가 (필요하면 새로 캡처)"""
+        with self.lock:
+            self.grabs += 1
+            current = self.current
+
+            # 이미 본 프레임, 오래된 프레임, 영역을 담지 못하는 프레임이면 새 틱으로 보고 캡처
+            if (current is None
+                    or subscription.last_sequence == current.sequence
+                    or time.monotonic() - current.timestamp > self.max_age
+                    or not current.contains(subscription.rect)):
+                current = self._capture()
+
+            current.refcount += 1
+            return current
+
+    def _release(self, frame):
+        """참조 카운트 감소 (현재 프레임이 아니고 아무도 보지 않으면 버퍼 재활용)"""
+        with self.lock:
+            frame.refcount -= 1
+            if frame.refcount == 0 and frame is not self.current:
+                self.free_buffers.append(frame.buffer)
+
+    def _capture(self):
+        """합집합 영역을 캡처해 현재 프레임으로 교체 (lock 안에서 호출)"""
+        x, y, w, h = self.union_rect()
+        buffer = self._take_buffer(w, h)
+        view, timestamp = self.frame_source.grab_into((x, y, w, h), buffer)
+        self.captures += 1
+        self.sequence += 1
+
+        previous = self.current
+        # 재사용 판정은 요청한 합집합 영역으로 (잘린 크기로 판정하면 매번 다시 캡처함)
+        self.current = SharedFrame(buffer, (x, y, w, h), timestamp, self.sequence, view)
+
+        # 이전 프레임을 아무도 보고 있지 않으면 바로 재활용
+        if previous is not None and previous.refcount == 0:
+            self.free_buffers.append(previous.buffer)
+        return self.current
+
+    def _take_buffer(self, width, height):
+        """재활용 가능한 같은 크기 버퍼를 꺼내거나 새로 할당"""
+        shape = (height, width, 3)
+        for index, buffer in enumerate(self.free_buffers):
+            if buffer.shape == shape:
+                return self.free_buffers.pop(index)
+        # 크기가 맞지 않는 버퍼는 버리고 새로 할당
+        self.free_buffers = []
+        return np.empty(shape, dtype=np.uint8)
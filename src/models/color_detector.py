@@ -1,128 +1,461 @@
 """
 색상 감지 및 분석을 위한 모델 클래스
 """
+import threading
+
 import numpy as np
-from PIL import ImageGrab
-from PyQt5.QtCore import QObject, QTimer, QRect, pyqtSignal, QPoint
-from PyQt5.QtGui import QColor
+from PyQt5.QtCore import QObject, QThread, QTimer, QRect, pyqtSignal, QPoint
+from PyQt5.QtGui import QColor, QCursor
+
+from src.models.blob_labeler import label_blobs, DEFAULT_MIN_AREA
+from src.models.exclusion_mask import ExclusionMask
+from src.models.frame_buffer import FrameBufferPool, peak_rss_kb
+from src.models.frame_source import PILFrameSource
+from src.models.grid_scanner import grid_sample_indices, sample_grid, find_first_matches, sample_shift
+from src.models.incremental_scanner import IncrementalScanner
+from src.models.instrumentation import get_instrumentation
+from src.models.matcher_compiler import BackgroundMatcherCompiler
+from src.models.palette_matcher import get_palette_matcher
+from src.models.parallel_matcher import ParallelMatcher
+from src.models.perceptual_matcher import get_mode_matcher, COLOR_MODES, MODE_RGB
+from src.models.point_delta import DeltaTracker
+from src.models.pyramid_search import PyramidMatcher
+from src.models.scan_scheduler import ScanScheduler, DEFAULT_INTERVAL_MS, DEFAULT_MIN_INTERVAL_MS
+
+
+# 이전 틱에서 이 비율 이상의 포인트가 유효했으면 다음 틱은 포인트 경계 상자만 캡처
+MOSTLY_VALID_RATIO = 0.5
+
+# 작업 쓰레드 모드의 디버그 모드에서 GUI 쓰레드가 마우스 포인터 위치를 읽는 간격 (ms)
+DEBUG_CURSOR_POLL_MS = 50
+
 
-from src.utils.color_utils import is_color_in_range
+class _TickSettings:
+    """한 틱의 검사에 사용하는 설정 복사본 (상태 잠금 안에서 만들고 잠금 밖에서는 읽기만 함)"""
+    
+    __slots__ = ("generation", "area", "target_color", "threshold", "color_mode", "palette", "frame_source",
+                 "recorder", "blob_detection", "min_blob_area", "debug_mode", "cursor_pos")
+    
+    def __init__(self, detector, cursor_pos=None):
+        # 설정 메소드는 값을 제자리에서 바꾸지 않고 새 객체로 교체하므로 참조만 복사
+        self.generation = detector.settings_generation
+        self.area = detector.monitoring_area
+        self.target_color = detector.target_color
+        self.threshold = detector.threshold
+        self.color_mode = detector.color_mode
+        self.palette = detector.palette
+        self.frame_source = detector.frame_source
+        self.recorder = detector.recorder
+        self.blob_detection = detector.blob_detection
+        self.min_blob_area = detector.min_blob_area
+        self.debug_mode = detector.debug_mode
+        self.cursor_pos = cursor_pos
+
+
+class _DetectionThread(QThread):
+    """ColorDetector의 캡처와 검사를 GUI 쓰레드 밖에서 반복 실행하는 쓰레드"""
+    
+    def __init__(self, detector):
+        super().__init__()
+        self.detector = detector
+    
+    def run(self):
+        """쓰레드 실행 메소드"""
+        while not self.isInterruptionRequested():
+            # 결과는 color_detected 신호로 발생하며 GUI 쓰레드의 슬롯에는 큐 연결로 전달됨
+            self.detector.check_colors()
+            # 틱 시작 시각 기준 마감까지 남은 시간만 대기
+            self.msleep(self.detector.scheduler.delay_ms())
 
 
 class ColorDetector(QObject):
     """색상 감지 및 분석을 위한 클래스"""
     color_detected = pyqtSignal(list, QColor)  # 색상 감지 시 신호 발생 (위치 목록과 색상)
     debug_pixel_info = pyqtSignal(QPoint, QColor)  # 디버깅 모드에서 픽셀 정보 신호
+    blobs_detected = pyqtSignal(list, QColor)  # 블롭 모드에서 감지된 Blob 목록과 색상 (화면 절대 좌표)
+    palette_matched = pyqtSignal(list, list)  # 팔레트 모드에서 감지된 위치 목록과 위치별 팔레트 항목 번호
+    detection_delta = pyqtSignal(list, list, QColor)  # 직전 결과와 달라졌을 때만 추가/제거된 위치 목록과 색상
+    _result_ready = pyqtSignal(object, object, int)  # 검사 결과 신호, 인자, 실행 번호 (GUI 쓰레드에서 실행 번호 확인 후 발생)
     
-    def __init__(self, target_color=QColor(255, 0, 0), threshold=10):
+    def __init__(self, target_color=QColor(255, 0, 0), threshold=10, vectorized=True, frame_source=None,
+                 threaded=False, incremental=False, adaptive=False, min_interval_ms=DEFAULT_MIN_INTERVAL_MS,
+                 parallel=False, workers=None, pyramid_factor=None, blobs=False, min_blob_area=DEFAULT_MIN_AREA,
+                 color_mode=MODE_RGB):
+        """
+        Args:
+            target_color: 탐지할 타겟 색상
+            threshold: 색상 임계값
+            vectorized: True면 NumPy 벡터화 엔진, False면 기존 파이썬 루프로 전체 스캔
+            frame_source: 프레임 공급원 (None이면 PIL 화면 캡처)
+            threaded: True면 캡처와 검사를 작업 쓰레드에서 실행 (GUI 쓰레드 차단 없음)
+            incremental: True면 이전 프레임에서 바뀐 타일만 다시 매칭 (벡터화 엔진 전용)
+            adaptive: True면 결과 변화에 따라 검사 간격을 조절 (False면 100ms 고정)
+            min_interval_ms: 적응형 모드에서 결과가 바뀌었을 때의 검사 간격 하한
+            parallel: True면 큰 프레임을 가로 띠로 나눠 쓰레드 풀에서 동시에 매칭 (벡터화 엔진 전용)
+            workers: 병렬 매칭 쓰레드 풀 크기 (None이면 CPU 수, 최대 8)
+            pyramid_factor: 지정하면 k 픽셀 간격으로 먼저 검사하고 일치 주변만 정밀 검사
+                (k x k 이상 블롭은 놓치지 않음, 벡터화 엔진 전용)
+            blobs: True면 틱마다 일치 픽셀의 연결 요소를 blobs_detected 신호로 발생
+            min_blob_area: 이보다 픽셀 수가 적은 블롭은 제외
+            color_mode: 색상 매칭 방식 ("rgb": 채널별 차이, "lab": CIELAB ΔE, "hue": HSV 색상각)
+        """
         super().__init__()
         self.target_color = target_color
         self.threshold = threshold
+        self.color_mode = color_mode
+        self.palette = []  # (QColor, 임계값) 목록 (비어 있으면 단일 타겟 색상 사용)
+        self.vectorized = vectorized
+        self.frame_source = frame_source if frame_source is not None else PILFrameSource()
+        self.frame_pool = FrameBufferPool()
+        self.bbox_pool = FrameBufferPool()  # 경계 상자 캡처용 (전체 영역 버퍼와 크기가 달라 분리)
+        self.capture_count = 0
+        self.bbox_capture_count = 0
+        self.double_capture_count = 0  # 경계 상자 재검사가 모두 무효라 전체 영역을 다시 캡처한 틱 수
         self.monitoring_area = QRect(0, 0, 300, 300)
         self.is_monitoring = False
         self.debug_mode = False
+        self.interval = DEFAULT_INTERVAL_MS
+        self.scheduler = ScanScheduler(self.interval, min(min_interval_ms, self.interval), adaptive=adaptive)
         self.timer = QTimer()
+        self.timer.setSingleShot(True)  # 틱마다 스케줄러가 계산한 대기 시간으로 다시 시작
         self.timer.timeout.connect(self.check_colors)
         
-        # 이전에 찾은 색상 위치 저장
+        # 작업 쓰레드 모드 (설정 변경과 검사가 겹치지 않도록 상태 잠금 사용)
+        self.threaded = threaded
+        self.worker_thread = None
+        self._state_lock = threading.Lock()
+        
+        # 설정 세대 (결과에 영향을 주는 설정이 바뀔 때마다 증가, 검사 중 바뀌었으면 그 틱의 결과는 버림)
+        self.settings_generation = 0
+        self.discarded_ticks = 0
+        # 설정 메소드가 요청하고 다음 틱 시작 시 작업 쓰레드가 적용하는 초기화
+        self._pending_reset = False
+        self._pending_delta_reset = False
+        
+        # 모니터링 실행 번호 (중지할 때마다 증가, 중지 전에 큐에 쌓인 작업 쓰레드의 결과 신호는 버림)
+        self.run_id = 0
+        self._result_ready.connect(self._deliver_result)
+        
+        # lab/hue 방식과 팔레트 테이블은 상태 잠금 밖에서 컴파일 (준비될 때까지 검사 건너뜀)
+        self.matcher_compiler = BackgroundMatcherCompiler()
+        
+        # 이전에 찾은 색상 위치 저장 (QPoint 목록과 같은 순서의 (N, 2) int32 좌표 배열)
         self.last_match_points = []
         self.last_target_color = None
+        self.last_valid_ratio = 0.0  # 마지막 재검사에서 유효했던 포인트 비율
+        self.scan_area = self.monitoring_area  # 저장된 포인트와 증분 검사 캐시가 기준으로 하는 모니터링 영역
+        
+        # 마지막으로 알린 결과 (detection_delta 계산용)
+        self.delta_tracker = DeltaTracker()
+        
+        # 단계별 소요 시간 측정기 (비활성화 상태면 측정 비용 없음)
+        self.instrumentation = get_instrumentation()
+        
+        # 캡처한 프레임 녹화기 (FrameRecorder, None이면 녹화하지 않음)
+        self.recorder = None
+        
+        # 이전 포인트 주변 제외 영역 (전체 스캔마다 last_match_points로 다시 채움)
+        self.excluded_regions = ExclusionMask()
+        
+        # 증분 검사 모드 (바뀐 타일만 다시 매칭)
+        self.incremental_scanner = IncrementalScanner() if incremental else None
+        
+        # 병렬 매칭 모드 (띠 단위 쓰레드 풀 매칭)
+        self.parallel_matcher = ParallelMatcher(workers) if parallel else None
+        
+        # 피라미드 검색 모드 (거친 검사 후 일치 주변만 정밀 검사)
+        self.pyramid_matcher = PyramidMatcher(pyramid_factor) if pyramid_factor else None
+        
+        # 블롭 모드 (연결 요소 단위로 감지 결과 제공)
+        self.blob_detection = blobs
+        self.min_blob_area = min_blob_area
+        
+        # 작업 쓰레드 모드의 디버그 모드용 마우스 포인터 위치 (QCursor는 GUI 쓰레드에서만 읽음)
+        self.debug_cursor_pos = None
+        self.cursor_timer = QTimer()
+        self.cursor_timer.setInterval(DEBUG_CURSOR_POLL_MS)
+        self.cursor_timer.timeout.connect(self._poll_cursor)
+    
+    @property
+    def last_match_points(self):
+        """이전에 찾은 색상 위치 (QPoint 목록)"""
+        return self._last_match_points
+    
+    @last_match_points.setter
+    def last_match_points(self, points):
+        # 빠른 경로에서 한 번에 조회할 수 있도록 좌표 배열을 함께 유지
+        self._last_match_points = points
+        self.last_match_coords = np.array([(point.x(), point.y()) for point in points], dtype=np.int32).reshape(-1, 2)
     
     def start_monitoring(self):
         """모니터링 시작"""
         self.is_monitoring = True
-        self.timer.start(100)  # 100ms 간격으로 체크
+        self.scheduler.reset()
+        if self.threaded:
+            if self.worker_thread is None:
+                self.worker_thread = _DetectionThread(self)
+            if not self.worker_thread.isRunning():
+                self.worker_thread.start()
+        else:
+            self.timer.start(self.scheduler.delay_ms())
     
     def stop_monitoring(self):
         """모니터링 중지"""
         self.is_monitoring = False
         self.timer.stop()
+        if self.worker_thread is not None:
+            # 진행 중인 검사가 끝날 때까지 대기
+            self.worker_thread.requestInterruption()
+            self.worker_thread.wait()
+        # 작업 쓰레드가 중지 직전에 보낸 결과가 수신 측의 하이라이트 제거 뒤에 도착하지 않도록 이전 실행 결과 무효화
+        self.run_id += 1
         # 모니터링 중지 시 저장된 포인트 초기화
-        self.last_match_points = []
+        with self._state_lock:
+            self.last_match_points = []
+            # 수신 측은 중지 시 하이라이트를 지우므로 다음 시작은 빈 상태에서 차이 계산
+            self.delta_tracker.reset()
+        if self.parallel_matcher is not None:
+            self.parallel_matcher.shutdown()
+        if self.recorder is not None:
+            self.recorder.flush()
     
     def set_target_color(self, color):
         """타겟 색상 설정"""
-        # 타겟 색상이 변경되면 저장된 포인트 초기화
-        if self.target_color != color:
-            self.last_match_points = []
-            self.last_target_color = None
-        self.target_color = color
+        with self._state_lock:
+            # 타겟 색상이 변경되면 저장된 포인트 초기화
+            if self.target_color != color:
+                self._invalidate_results()
+            self.target_color = color
     
     def set_threshold(self, value):
         """색상 감지 임계값 설정"""
-        # 임계값이 변경되면 저장된 포인트 초기화
-        if self.threshold != value:
-            self.last_match_points = []
-            self.last_target_color = None
-        self.threshold = value
+        with self._state_lock:
+            # 임계값이 변경되면 저장된 포인트 초기화
+            if self.threshold != value:
+                self._invalidate_results()
+            self.threshold = value
+    
+    def set_color_mode(self, mode):
+        """색상 매칭 방식 설정 (임계값은 방식에 따라 채널 차이, ΔE, 색상각으로 해석)"""
+        if mode not in COLOR_MODES:
+            raise ValueError(f"Unknown color mode: {mode!r}")
+        with self._state_lock:
+            # 매칭 방식이 변경되면 저장된 포인트 초기화
+            if self.color_mode != mode:
+                self._invalidate_results()
+            self.color_mode = mode
+    
+    def set_palette(self, entries):
+        """
+        팔레트 설정 (비어 있으면 단일 타겟 색상으로 복귀)
+        
+        팔레트가 있으면 모든 항목을 하나의 테이블로 컴파일해 한 번에 검사하고,
+        감지 위치마다 일치한 항목 번호를 palette_matched 신호로 발생합니다.
+        팔레트 항목은 매칭 방식과 관계없이 채널별 차이로 판정합니다.
+        
+        Args:
+            entries: (QColor, 임계값) 튜플 목록
+        """
+        entries = list(entries)
+        with self._state_lock:
+            if self.palette != entries:
+                self._invalidate_results()
+            self.palette = entries
+    
+    def _invalidate_results(self):
+        """
+        저장된 포인트 초기화를 요청하고 진행 중인 틱의 결과를 무효화 (상태 잠금 안에서 호출)
+        
+        포인트는 작업 쓰레드가 검사 중에 읽으므로 여기서 바로 지우지 않고 다음 틱 시작 시 지웁니다.
+        """
+        self._pending_reset = True
+        self.settings_generation += 1
     
     def set_monitoring_area(self, rect):
-        """모니터링 영역 설정"""
-        # 모니터링 영역이 변경되면 저장된 포인트 초기화
-        if self.monitoring_area != rect:
+        """모니터링 영역 설정 (저장된 포인트와 캐시는 다음 틱 시작 시 새 영역에 맞춤)"""
+        with self._state_lock:
+            self.monitoring_area = rect
+    
+    def _sync_scan_area(self):
+        """저장된 포인트와 캐시를 현재 모니터링 영역에 맞춤 (상태 잠금 안에서 작업 쓰레드가 호출)"""
+        rect = self.monitoring_area
+        if self.scan_area == rect:
+            return
+        # 크기 변화 없이 옮겨졌으면 캐시를 이동하고, 크기가 바뀌면 저장된 포인트 초기화
+        if self.scan_area.size() == rect.size():
+            self._translate_caches(rect)
+        else:
             self.last_match_points = []
             self.last_target_color = None
-        self.monitoring_area = rect
+        self.scan_area = rect
+
+    def _translate_caches(self, rect):
+        """
+        모니터링 영역 이동에 맞춰 감지 캐시를 옮김 (상태 잠금 안에서 호출)
+
+        포인트는 화면 좌표이므로 그대로 두고 새 영역 밖으로 나간 것만 버립니다.
+        증분 검사 캐시는 검사 위치가 같은 화면 픽셀에 놓이는 이동이면 겹치는 부분을 재사용합니다.
+        """
+        if self.last_match_points:
+            xs, ys = self.last_match_coords[:, 0], self.last_match_coords[:, 1]
+            inside = (xs >= rect.left()) & (xs <= rect.right()) & (ys >= rect.top()) & (ys <= rect.bottom())
+            self.last_match_points = [self.last_match_points[i] for i in np.flatnonzero(inside)]
+
+        if self.incremental_scanner is not None:
+            ys, xs = grid_sample_indices(rect.height(), rect.width())
+            dx = sample_shift(xs, rect.x() - self.scan_area.x())
+            dy = sample_shift(ys, rect.y() - self.scan_area.y())
+            if dx is None or dy is None:
+                self.incremental_scanner.reset()
+            else:
+                self.incremental_scanner.translate(dx, dy, key=(rect.x(), rect.y()))
+    
+    def set_frame_source(self, frame_source):
+        """프레임 공급원 설정"""
+        with self._state_lock:
+            self.frame_source = frame_source
+    
+    def set_recorder(self, recorder):
+        """
+        캡처한 프레임 녹화기 설정 (None이면 녹화 중지, 녹화기 닫기는 호출 측 책임)
+        
+        Args:
+            recorder: write(frame, timestamp, rect)를 제공하는 FrameRecorder
+        """
+        with self._state_lock:
+            self.recorder = recorder
+    
+    def set_blob_detection(self, enabled, min_area=None):
+        """블롭 모드 설정 (모드가 바뀌면 수신 측이 하이라이트를 지우므로 포인트 차이를 처음부터 다시 계산)"""
+        with self._state_lock:
+            if self.blob_detection != enabled:
+                self._pending_delta_reset = True
+                self.settings_generation += 1
+                # 이전 모드에서 큐에 쌓인 결과가 지운 하이라이트를 다시 그리지 않도록 무효화
+                self.run_id += 1
+            self.blob_detection = enabled
+            if min_area is not None:
+                self.min_blob_area = min_area
     
     def set_debug_mode(self, enabled):
         """디버깅 모드 설정"""
-        self.debug_mode = enabled
+        with self._state_lock:
+            self.debug_mode = enabled
+        if self.threaded:
+            # 작업 쓰레드는 QCursor를 읽을 수 없으므로 GUI 쓰레드에서 주기적으로 위치를 읽어 둠
+            if enabled:
+                self._poll_cursor()
+                self.cursor_timer.start()
+            else:
+                self.cursor_timer.stop()
+    
+    def _poll_cursor(self):
+        """마우스 포인터 위치 저장 (GUI 쓰레드 타이머에서 호출)"""
+        self.debug_cursor_pos = QCursor.pos()
     
     def check_colors(self):
-        """화면에서 색상 체크"""
+        """화면에서 색상 체크 (타이머 또는 작업 쓰레드에서 호출)"""
         if not self.is_monitoring:
             return
-            
+        
+        self.scheduler.begin_tick()
+        with self.instrumentation.span("tick"):
+            previous_points = self.last_match_points
+            self._check_colors()
+            changed = self.last_match_points != previous_points
+        
+        # 감지 결과가 나타나거나 바뀌면 간격을 줄이고 그대로면 늘림
+        delay = self.scheduler.end_tick(changed)
+        if not self.threaded and self.is_monitoring:
+            self.timer.start(delay)
+    
+    def _snapshot_settings(self, cursor_pos=None):
+        """현재 설정 복사본 반환"""
+        with self._state_lock:
+            return _TickSettings(self, cursor_pos)
+    
+    def _begin_tick(self):
+        """
+        설정 메소드가 요청한 초기화를 적용하고 이번 틱의 설정 복사본 반환
+        
+        GUI 쓰레드의 설정 메소드가 검사를 기다리지 않도록 상태 잠금은 설정을 복사하는 동안만 잡습니다.
+        """
+        with self._state_lock:
+            if self._pending_reset:
+                self.last_match_points = []
+                self.last_target_color = None
+                self._pending_reset = False
+            if self._pending_delta_reset:
+                self.delta_tracker.reset()
+                self._pending_delta_reset = False
+            self._sync_scan_area()
+            cursor_pos = None
+            if self.debug_mode:
+                cursor_pos = self.debug_cursor_pos if self.threaded else QCursor.pos()
+            return _TickSettings(self, cursor_pos)
+    
+    def _check_colors(self):
+        """
+        현재 설정으로 한 번의 캡처와 검사 수행
+        
+        캡처와 검사는 상태 잠금 밖에서 설정 복사본으로 수행하고, 결과는 _commit_tick에서
+        설정이 그 사이 바뀌지 않았을 때만 저장하고 신호로 발생합니다.
+        """
+        if not self.is_monitoring:
+            return
+        
+        settings = self._begin_tick()
         try:
-            # 모니터링 영역 스크린샷 캡처
-            x, y, w, h = self.monitoring_area.x(), self.monitoring_area.y(), self.monitoring_area.width(), self.monitoring_area.height()
+            area = settings.area
+            x, y = area.x(), area.y()
             
             # 타겟 색상 RGB 값
-            target_r, target_g, target_b = self.target_color.red(), self.target_color.green(), self.target_color.blue()
+            target_r, target_g, target_b = (settings.target_color.red(), settings.target_color.green(),
+                                            settings.target_color.blue())
+            matcher = self._get_matcher(settings, target_r, target_g, target_b)
+            if matcher is None:
+                # 현재 설정의 lab/hue/팔레트 테이블을 컴파일하는 중이면 이번 틱은 건너뜀
+                # (다른 설정의 매처 결과를 현재 타겟 색상의 결과로 내보내지 않음)
+                return
+            revalidate = bool(self.last_match_points) and self.last_target_color == settings.target_color
+            
+            # 지난 틱에 포인트 대부분이 유효했으면 포인트 경계 상자만 캡처해서 재검사
+            # (모두 무효가 되면 아래에서 전체 영역을 다시 캡처)
+            if (revalidate and self.last_valid_ratio >= MOSTLY_VALID_RATIO
+                    and not settings.debug_mode and not settings.blob_detection):
+                bbox = self._match_bounding_box(area)
+                if bbox is not None:
+                    region = self._capture_frame(settings, bbox, self.bbox_pool)
+                    self.bbox_capture_count += 1
+                    valid = self._revalidate_points(region, bbox.x(), bbox.y(), matcher, area)
+                    if valid.any():
+                        self._commit_valid_points(settings, valid, region, bbox.x(), bbox.y())
+                        return
+                    # 모든 포인트가 무효로 확인됐으므로 전체 프레임에서 다시 재검사하지 않고 바로 전체 스캔
+                    revalidate = False
+                    self.double_capture_count += 1
+            
+            img_array = self._capture_frame(settings)
+            h, w = img_array.shape[:2]
+            
+            # 블롭 모드면 같은 프레임의 전체 해상도 일치 마스크에서 연결 요소 추출
+            blobs = None
+            if settings.blob_detection:
+                blobs = self._detect_blobs(img_array, matcher, settings.min_blob_area, x, y)
             
             # 이전에 찾은 위치가 있고 색상이 변경되지 않았으면 해당 위치만 먼저 확인
-            if self.last_match_points and self.last_target_color == self.target_color:
-                # 각 포인트의 현재 색상 확인
-                valid_points = []
-                screenshot = None  # 필요할 때만 스크린샷 캡처
-                
-                for point in self.last_match_points:
-                    # 이 포인트가 현재 모니터링 영역 내에 있는지 확인
-                    if not self.monitoring_area.contains(point):
-                        continue
-                    
-                    # 스크린샷이 아직 없으면 캡처
-                    if screenshot is None:
-                        screenshot = ImageGrab.grab(bbox=(x, y, x+w, y+h))
-                        img_array = np.array(screenshot)
-                    
-                    # 화면 좌표에서 스크린샷 상대 좌표로 변환
-                    px = point.x() - x
-                    py = point.y() - y
-                    
-                    # 스크린샷 범위 내에 있는지 확인
-                    if 0 <= px < w and 0 <= py < h:
-                        # 해당 픽셀의 색상 추출
-                        pixel_color = img_array[py, px]
-                        
-                        # 색상이 타겟 색상 범위 내에 있는지 확인
-                        if is_color_in_range(pixel_color, self.target_color, self.threshold):
-                            valid_points.append(point)
-                
+            if revalidate:
                 # 이전에 찾은 위치 중 일부가 여전히 유효하면 해당 위치만 신호 발생
-                if valid_points:
-                    self.color_detected.emit(valid_points, self.target_color)
-                    self.last_match_points = valid_points
+                with self.instrumentation.span("revalidate"):
+                    valid = self._revalidate_points(img_array, x, y, matcher, area)
+                if valid.any():
+                    self._commit_valid_points(settings, valid, img_array, x, y, blobs)
                     return
             
-            # 이전 위치가 없거나 더 이상 유효하지 않으면 전체 스캔
-            screenshot = ImageGrab.grab(bbox=(x, y, x+w, y+h))
-            img_array = np.array(screenshot)
-            
             # 디버그 모드인 경우 마우스 포인터 위치의 픽셀 색상 확인
-            if self.debug_mode:
-                cursor_pos = QCursor().pos()
-                if self.monitoring_area.contains(cursor_pos):
+            cursor_pos = settings.cursor_pos
+            if cursor_pos is not None:
+                if area.contains(cursor_pos):
                     # 화면 좌표에서 스크린샷 상대 좌표로 변환
                     px = cursor_pos.x() - x
                     py = cursor_pos.y() - y
@@ -140,25 +473,215 @@ class ColorDetector(QObject):
                         hex_color = f"#{pixel_color[0]:02X}{pixel_color[1]:02X}{pixel_color[2]:02X}"
                         print(f"Cursor at ({cursor_pos.x()}, {cursor_pos.y()}) - RGB: {pixel_color} - HEX: {hex_color}")
             
-            # 1x1 픽셀 모드로 전체 스캔 (다른 모드는 제거됨)
-            match_points = self._check_colors_pixel_mode(img_array, target_r, target_g, target_b, x, y)
+            # 이전 위치가 없거나 더 이상 유효하지 않으면 같은 프레임으로 1x1 픽셀 모드 전체 스캔
+            with self.instrumentation.span("scan"):
+                match_points = self._check_colors_pixel_mode(img_array, target_r, target_g, target_b, x, y, settings)
             
-            # 색상 감지 결과 신호 발생
-            if match_points:
-                self.color_detected.emit(match_points, self.target_color)
-                self.last_match_points = match_points
-                self.last_target_color = self.target_color
-            else:
-                # 감지된 색상이 없으면 목록 초기화
-                self.last_match_points = []
-                # 신호는 빈 목록으로 발생 (UI 업데이트용)
-                self.color_detected.emit([], self.target_color)
+            # 색상 감지 결과 저장 및 신호 발생 (감지된 색상이 없으면 빈 목록으로 UI 업데이트)
+            self._commit_tick(settings, match_points, img_array, x, y, blobs, new_points=True)
         
         except Exception as e:
             print(f"Error in color detection: {e}")
             self.last_match_points = []
     
-    def _check_colors_pixel_mode(self, img_array, target_r, target_g, target_b, base_x, base_y):
+    def _commit_tick(self, settings, points, img_array, origin_x, origin_y, blobs=None, new_points=False):
+        """
+        검사 결과를 저장하고 신호 발생 (검사하는 동안 설정이 바뀌었으면 결과를 버림)
+        
+        Args:
+            settings: 이번 틱의 설정 복사본
+            points: 감지된 위치의 QPoint 목록
+            img_array: (origin_x, origin_y)에서 시작하는 캡처 배열
+            origin_x, origin_y: 캡처 배열 좌상단의 화면 좌표
+            blobs: 블롭 모드에서 감지된 Blob 목록 (블롭 모드가 아니면 None)
+            new_points: True면 전체 스캔으로 새로 찾은 포인트 (False면 재검사로 남은 포인트)
+        """
+        with self._state_lock:
+            if settings.generation != self.settings_generation:
+                self.discarded_ticks += 1
+                return
+            if blobs is not None:
+                self._emit_result(self.blobs_detected, blobs, settings.target_color)
+            self._emit_detection(points, settings.target_color)
+            self.last_match_points = points
+            if not points:
+                return
+            if new_points:
+                self.last_target_color = settings.target_color
+                self.last_valid_ratio = 0.0  # 새 포인트는 다음 틱에 전체 프레임으로 한 번 재검사
+            self._emit_palette_matches(settings, img_array, origin_x, origin_y)
+    
+    def _revalidate_points(self, img_array, origin_x, origin_y, matcher, area):
+        """
+        이전 포인트 전체를 한 번의 인덱스 조회와 매처 판정으로 재검사
+        
+        Args:
+            img_array: (origin_x, origin_y)에서 시작하는 캡처 배열
+            origin_x, origin_y: 캡처 배열 좌상단의 화면 좌표
+            matcher: 현재 타겟 색상과 임계값의 매처
+            area: 이번 틱의 모니터링 영역
+        
+        Returns:
+            ndarray: last_match_points와 같은 순서의 bool 유효 여부 배열
+        """
+        xs, ys = self.last_match_coords[:, 0], self.last_match_coords[:, 1]
+        px, py = xs - origin_x, ys - origin_y
+        h, w = img_array.shape[:2]
+        
+        # 모니터링 영역과 캡처 범위 안에 있는 포인트만 조회
+        inside = ((xs >= area.left()) & (xs <= area.right()) & (ys >= area.top()) & (ys <= area.bottom())
+                  & (px >= 0) & (px < w) & (py >= 0) & (py < h))
+        
+        valid = np.zeros(len(xs), dtype=bool)
+        valid[inside] = matcher.match(img_array[py[inside], px[inside]])
+        self.last_valid_ratio = float(valid.mean()) if valid.size else 0.0
+        return valid
+    
+    def _commit_valid_points(self, settings, valid, img_array, origin_x, origin_y, blobs=None):
+        """유효한 이전 포인트만 결과로 저장하고 신호 발생"""
+        valid_points = [self.last_match_points[i] for i in np.flatnonzero(valid)]
+        self._commit_tick(settings, valid_points, img_array, origin_x, origin_y, blobs)
+    
+    def _emit_detection(self, points, color):
+        """전체 목록 신호를 발생하고 직전 결과와 달라졌으면 차이 신호도 발생"""
+        self._emit_result(self.color_detected, points, color)
+        added, removed = self.delta_tracker.update(points, color)
+        if added or removed:
+            # 수신 측에서 신호 전달 지연을 기록할 수 있도록 발생 시각 표시
+            self.instrumentation.mark("detection_delta")
+            self._emit_result(self.detection_delta, added, removed, color)
+    
+    def _emit_palette_matches(self, settings, img_array, origin_x, origin_y):
+        """팔레트 모드면 last_match_points 위치별로 일치한 팔레트 항목 번호를 신호로 발생"""
+        if not settings.palette:
+            return
+        px = self.last_match_coords[:, 0] - origin_x
+        py = self.last_match_coords[:, 1] - origin_y
+        matcher = self._get_palette_matcher(settings.palette)
+        if matcher is None:
+            return
+        indices = matcher.classify(img_array[py, px])
+        self._emit_result(self.palette_matched, self.last_match_points, indices.tolist())
+    
+    def _emit_result(self, signal, *args):
+        """
+        현재 실행 번호를 붙여 검사 결과 신호 발생
+        
+        작업 쓰레드에서 호출하면 GUI 쓰레드로 큐 전달되어 _deliver_result에서 발생하고,
+        GUI 쓰레드(타이머 모드)에서 호출하면 바로 발생합니다.
+        """
+        self._result_ready.emit(signal, args, self.run_id)
+    
+    def _deliver_result(self, signal, args, run_id):
+        """중지 전 실행에서 보낸 결과가 아니면 검사 결과 신호 발생"""
+        if run_id == self.run_id:
+            signal.emit(*args)
+    
+    def _match_bounding_box(self, area):
+        """이전 포인트를 모두 포함하는 경계 상자를 모니터링 영역으로 잘라 반환 (겹치지 않으면 None)"""
+        lo = self.last_match_coords.min(axis=0)
+        hi = self.last_match_coords.max(axis=0)
+        bbox = QRect(int(lo[0]), int(lo[1]), int(hi[0] - lo[0]) + 1, int(hi[1] - lo[1]) + 1)
+        bbox = bbox.intersected(area)
+        return None if bbox.isEmpty() else bbox
+    
+    def _detect_blobs(self, img_array, matcher, min_area, base_x, base_y):
+        """
+        일치 픽셀의 연결 요소를 화면 절대 좌표 Blob 목록으로 반환
+        
+        Returns:
+            list: 픽셀 수가 큰 순서로 정렬된 Blob 목록
+        """
+        mask = matcher.match(img_array)
+        return [blob.translated(base_x, base_y) for blob in label_blobs(mask, min_area)]
+    
+    def _get_matcher(self, settings, target_r, target_g, target_b):
+        """
+        설정 복사본의 매칭 방식과 임계값으로 컴파일된 매처 반환 (팔레트가 있으면 팔레트 매처, 캐시됨)
+        
+        채널별 차이 방식 외의 테이블은 백그라운드에서 컴파일하므로 준비될 때까지 None을 반환합니다.
+        """
+        if settings.palette:
+            entries = self._palette_entries(settings.palette)
+            return self.matcher_compiler.get(("palette", entries), lambda: get_palette_matcher(entries))
+        mode, target, threshold = settings.color_mode, (target_r, target_g, target_b), settings.threshold
+        return self.matcher_compiler.get((mode, target, threshold), lambda: get_mode_matcher(mode, target, threshold),
+                                         cheap=mode == MODE_RGB)
+    
+    def _palette_entries(self, palette):
+        """팔레트의 매처 캐시 키용 ((r, g, b), 임계값) 튜플"""
+        return tuple(((c.red(), c.green(), c.blue()), int(t)) for c, t in palette)
+    
+    def _get_palette_matcher(self, palette):
+        """팔레트로 컴파일된 팔레트 매처 반환 (컴파일하는 중이면 None)"""
+        return self.matcher_compiler.ready(("palette", self._palette_entries(palette)))
+    
+    def _capture_frame(self, settings, rect=None, pool=None):
+        """모니터링 영역 (또는 rect)을 재사용 프레임 버퍼로 캡처"""
+        rect = rect if rect is not None else settings.area
+        pool = pool if pool is not None else self.frame_pool
+        buffer = pool.acquire(rect.width(), rect.height())
+        with self.instrumentation.span("capture"):
+            img_array, timestamp = settings.frame_source.grab_into(rect, buffer)
+        self.capture_count += 1
+        if settings.recorder is not None:
+            # 경계 상자 캡처도 감지기가 실제로 본 프레임이므로 그 영역 그대로 녹화
+            settings.recorder.write(img_array, timestamp, rect)
+        return img_array
+    
+    def get_memory_stats(self):
+        """
+        프레임 버퍼 할당 통계 반환
+        
+        Returns:
+            dict: 캡처 횟수, 경계 상자 캡처 횟수, 한 틱에 두 번 캡처한 틱 수, 버퍼 할당 횟수,
+                제외 마스크 할당 횟수, 캡처당 할당 수, 최대 상주 메모리(KB)
+        """
+        stats = self.frame_pool.stats()
+        stats["captures"] = self.capture_count
+        stats["bbox_captures"] = self.bbox_capture_count
+        stats["double_capture_ticks"] = self.double_capture_count
+        stats["exclusion_mask_allocations"] = self.excluded_regions.allocations
+        stats["allocations_per_capture"] = stats["allocations"] / self.capture_count if self.capture_count else 0.0
+        stats["peak_rss_kb"] = peak_rss_kb()
+        return stats
+    
+    def get_scan_stats(self):
+        """
+        검사 주기 통계 반환
+        
+        Returns:
+            dict: 현재 간격(ms), 실효 주파수(Hz), 틱 수, 간격 초과 횟수, 마지막 작업 시간(ms)
+        """
+        return self.scheduler.stats()
+    
+    def get_parallel_stats(self):
+        """병렬 매칭 통계 반환 (병렬 모드가 아니면 None)"""
+        if self.parallel_matcher is None:
+            return None
+        return self.parallel_matcher.stats()
+    
+    def get_pyramid_stats(self):
+        """피라미드 검색 통계 반환 (피라미드 모드가 아니면 None)"""
+        if self.pyramid_matcher is None:
+            return None
+        return self.pyramid_matcher.stats()
+    
+    def get_delta_stats(self):
+        """차이 신호 통계 반환 (결과 수 대비 실제로 바뀐 결과 비율)"""
+        return self.delta_tracker.stats()
+    
+    def get_matcher_stats(self):
+        """백그라운드 매처 컴파일 통계 반환 (완료한 컴파일 수, 건너뛴 요청 수, 진행 여부)"""
+        return self.matcher_compiler.stats()
+    
+    def get_incremental_stats(self):
+        """증분 검사 타일 재검사 비율 통계 반환 (증분 모드가 아니면 None)"""
+        if self.incremental_scanner is None:
+            return None
+        return self.incremental_scanner.stats()
+    
+    def _check_colors_pixel_mode(self, img_array, target_r, target_g, target_b, base_x, base_y, settings=None):
         """
         1x1 픽셀 모드로 색상 검사 (영역을 4x4로 나누어 각 영역당 최대 1개 포인트만 수집)
         
@@ -166,10 +689,18 @@ class ColorDetector(QObject):
             img_array: 이미지 배열
             target_r, target_g, target_b: 타겟 RGB 값
             base_x, base_y: 기준 좌표 (모니터링 영역의 좌상단)
+            settings: 이번 틱의 설정 복사본 (None이면 현재 설정을 복사)
             
         Returns:
             list: 일치하는 픽셀 위치의 QPoint 목록
         """
+        if settings is None:
+            settings = self._snapshot_settings()
+        
+        # 기존 파이썬 루프는 단일 색상의 채널별 차이 방식만 지원
+        if self.vectorized or settings.color_mode != MODE_RGB or settings.palette:
+            return self._check_colors_vectorized(img_array, target_r, target_g, target_b, base_x, base_y, settings)
+        
         height, width = img_array.shape[:2]
         
         # 4x4 격자로 영역 나누기
@@ -177,15 +708,11 @@ class ColorDetector(QObject):
         grid_height = height // 4
         
         # 이미 하이라이트된 영역 추적 (이미 있는 포인트 주변 10x10 영역 제외)
-        excluded_regions = []
-        for point in self.last_match_points:
-            px = point.x() - base_x  # 상대 좌표로 변환
-            py = point.y() - base_y
-            # 10x10 네모칸 영역
-            excluded_regions.append((px-5, py-5, px+5, py+5))
+        excluded_regions = self._update_excluded_regions(base_x, base_y, width, height)
             
         # 각 격자별로 최대 1개의 포인트만 수집
         match_points = []
+        threshold = settings.threshold
         
         for grid_row in range(4):
             for grid_col in range(4):
@@ -203,13 +730,8 @@ class ColorDetector(QObject):
                 for y in range(start_y, end_y, 2):  # 2픽셀 건너뛰기 (성능 향상)
                     found_in_grid = False
                     for x in range(start_x, end_x, 2):  # 2픽셀 건너뛰기
-                        # 이미 하이라이트된 영역인지 확인
-                        skip = False
-                        for ex_x1, ex_y1, ex_x2, ex_y2 in excluded_regions:
-                            if ex_x1 <= x <= ex_x2 and ex_y1 <= y <= ex_y2:
-                                skip = True
-                                break
-                        if skip:
+                        # 이미 하이라이트된 영역인지 확인 (O(1) 조회)
+                        if excluded_regions.contains(base_x + x, base_y + y):
                             continue
                         
                         # RGB 값 확인
@@ -217,9 +739,9 @@ class ColorDetector(QObject):
                         r, g, b = pixel[0], pixel[1], pixel[2]
                         
                         # 각 채널별로 임계값 내에 있는지 확인 (오버플로우 방지)
-                        r_match = abs(int(r) - int(target_r)) <= self.threshold
-                        g_match = abs(int(g) - int(target_g)) <= self.threshold
-                        b_match = abs(int(b) - int(target_b)) <= self.threshold
+                        r_match = abs(int(r) - int(target_r)) <= threshold
+                        g_match = abs(int(g) - int(target_g)) <= threshold
+                        b_match = abs(int(b) - int(target_b)) <= threshold
                         
                         # 모든 채널이 일치하면 위치 추가
                         if r_match and g_match and b_match:
@@ -233,3 +755,51 @@ class ColorDetector(QObject):
                         break  # 다음 격자로 이동
         
         return match_points
+    
+    def _update_excluded_regions(self, base_x, base_y, width, height):
+        """last_match_points 주변 10x10 영역으로 제외 마스크를 다시 채움"""
+        self.excluded_regions.reset((base_x, base_y, width, height))
+        if self.last_match_points:
+            self.excluded_regions.add_points(self.last_match_coords[:, 0], self.last_match_coords[:, 1])
+        return self.excluded_regions
+    
+    def _check_colors_vectorized(self, img_array, target_r, target_g, target_b, base_x, base_y, settings):
+        """
+        _check_colors_pixel_mode와 같은 결과를 NumPy 연산으로 계산
+        
+        검사 위치의 일치 마스크를 한 번에 계산한 뒤 격자별 argmax로
+        각 격자의 첫 번째 일치 위치를 찾습니다.
+        
+        Args:
+            img_array: 이미지 배열
+            target_r, target_g, target_b: 타겟 RGB 값
+            base_x, base_y: 기준 좌표 (모니터링 영역의 좌상단)
+            settings: 이번 틱의 설정 복사본
+            
+        Returns:
+            list: 일치하는 픽셀 위치의 QPoint 목록
+        """
+        height, width = img_array.shape[:2]
+        ys, xs = grid_sample_indices(height, width)
+        
+        # (매칭 방식, 타겟 색상, 임계값)으로 컴파일된 매처로 검사 위치 전체를 한 번에 판정
+        matcher = self._get_matcher(settings, target_r, target_g, target_b)
+        sampled = sample_grid(img_array, ys, xs)
+        if self.incremental_scanner is not None:
+            # 바뀐 타일만 다시 매칭 (반환값은 캐시이므로 아래에서 제자리 수정하지 않음)
+            mask = self.incremental_scanner.match(sampled, matcher, key=(base_x, base_y))
+        elif self.pyramid_matcher is not None:
+            # 거친 간격으로 먼저 검사하고 일치한 주변만 원래 간격으로 정밀 검사
+            mask = self.pyramid_matcher.match(sampled, matcher)
+        elif self.parallel_matcher is not None:
+            # 큰 프레임은 가로 띠로 나눠 동시에 매칭 (작은 프레임은 내부에서 단일 쓰레드로 처리)
+            mask = self.parallel_matcher.match(sampled, matcher)
+        else:
+            mask = matcher.match(sampled)
+        
+        # 이미 하이라이트된 영역 제외 (이미 있는 포인트 주변 10x10 영역)
+        excluded_regions = self._update_excluded_regions(base_x, base_y, width, height)
+        if excluded_regions:
+            mask = mask & ~sample_grid(excluded_regions.region(base_x, base_y, width, height), ys, xs)
+        
+        return [QPoint(base_x + x, base_y + y) for x, y in find_first_matches(mask, ys, xs)]
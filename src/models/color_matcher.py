@@ -0,0 +1,96 @@
+"""
+채널별 룩업 테이블(LUT) 기반 색상 매처 모듈 (Qt 의존성 없음)
+"""
+from functools import lru_cache
+
+import numpy as np
+
+
+# 캐시에 유지할 컴파일된 매처 수
+MATCHER_CACHE_SIZE = 32
+
+
+class ColorMatcher:
+    """채널별 256 엔트리 bool LUT로 픽셀을 판정하는 매처"""
+
+    def __init__(self, min_rgb, max_rgb):
+        """
+        Args:
+            min_rgb: (r, g, b) 채널별 최소값 (포함)
+            max_rgb: (r, g, b) 채널별 최대값 (포함)
+        """
+        self.min_rgb = tuple(int(c) for c in min_rgb)
+        self.max_rgb = tuple(int(c) for c in max_rgb)
+
+        # 채널별 LUT 생성 (값이 범위 내에 있으면 True)
+        self.lut_r, self.lut_g, self.lut_b = (
+            _build_channel_lut(lo, hi) for lo, hi in zip(self.min_rgb, self.max_rgb)
+        )
+
+    @classmethod
+    def from_target(cls, target_rgb, threshold):
+        """타겟 색상과 임계값으로 매처 생성 (채널별 |c - t| <= threshold)"""
+        min_rgb = tuple(max(0, int(c) - threshold) for c in target_rgb)
+        max_rgb = tuple(min(255, int(c) + threshold) for c in target_rgb)
+        return cls(min_rgb, max_rgb)
+
+    def match(self, img_array):
+        """
+        이미지 배열 전체에 대해 일치 마스크 계산
+
+        Args:
+            img_array: (..., 3 이상) 형태의 uint8 배열
+
+        Returns:
+            ndarray: (...) 형태의 bool 마스크
+        """
+        return self.lut_r[img_array[..., 0]] & self.lut_g[img_array[..., 1]] & self.lut_b[img_array[..., 2]]
+
+    def match_pixel(self, pixel):
+        """단일 픽셀 (r, g, b) 일치 여부"""
+        return bool(self.lut_r[pixel[0]] and self.lut_g[pixel[1]] and self.lut_b[pixel[2]])
+
+    def __repr__(self):
+        return f"ColorMatcher(min_rgb={self.min_rgb}, max_rgb={self.max_rgb})"
+
+
+@lru_cache(maxsize=MATCHER_CACHE_SIZE)
+def get_range_matcher(min_rgb, max_rgb):
+    """
+    채널별 최소/최대 범위에 대한 매처를 반환합니다 (LRU 캐시).
+
+    Args:
+        min_rgb: (r, g, b) 튜플
+        max_rgb: (r, g, b) 튜플
+
+    Returns:
+        ColorMatcher: 컴파일된 매처
+    """
+    return ColorMatcher(min_rgb, max_rgb)
+
+
+def get_color_matcher(target_rgb, threshold):
+    """
+    (타겟 색상, 임계값) 쌍에 대한 매처를 반환합니다.
+
+    같은 범위로 귀결되는 쌍은 같은 캐시 항목을 공유합니다.
+
+    Args:
+        target_rgb: (r, g, b) 튜플
+        threshold: 색상 임계값
+
+    Returns:
+        ColorMatcher: 컴파일된 매처
+    """
+    min_rgb = tuple(max(0, int(c) - threshold) for c in target_rgb)
+    max_rgb = tuple(min(255, int(c) + threshold) for c in target_rgb)
+    return get_range_matcher(min_rgb, max_rgb)
+
+
+def _build_channel_lut(lo, hi):
+    """채널 하나에 대한 256 엔트리 bool LUT 생성"""
+    lut = np.zeros(256, dtype=bool)
+    lo, hi = max(0, lo), min(255, hi)
+    if lo <= hi:
+        lut[lo:hi + 1] = True
+    return lut
@@ -3,8 +3,15 @@
 """
 from PyQt5.QtCore import QThread, pyqtSignal, QPoint, QRect
 from PyQt5.QtGui import QColor
-import numpy as np
-from PIL import ImageGrab
+
+from src.models.frame_buffer import FrameBufferPool, peak_rss_kb
+from src.models.exclusion_mask import ExclusionMask
+from src.models.frame_source import PILFrameSource
+from src.models.grid_scanner import grid_sample_indices, sample_grid, find_first_matches
+from src.models.instrumentation import get_instrumentation
+from src.models.perceptual_matcher import get_mode_matcher, COLOR_MODES, MODE_RGB
+from src.models.point_delta import DeltaTracker
+from src.models.scan_scheduler import ScanScheduler, DEFAULT_INTERVAL_MS, DEFAULT_MIN_INTERVAL_MS
 
 
 class ColorMonitorThread(QThread):
@@ -12,81 +19,176 @@ class ColorMonitorThread(QThread):
     
     # 신호 정의
     color_detected = pyqtSignal(list, QColor, int)  # 감지된 포인트 목록, 색상, 색상 인덱스
+    detection_delta = pyqtSignal(list, list, QColor, int)  # 직전 결과와 달라졌을 때만 추가/제거된 포인트 목록, 색상, 색상 인덱스
     
-    def __init__(self, color_index, target_color=QColor(255, 0, 0), threshold=10):
+    def __init__(self, color_index, target_color=QColor(255, 0, 0), threshold=10, frame_source=None,
+                 adaptive=False, min_interval_ms=DEFAULT_MIN_INTERVAL_MS, color_mode=MODE_RGB):
         """
         Args:
             color_index: 색상 인덱스 (0, 1, 2 중 하나)
             target_color: 탐지할 타겟 색상
             threshold: 색상 임계값
+            frame_source: 프레임 공급원 (None이면 PIL 화면 캡처)
+            adaptive: True면 결과 변화에 따라 검사 간격을 조절 (False면 100ms 고정)
+            min_interval_ms: 적응형 모드에서 결과가 바뀌었을 때의 검사 간격 하한
+            color_mode: 색상 매칭 방식 ("rgb": 채널별 차이, "lab": CIELAB ΔE, "hue": HSV 색상각)
         """
         super().__init__()
         
         self.color_index = color_index
         self.target_color = target_color
         self.threshold = threshold
+        self.color_mode = color_mode
+        self.frame_source = frame_source if frame_source is not None else PILFrameSource()
+        self.frame_pool = FrameBufferPool()
+        self.capture_count = 0
         self.monitoring_area = QRect(0, 0, 300, 300)
+        self.scheduler = ScanScheduler(DEFAULT_INTERVAL_MS, min(min_interval_ms, DEFAULT_INTERVAL_MS), adaptive=adaptive)
         
         # 감지 관련 변수
         self.is_monitoring = False
         self.last_match_points = []
         
-        # 하이라이트된 영역 추적
-        self.highlighted_areas = []
+        # 하이라이트된 영역 추적 (모니터링 영역 크기의 점유 마스크, 쌓인 개수와 무관하게 O(1) 조회)
+        self.highlighted_areas = ExclusionMask(self.monitoring_area)
+        
+        # 마지막으로 알린 결과 (detection_delta 계산용)
+        self.delta_tracker = DeltaTracker()
+        
+        # 단계별 소요 시간 측정기 (비활성화 상태면 측정 비용 없음)
+        self.instrumentation = get_instrumentation()
+        
+        # 캡처한 프레임 녹화기 (FrameRecorder, None이면 녹화하지 않음)
+        self.recorder = None
+        
+        # 다른 감지 프로세스에 프레임을 나눠주는 공유 메모리 링 (SharedFrameRing, None이면 공유하지 않음)
+        self.frame_ring = None
+        self.ring_skipped = 0  # 링 슬롯보다 커서 공유하지 못한 프레임 수
     
     def set_target_color(self, color):
         """타겟 색상 설정"""
         if self.target_color != color:
             self.last_match_points = []
-            self.highlighted_areas = []
+            self.highlighted_areas.clear()
         self.target_color = color
     
     def set_threshold(self, value):
         """임계값 설정"""
         if self.threshold != value:
             self.last_match_points = []
-            self.highlighted_areas = []
+            self.highlighted_areas.clear()
         self.threshold = value
     
+    def set_color_mode(self, mode):
+        """색상 매칭 방식 설정"""
+        if mode not in COLOR_MODES:
+            raise ValueError(f"Unknown color mode: {mode!r}")
+        if self.color_mode != mode:
+            self.last_match_points = []
+            self.highlighted_areas.clear()
+        self.color_mode = mode
+    
     def set_monitoring_area(self, rect):
         """모니터링 영역 설정"""
         if self.monitoring_area != rect:
-            self.last_match_points = []
-            self.highlighted_areas = []
+            if self.monitoring_area.size() == rect.size():
+                # 크기 변화 없이 옮겨졌으면 새 영역과 겹치는 하이라이트 영역과 포인트는 유지 (화면 좌표)
+                self.last_match_points = [point for point in self.last_match_points if rect.contains(point)]
+                self.highlighted_areas.move_to(rect)
+            else:
+                self.last_match_points = []
+                self.highlighted_areas.reset(rect)
         self.monitoring_area = rect
     
+    def set_frame_source(self, frame_source):
+        """프레임 공급원 설정"""
+        self.frame_source = frame_source
+    
+    def set_recorder(self, recorder):
+        """캡처한 프레임 녹화기 설정 (None이면 녹화 중지, 녹화기 닫기는 호출 측 책임)"""
+        self.recorder = recorder
+    
+    def set_frame_ring(self, ring):
+        """
+        캡처한 프레임을 공유할 링 설정 (None이면 공유 중지, 링 닫기는 호출 측 책임)
+        
+        링에 기록하는 쪽은 하나여야 하므로 쓰레드마다 별도의 링을 사용합니다.
+        슬롯 크기는 SharedFrameRing.for_areas()로 가장 큰 모니터링 영역에 맞춥니다.
+        """
+        self.frame_ring = ring
+        self.ring_skipped = 0
+    
     def start_monitoring(self):
         """모니터링 시작"""
         self.is_monitoring = True
+        self.scheduler.reset()
         if not self.isRunning():
             self.start()
     
     def stop_monitoring(self):
         """모니터링 중지"""
         self.is_monitoring = False
+        # 마지막 틱 시각을 지워 중지 상태에서는 전체 간격만큼 대기 (마감이 지나 0ms 대기로 바쁜 반복하지 않도록)
+        self.scheduler.reset()
         self.last_match_points = []
-        self.highlighted_areas = []
+        self.highlighted_areas.clear()
+        self.delta_tracker.reset()
+        if self.recorder is not None:
+            self.recorder.flush()
+    
+    def _emit_detection(self, points):
+        """전체 목록 신호를 발생하고 직전 결과와 달라졌으면 차이 신호도 발생"""
+        self.color_detected.emit(points, self.target_color, self.color_index)
+        added, removed = self.delta_tracker.update(points, self.target_color)
+        if added or removed:
+            self.instrumentation.mark("detection_delta")
+            self.detection_delta.emit(added, removed, self.target_color, self.color_index)
     
     def add_highlighted_area(self, point):
         """하이라이트된 영역 추가 (10x10 픽셀 사각형)"""
-        x, y = point.x(), point.y()
-        self.highlighted_areas.append((x-5, y-5, x+5, y+5))
+        self.highlighted_areas.add_point(point.x(), point.y())
+    
+    def get_memory_stats(self):
+        """프레임 버퍼 할당 통계 반환"""
+        stats = self.frame_pool.stats()
+        stats["captures"] = self.capture_count
+        stats["allocations_per_capture"] = stats["allocations"] / self.capture_count if self.capture_count else 0.0
+        stats["peak_rss_kb"] = peak_rss_kb()
+        return stats
+    
+    def get_scan_stats(self):
+        """검사 주기 통계 반환 (현재 간격, 실효 주파수 등)"""
+        return self.scheduler.stats()
     
     def run(self):
         """쓰레드 실행 메소드"""
         while True:
             if self.is_monitoring:
+                self.scheduler.begin_tick()
+                previous_points = self.last_match_points
                 try:
                     # 모니터링 영역 캡처
                     x, y, w, h = self.monitoring_area.x(), self.monitoring_area.y(), self.monitoring_area.width(), self.monitoring_area.height()
-                    screenshot = ImageGrab.grab(bbox=(x, y, x+w, y+h))
-                    img_array = np.array(screenshot)
+                    buffer = self.frame_pool.acquire(w, h)
+                    with self.instrumentation.span("capture"):
+                        img_array, timestamp = self.frame_source.grab_into(self.monitoring_area, buffer)
+                    self.capture_count += 1
+                    recorder = self.recorder
+                    if recorder is not None:
+                        recorder.write(img_array, timestamp, (x, y, w, h))
+                    ring = self.frame_ring
+                    if ring is not None:
+                        if ring.fits(img_array.shape[1], img_array.shape[0]):
+                            ring.publish(img_array, timestamp, (x, y, w, h))
+                        else:
+                            self.ring_skipped += 1
                     
                     # 타겟 색상 추출
                     target_r, target_g, target_b = self.target_color.red(), self.target_color.green(), self.target_color.blue()
                     
                     # 색상 검사 수행
-                    match_points = self._check_colors_pixel_mode(img_array, target_r, target_g, target_b, x, y)
+                    with self.instrumentation.span("scan"):
+                        match_points = self._check_colors_pixel_mode(img_array, target_r, target_g, target_b, x, y)
                     
                     # 감지된 색상이 있으면 신호 발생
                     if match_points:
@@ -94,18 +196,25 @@ class ColorMonitorThread(QThread):
                         for point in match_points:
                             self.add_highlighted_area(point)
                         self.last_match_points = match_points
-                        self.color_detected.emit(match_points, self.target_color, self.color_index)
+                        self._emit_detection(match_points)
                     elif match_points != self.last_match_points:
                         # 감지된 위치가 변경되면 빈 목록으로 신호 발생
                         self.last_match_points = []
-                        self.color_detected.emit([], self.target_color, self.color_index)
+                        self._emit_detection([])
                 
                 except Exception as e:
                     print(f"Thread {self.color_index} error: {str(e)}")
                     self.last_match_points = []
-            
-            # 잠시 대기 (CPU 사용량 감소)
-            self.msleep(100)  # 100ms 대기
+                
+                # 감지 결과가 나타나거나 바뀌면 간격을 줄이고 그대로면 늘림
+                changed = self.last_match_points != previous_points
+                self.scheduler.end_tick(changed)
+                
+                # 틱 시작 시각 기준 마감까지 남은 시간만 대기 (CPU 사용량 감소)
+                self.msleep(self.scheduler.delay_ms())
+            else:
+                # 중지 상태에서는 기본 간격으로 대기 (중지 직전 시작된 틱의 시각이 남아도 바쁜 반복하지 않음)
+                self.msleep(DEFAULT_INTERVAL_MS)
     
     def _check_colors_pixel_mode(self, img_array, target_r, target_g, target_b, base_x, base_y):
         """
@@ -120,57 +229,15 @@ class ColorMonitorThread(QThread):
             list: 일치하는 픽셀 위치의 QPoint 목록
         """
         height, width = img_array.shape[:2]
+        ys, xs = grid_sample_indices(height, width)
         
-        # 4x4 격자로 영역 나누기
-        grid_width = width // 4
-        grid_height = height // 4
+        # (매칭 방식, 타겟 색상, 임계값)으로 컴파일된 매처로 검사 위치 전체를 한 번에 판정
+        matcher = get_mode_matcher(self.color_mode, (target_r, target_g, target_b), self.threshold)
+        mask = matcher.match(sample_grid(img_array, ys, xs))
         
-        # 각 격자별로 최대 1개의 포인트만 수집
-        match_points = []
-        
-        for grid_row in range(4):
-            for grid_col in range(4):
-                # 현재 격자 영역 계산
-                start_x = grid_col * grid_width
-                start_y = grid_row * grid_height
-                end_x = start_x + grid_width
-                end_y = start_y + grid_height
-                
-                # 격자 영역 범위 조정 (이미지 범위를 벗어나지 않도록)
-                end_x = min(end_x, width)
-                end_y = min(end_y, height)
-                
-                # 현재 격자에서 일치하는 포인트 찾기
-                for y in range(start_y, end_y, 2):  # 2픽셀 건너뛰기 (성능 향상)
-                    found_in_grid = False
-                    for x in range(start_x, end_x, 2):  # 2픽셀 건너뛰기
-                        # 이미 하이라이트된 영역인지 확인
-                        skip = False
-                        for ex_x1, ex_y1, ex_x2, ex_y2 in self.highlighted_areas:
-                            if ex_x1 <= x+base_x <= ex_x2 and ex_y1 <= y+base_y <= ex_y2:
-                                skip = True
-                                break
-                        if skip:
-                            continue
-                        
-                        # RGB 값 확인
-                        pixel = img_array[y, x]
-                        r, g, b = pixel[0], pixel[1], pixel[2]
-                        
-                        # 각 채널별로 임계값 내에 있는지 확인 (오버플로우 방지)
-                        r_match = abs(int(r) - int(target_r)) <= self.threshold
-                        g_match = abs(int(g) - int(target_g)) <= self.threshold
-                        b_match = abs(int(b) - int(target_b)) <= self.threshold
-                        
-                        # 모든 채널이 일치하면 위치 추가
-                        if r_match and g_match and b_match:
-                            # 이 격자에서 처음 발견한 포인트
-                            abs_point = QPoint(base_x + x, base_y + y)  # 절대 좌표로 변환
-                            match_points.append(abs_point)
-                            found_in_grid = True
-                            break  # 현재 격자에서 초기 발견 후 나가감
-                    
-                    if found_in_grid:
-                        break  # 다음 격자로 이동
+        # 이미 하이라이트된 영역 제외
+        if self.highlighted_areas:
+            mask &= ~sample_grid(self.highlighted_areas.region(base_x, base_y, width, height), ys, xs)
         
-        return match_points
+        # 각 격자별로 최대 1개의 포인트만 수집
+        return [QPoint(base_x + x, base_y + y) for x, y in find_first_matches(mask, ys, xs)]
@@ -0,0 +1,129 @@
+"""
+모니터링 영역 위의 제외 영역 점유 마스크 모듈 (Qt 의존성 없음)
+"""
+import numpy as np
+
+from src.models.frame_source import rect_to_tuple
+
+
+# 포인트 주변 제외 영역의 반경 (10x10 사각형, 양 끝 포함)
+DEFAULT_HALF_SIZE = 5
+
+
+class ExclusionMask:
+    """
+    하이라이트/제외 영역을 모니터링 영역 크기의 bool 마스크로 관리하는 공간 인덱스
+
+    사각형이 몇 개 쌓였는지와 관계없이 점 조회는 O(1)이고 메모리는 영역 크기로 고정됩니다.
+    모든 좌표는 화면 절대 좌표이며 영역 밖 부분은 잘려서 무시됩니다.
+    """
+
+    def __init__(self, rect=(0, 0, 0, 0), half_size=DEFAULT_HALF_SIZE):
+        """
+        Args:
+            rect: 마스크가 덮는 화면 영역 (QRect 또는 (x, y, w, h) 튜플)
+            half_size: add_point로 추가하는 사각형의 반경
+        """
+        self.half_size = half_size
+        self.allocations = 0  # 마스크 배열을 새로 할당한 횟수
+        self.mask = None
+        self.reset(rect)
+
+    def reset(self, rect):
+        """영역을 바꾸고 모든 제외 영역 삭제 (크기가 같으면 기존 마스크를 비워서 재사용)"""
+        self.x, self.y, width, height = rect_to_tuple(rect)
+        shape = (max(0, height), max(0, width))
+        if self.mask is not None and self.mask.shape == shape:
+            self.clear()
+            return
+        self.mask = np.zeros(shape, dtype=bool)
+        self.allocations += 1
+        self.box_count = 0
+
+    def move_to(self, rect):
+        """
+        영역을 옮기고 새 영역과 겹치는 부분의 제외 영역은 유지 (새로 드러난 부분은 비어 있음)
+
+        Args:
+            rect: 새 화면 영역 (QRect 또는 (x, y, w, h) 튜플)
+        """
+        x, y, width, height = rect_to_tuple(rect)
+        if (x, y) == (self.x, self.y) and (max(0, height), max(0, width)) == self.mask.shape:
+            return
+        self.mask = self.region(x, y, max(0, width), max(0, height))
+        self.x, self.y = x, y
+        if not self.mask.any():
+            self.box_count = 0
+
+    def clear(self):
+        """모든 제외 영역 삭제 (영역 유지)"""
+        self.mask[:] = False
+        self.box_count = 0
+
+    def __bool__(self):
+        return self.box_count > 0
+
+    def __len__(self):
+        return self.box_count
+
+    def add_box(self, x1, y1, x2, y2):
+        """(x1, y1) ~ (x2, y2) 사각형 추가 (양 끝 포함)"""
+        left, top = max(0, x1 - self.x), max(0, y1 - self.y)
+        right, bottom = max(0, x2 - self.x + 1), max(0, y2 - self.y + 1)
+        self.mask[top:bottom, left:right] = True
+        self.box_count += 1
+
+    def add_point(self, x, y):
+        """포인트 주변 사각형 추가"""
+        r = self.half_size
+        self.add_box(x - r, y - r, x + r, y + r)
+
+    def add_points(self, xs, ys):
+        """
+        여러 포인트 주변 사각형을 한 번에 추가
+
+        사각형 내부의 오프셋마다 한 번씩 벡터화 대입하므로 비용은 포인트 수에 선형입니다.
+
+        Args:
+            xs, ys: 화면 절대 좌표 배열
+        """
+        xs = np.asarray(xs, dtype=np.intp) - self.x
+        ys = np.asarray(ys, dtype=np.intp) - self.y
+        if xs.size == 0:
+            return
+
+        height, width = self.mask.shape
+        r = self.half_size
+        for dy in range(-r, r + 1):
+            rows = ys + dy
+            row_valid = (rows >= 0) & (rows < height)
+            for dx in range(-r, r + 1):
+                cols = xs + dx
+                valid = row_valid & (cols >= 0) & (cols < width)
+                self.mask[rows[valid], cols[valid]] = True
+        self.box_count += xs.size
+
+    def contains(self, x, y):
+        """점이 제외 영역에 속하는지 확인 (O(1))"""
+        px, py = x - self.x, y - self.y
+        if 0 <= py < self.mask.shape[0] and 0 <= px < self.mask.shape[1]:
+            return bool(self.mask[py, px])
+        return False
+
+    def region(self, x, y, width, height):
+        """
+        화면 영역에 해당하는 마스크 반환 (마스크 영역과 같으면 복사 없는 뷰)
+
+        Returns:
+            ndarray: (height, width) bool 배열
+        """
+        if (x, y) == (self.x, self.y) and height <= self.mask.shape[0] and width <= self.mask.shape[1]:
+            return self.mask[:height, :width]
+
+        out = np.zeros((height, width), dtype=bool)
+        left, top = max(x, self.x), max(y, self.y)
+        right = min(x + width, self.x + self.mask.shape[1])
+        bottom = min(y + height, self.y + self.mask.shape[0])
+        if left < right and top < bottom:
+            out[top - y:bottom - y, left - x:right - x] = self.mask[top - self.y:bottom - self.y, left - self.x:right - self.x]
+        return out
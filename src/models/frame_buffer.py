@@ -0,0 +1,112 @@
+"""
+프레임 버퍼 재사용 풀 모듈 (Qt 의존성 없음)
+"""
+import sys
+
+import numpy as np
+
+
+class FrameBufferPool:
+    """모니터링 영역 크기의 프레임 버퍼를 미리 할당해 재사용하는 풀"""
+
+    def __init__(self, slots=2, channels=3):
+        """
+        Args:
+            slots: 번갈아 사용할 버퍼 수 (acquire 결과는 slots번 후에 다시 덮어써짐)
+            channels: 픽셀당 채널 수
+        """
+        self.slots = max(1, slots)
+        self.channels = channels
+        self.buffers = [None] * self.slots
+        self.next_slot = 0
+
+        # 할당 통계
+        self.acquisitions = 0
+        self.allocations = 0
+        self.allocated_bytes = 0
+
+    def acquire(self, width, height):
+        """
+        (height, width, channels) 크기의 버퍼를 반환합니다.
+
+        같은 크기의 버퍼가 이미 있으면 새로 할당하지 않습니다.
+
+        Args:
+            width, height: 프레임 크기
+
+        Returns:
+            ndarray: uint8 버퍼 (내용은 이전 프레임일 수 있음)
+        """
+        shape = (max(0, height), max(0, width), self.channels)
+        slot = self.next_slot
+        self.next_slot = (slot + 1) % self.slots
+        self.acquisitions += 1
+
+        buffer = self.buffers[slot]
+        if buffer is None or buffer.shape != shape:
+            buffer = np.empty(shape, dtype=np.uint8)
+            self.buffers[slot] = buffer
+            self.allocations += 1
+            self.allocated_bytes += buffer.nbytes
+        return buffer
+
+    def clear(self):
+        """보관 중인 버퍼 해제"""
+        self.buffers = [None] * self.slots
+
+    def stats(self):
+        """할당 통계 반환"""
+        return {
+            "acquisitions": self.acquisitions,
+            "allocations": self.allocations,
+            "allocated_bytes": self.allocated_bytes,
+            "allocations_per_acquire": self.allocations / self.acquisitions if self.acquisitions else 0.0,
+            "resident_bytes": sum(b.nbytes for b in self.buffers if b is not None),
+        }
+
+
+def peak_rss_kb():
+    """
+    프로세스 최대 상주 메모리(Peak RSS)를 KB 단위로 반환합니다.
+
+    Returns:
+        int: 최대 상주 메모리 (KB), 확인할 수 없으면 None
+    """
+    if sys.platform == "win32":
+        return _peak_working_set_kb_win32()
+
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, 리눅스는 KB 단위
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _peak_working_set_kb_win32():
+    """윈도우 PeakWorkingSetSize 조회"""
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+    counters = PROCESS_MEMORY_COUNTERS()
+    counters.cb = ctypes.sizeof(counters)
+    process = ctypes.windll.kernel32.GetCurrentProcess()
+    if not ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+        return None
+    return counters.PeakWorkingSetSize // 1024
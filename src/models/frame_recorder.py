@@ -0,0 +1,321 @@
+"""
+감지기가 본 프레임을 청크 단위로 압축 저장하고 메모리 맵으로 재생하는 모듈 (Qt 의존성 없음)
+
+파일 형식 (.frec, 모든 정수는 리틀 엔디언):
+    파일 헤더: FILE_MAGIC (8바이트)
+    청크 반복:
+        청크 헤더: CHUNK_HEADER (매직, 코덱, 프레임 수, 페이로드 크기, 원본 크기)
+        프레임 표: FRAME_DTYPE x 프레임 수 (압축하지 않음, 타임스탬프/영역/페이로드 내 오프셋)
+        페이로드: 프레임 (h, w, 3) 바이트를 이어 붙인 데이터 (코덱에 따라 zlib 압축)
+
+청크마다 자체 헤더를 가지므로 기록 중 프로세스가 종료되어도 마지막 완성 청크까지는 재생할 수 있습니다.
+"""
+import mmap
+import struct
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from src.models.frame_source import FrameSource, rect_to_tuple
+
+
+# 녹화 파일 확장자
+RECORDING_EXTENSION = ".frec"
+
+FILE_MAGIC = b"FREC\x00\x00\x00\x01"
+CHUNK_MAGIC = b"CHNK"
+CHUNK_HEADER = struct.Struct("<4sB3xIQQ")
+
+# 페이로드 코덱
+CODEC_RAW = 0   # 압축 없음 (재생 시 메모리 맵에서 복사 없는 뷰)
+CODEC_ZLIB = 1  # zlib 압축 (재생 시 청크 단위로 압축 해제)
+
+FRAME_DTYPE = np.dtype([
+    ("timestamp", "<f8"),
+    ("x", "<i4"), ("y", "<i4"), ("width", "<i4"), ("height", "<i4"),
+    ("offset", "<u8"),
+])
+
+# 청크 하나에 모으는 기본 프레임 수
+DEFAULT_CHUNK_FRAMES = 32
+
+# 기본 zlib 압축 수준 (캡처 주기 안에 끝나도록 가장 빠른 수준)
+DEFAULT_COMPRESSION_LEVEL = 1
+
+
+class FrameRecorder:
+    """프레임을 모아 청크 단위로 압축해 파일에 덧붙이는 녹화기"""
+
+    def __init__(self, path, chunk_frames=DEFAULT_CHUNK_FRAMES, compress=True,
+                 level=DEFAULT_COMPRESSION_LEVEL):
+        """
+        Args:
+            path: 녹화 파일 경로 (있으면 덮어씀)
+            chunk_frames: 청크 하나에 모으는 프레임 수
+            compress: True면 zlib 압축, False면 원본 저장 (재생 시 복사 없는 뷰)
+            level: zlib 압축 수준 (1 ~ 9)
+        """
+        self.path = path
+        self.chunk_frames = max(1, int(chunk_frames))
+        self.codec = CODEC_ZLIB if compress else CODEC_RAW
+        self.level = level
+        self.file = open(path, "wb")
+        self.file.write(FILE_MAGIC)
+
+        self.pending = []
+        self.lock = threading.Lock()
+        # 압축과 쓰기는 단일 쓰레드에서 순서대로 처리해 캡처 경로를 막지 않음 (zlib은 GIL 해제)
+        self.writer = ThreadPoolExecutor(max_workers=1)
+        self.closed = False
+
+        # 통계
+        self.frames = 0
+        self.chunks = 0
+        self.raw_bytes = 0
+        self.written_bytes = len(FILE_MAGIC)
+
+    def write(self, frame, timestamp, rect):
+        """
+        프레임 하나 추가 (프레임은 즉시 복사되므로 호출 후 버퍼를 재사용해도 됨)
+
+        Args:
+            frame: (h, w, 3 이상) uint8 배열
+            timestamp: 캡처 시각 (초)
+            rect: 프레임이 덮는 화면 영역 (QRect 또는 (x, y, w, h) 튜플)
+        """
+        x, y, _, _ = rect_to_tuple(rect)
+        height, width = frame.shape[:2]
+        data = np.ascontiguousarray(frame[..., :3]).tobytes()
+        with self.lock:
+            if self.closed:
+                return
+            self.pending.append((float(timestamp), x, y, width, height, data))
+            self.frames += 1
+            self.raw_bytes += len(data)
+            if len(self.pending) >= self.chunk_frames:
+                self._submit_chunk()
+
+    def flush(self):
+        """모은 프레임을 청크로 기록하고 기록이 끝날 때까지 대기"""
+        with self.lock:
+            if self.pending:
+                self._submit_chunk()
+            future = self.writer.submit(self.file.flush) if not self.closed else None
+        if future is not None:
+            future.result()
+
+    def close(self):
+        """남은 프레임을 기록하고 파일 닫기"""
+        with self.lock:
+            if self.closed:
+                return
+            if self.pending:
+                self._submit_chunk()
+            self.closed = True
+        self.writer.shutdown(wait=True)
+        self.file.close()
+
+    def _submit_chunk(self):
+        """모은 프레임을 청크 작업으로 넘김 (잠금 안에서 호출)"""
+        frames, self.pending = self.pending, []
+        self.writer.submit(self._write_chunk, frames)
+
+    def _write_chunk(self, frames):
+        """청크 하나를 인코딩해 파일에 덧붙임 (기록 쓰레드에서 실행)"""
+        try:
+            table = np.zeros(len(frames), dtype=FRAME_DTYPE)
+            offset = 0
+            for row, (timestamp, x, y, width, height, data) in zip(table, frames):
+                row["timestamp"], row["x"], row["y"] = timestamp, x, y
+                row["width"], row["height"], row["offset"] = width, height, offset
+                offset += len(data)
+
+            raw = b"".join(frame[-1] for frame in frames)
+            payload = zlib.compress(raw, self.level) if self.codec == CODEC_ZLIB else raw
+            header = CHUNK_HEADER.pack(CHUNK_MAGIC, self.codec, len(frames), len(payload), len(raw))
+            self.file.write(header)
+            self.file.write(table.tobytes())
+            self.file.write(payload)
+            self.chunks += 1
+            self.written_bytes += len(header) + table.nbytes + len(payload)
+        except Exception as e:
+            print(f"Error writing recording chunk: {e}")
+
+    def stats(self):
+        """
+        녹화 통계 반환
+
+        Returns:
+            dict: 프레임 수, 청크 수, 원본/기록 바이트 수와 압축률
+        """
+        return {
+            "frames": self.frames,
+            "chunks": self.chunks,
+            "raw_bytes": self.raw_bytes,
+            "written_bytes": self.written_bytes,
+            "compression_ratio": self.raw_bytes / self.written_bytes if self.written_bytes else 0.0,
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+class FrameRecording:
+    """
+    녹화 파일을 메모리 맵으로 열어 프레임 단위로 읽는 재생기
+
+    파일 전체를 읽지 않고 청크 헤더와 프레임 표만 훑어 색인을 만듭니다.
+    압축하지 않은 녹화는 메모리 맵의 읽기 전용 뷰를 그대로 반환하고,
+    압축한 녹화는 요청한 프레임의 청크 하나만 풀어서 (마지막 청크는 캐시) 반환합니다.
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path: 녹화 파일 경로
+
+        Raises:
+            ValueError: 녹화 파일 형식이 아닌 경우
+        """
+        self.path = path
+        self.file = open(path, "rb")
+        try:
+            self.buffer = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # 빈 파일은 메모리 맵을 만들 수 없음
+            self.file.close()
+            raise ValueError(f"Not a frame recording: {path}")
+        if self.buffer[:len(FILE_MAGIC)] != FILE_MAGIC:
+            self.close()
+            raise ValueError(f"Not a frame recording: {path}")
+
+        self.chunks = []  # (코덱, 페이로드 시작, 페이로드 크기, 원본 크기) 목록
+        tables = []
+        chunk_ids = []
+        position = len(FILE_MAGIC)
+        size = len(self.buffer)
+        while position + CHUNK_HEADER.size <= size:
+            magic, codec, count, payload_size, raw_size = CHUNK_HEADER.unpack_from(self.buffer, position)
+            table_start = position + CHUNK_HEADER.size
+            payload_start = table_start + count * FRAME_DTYPE.itemsize
+            if magic != CHUNK_MAGIC or payload_start + payload_size > size:
+                # 기록 중 중단된 마지막 청크는 무시
+                break
+            tables.append(np.frombuffer(self.buffer, dtype=FRAME_DTYPE, count=count, offset=table_start))
+            chunk_ids.append(np.full(count, len(self.chunks), dtype=np.int64))
+            self.chunks.append((codec, payload_start, payload_size, raw_size))
+            position = payload_start + payload_size
+
+        # 프레임 번호 -> (청크 번호, 프레임 표 행) 색인
+        self.table = np.concatenate(tables) if tables else np.zeros(0, dtype=FRAME_DTYPE)
+        self.chunk_ids = np.concatenate(chunk_ids) if chunk_ids else np.zeros(0, dtype=np.int64)
+        self.cached_chunk = None
+        self.cached_data = None
+
+    def __len__(self):
+        return len(self.table)
+
+    @property
+    def timestamps(self):
+        """프레임별 타임스탬프 배열"""
+        return self.table["timestamp"]
+
+    def rect(self, index):
+        """index 번째 프레임이 덮는 화면 영역 (x, y, w, h) 튜플"""
+        row = self.table[index]
+        return int(row["x"]), int(row["y"]), int(row["width"]), int(row["height"])
+
+    def __getitem__(self, index):
+        """
+        index 번째 프레임 반환
+
+        Returns:
+            ndarray: (h, w, 3) uint8 읽기 전용 배열
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"Frame index out of range: {index}")
+
+        row = self.table[index]
+        height, width = int(row["height"]), int(row["width"])
+        data = self._chunk_data(int(self.chunk_ids[index]))
+        frame = np.frombuffer(data, dtype=np.uint8, count=height * width * 3, offset=int(row["offset"]))
+        return frame.reshape(height, width, 3)
+
+    def __iter__(self):
+        """(프레임, 타임스탬프, 영역) 튜플을 순서대로 생성"""
+        for index in range(len(self)):
+            yield self[index], float(self.table[index]["timestamp"]), self.rect(index)
+
+    def _chunk_data(self, chunk_id):
+        """청크의 원본 페이로드 (압축 청크는 풀어서 캐시, 원본 청크는 메모리 맵 뷰)"""
+        codec, start, payload_size, raw_size = self.chunks[chunk_id]
+        if codec == CODEC_RAW:
+            return memoryview(self.buffer)[start:start + payload_size]
+        if self.cached_chunk != chunk_id:
+            self.cached_data = zlib.decompress(self.buffer[start:start + payload_size], bufsize=raw_size)
+            self.cached_chunk = chunk_id
+        return self.cached_data
+
+    def close(self):
+        """메모리 맵과 파일 닫기 (이전에 반환한 원본 청크 뷰는 더 이상 사용할 수 없음)"""
+        self.table = self.table[:0].copy()
+        self.chunk_ids = self.chunk_ids[:0]
+        self.cached_data = None
+        try:
+            self.buffer.close()
+        except BufferError:
+            # 외부에 남은 뷰가 있으면 가비지 컬렉션 시 해제됨
+            pass
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+class RecordingFrameSource(FrameSource):
+    """녹화 파일의 프레임을 녹화된 순서대로 재생하는 공급원 (녹화 당시 영역 기준으로 잘라냄)"""
+
+    def __init__(self, path, loop=True):
+        """
+        Args:
+            path: 녹화 파일 경로
+            loop: 마지막 프레임 이후 처음부터 다시 재생할지 여부
+        """
+        self.recording = FrameRecording(path)
+        self.loop = loop
+        self.position = 0
+
+    def __len__(self):
+        return len(self.recording)
+
+    def grab(self, rect):
+        """다음 녹화 프레임에서 요청 영역 추출 (녹화 프레임의 화면 좌표 기준)"""
+        if self.position >= len(self.recording):
+            if not self.loop or not len(self.recording):
+                raise EOFError("Replay finished")
+            self.position = 0
+
+        index = self.position
+        self.position += 1
+        frame = self.recording[index]
+        origin_x, origin_y, _, _ = self.recording.rect(index)
+
+        x, y, w, h = rect_to_tuple(rect)
+        left, top = max(0, x - origin_x), max(0, y - origin_y)
+        return frame[top:top + h, left:left + w], float(self.recording.table[index]["timestamp"])
+
+    def close(self):
+        """녹화 파일 닫기"""
+        self.recording.close()
@@ -0,0 +1,258 @@
+"""
+화면 프레임 공급원(FrameSource) 모듈 (Qt 의존성 없음)
+
+감지기는 FrameSource.grab(rect)로 프레임을 받으므로 실제 화면 캡처 대신
+합성 장면이나 녹화 파일을 주입해 헤드리스 환경에서도 감지 경로를 실행할 수 있습니다.
+"""
+import glob
+import os
+import sys
+import time
+
+import numpy as np
+
+from src.models.instrumentation import get_instrumentation
+
+
+# 재생 가능한 이미지 파일 확장자
+IMAGE_EXTENSIONS = (".png", ".bmp", ".jpg", ".jpeg", ".tif", ".tiff")
+
+
+def rect_to_tuple(rect):
+    """QRect 또는 (x, y, w, h) 튜플을 (x, y, w, h) 정수 튜플로 변환"""
+    if hasattr(rect, "width") and callable(rect.width):
+        return rect.x(), rect.y(), rect.width(), rect.height()
+    x, y, w, h = rect
+    return int(x), int(y), int(w), int(h)
+
+
+def collect_frame_paths(path):
+    """
+    디렉터리/글롭/파일 경로에서 이미지 파일 목록 수집
+
+    Returns:
+        list: 이름 순으로 정렬된 이미지 파일 경로 목록
+    """
+    if os.path.isdir(path):
+        names = sorted(os.listdir(path))
+        return [os.path.join(path, n) for n in names if n.lower().endswith(IMAGE_EXTENSIONS)]
+    if os.path.isfile(path):
+        return [path]
+    return sorted(p for p in glob.glob(path) if p.lower().endswith(IMAGE_EXTENSIONS))
+
+
+def load_image_frame(path):
+    """이미지 파일을 (h, w, 3) uint8 RGB 배열로 로드"""
+    from PIL import Image
+    with Image.open(path) as image:
+        return np.array(image.convert("RGB"))
+
+
+class FrameSource:
+    """프레임 공급원 기본 클래스"""
+
+    def grab(self, rect):
+        """
+        지정한 영역의 프레임을 가져옵니다.
+
+        Args:
+            rect: 캡처할 영역 (QRect 또는 (x, y, w, h) 튜플)
+
+        Returns:
+            tuple: ((h, w, 3) uint8 RGB 배열, 타임스탬프(초))
+        """
+        raise NotImplementedError
+
+    def grab_into(self, rect, out):
+        """
+        지정한 영역의 프레임을 미리 할당된 버퍼에 복사합니다.
+
+        공유 프레임을 나눠주는 공급원은 out을 사용하지 않고 복사 없는 뷰를 반환할 수 있습니다.
+
+        Args:
+            rect: 캡처할 영역 (QRect 또는 (x, y, w, h) 튜플)
+            out: (h, w, 3) uint8 버퍼
+
+        Returns:
+            tuple: (실제 캡처된 크기의 out 뷰, 타임스탬프(초))
+        """
+        frame, timestamp = self.grab(rect)
+        view = out[:frame.shape[0], :frame.shape[1]]
+        with get_instrumentation().span("copy"):
+            np.copyto(view, frame[..., :3])
+        return view, timestamp
+
+    def close(self):
+        """공급원 자원 해제"""
+        pass
+
+
+class PILFrameSource(FrameSource):
+    """PIL ImageGrab을 이용한 실제 화면 캡처 공급원"""
+
+    def grab(self, rect):
+        """화면 캡처"""
+        # ImageGrab은 화면이 있는 환경에서만 동작하므로 사용 시점에 임포트
+        from PIL import ImageGrab
+
+        x, y, w, h = rect_to_tuple(rect)
+        instrumentation = get_instrumentation()
+        timestamp = time.monotonic()
+        with instrumentation.span("grab"):
+            screenshot = ImageGrab.grab(bbox=(x, y, x+w, y+h))
+        with instrumentation.span("convert"):
+            if screenshot.mode != "RGB":
+                screenshot = screenshot.convert("RGB")
+            frame = np.array(screenshot)
+        return frame, timestamp
+
+    def grab_into(self, rect, out):
+        """화면 캡처 결과를 버퍼에 복사 (윈도우에서는 중간 이미지 없이 한 번만 복사)"""
+        from PIL import Image
+
+        if sys.platform != "win32" or not hasattr(Image.core, "grabscreen_win32"):
+            return super().grab_into(rect, out)
+
+        x, y, w, h = rect_to_tuple(rect)
+        instrumentation = get_instrumentation()
+        timestamp = time.monotonic()
+
+        # ImageGrab.grab과 같은 원본 데이터 (아래에서 위로 저장된 BGR, 행은 4바이트 정렬)
+        with instrumentation.span("grab"):
+            offset, size, data = Image.core.grabscreen_win32(False, False)
+        stride = (size[0] * 3 + 3) & -4
+        raw = np.frombuffer(data, dtype=np.uint8, count=stride * size[1]).reshape(size[1], stride)
+        screen = raw[::-1, :size[0] * 3].reshape(size[1], size[0], 3)[:, :, ::-1]
+
+        # 복사 없이 영역을 잘라낸 뒤 버퍼로 한 번만 복사
+        # (ImageGrab의 crop처럼 화면 밖 부분은 0으로 채워 프레임 좌상단을 (x, y)에 맞춤)
+        left, top = x - offset[0], y - offset[1]
+        src_left, src_top = max(0, left), max(0, top)
+        region = screen[src_top:max(src_top, top + h), src_left:max(src_left, left + w)]
+        view = out[:h, :w]
+        dst_top, dst_left = src_top - top, src_left - left
+        with instrumentation.span("convert"):
+            if region.shape[:2] != (h, w):
+                view[:] = 0
+            view[dst_top:dst_top + region.shape[0], dst_left:dst_left + region.shape[1]] = region
+        return view, timestamp
+
+
+class SyntheticFrameSource(FrameSource):
+    """타겟 색상 블롭이 배치된 합성 장면을 생성하는 공급원"""
+
+    def __init__(self, width=1920, height=1080, target_rgb=(255, 0, 0), density=0.01,
+                 blob_size=4, motion=(3, 2), seed=0):
+        """
+        Args:
+            width, height: 합성 장면 크기 (영역이 장면을 벗어나면 반복됨)
+            target_rgb: 블롭 색상 (r, g, b)
+            density: 타겟 색상 픽셀 비율 (0.0 ~ 1.0)
+            blob_size: 정사각형 블롭 한 변의 길이 (픽셀)
+            motion: 프레임마다 장면이 이동하는 (dx, dy) 픽셀 수
+            seed: 난수 시드
+        """
+        self.width = width
+        self.height = height
+        self.target_rgb = tuple(int(c) for c in target_rgb)
+        self.density = density
+        self.blob_size = max(1, int(blob_size))
+        self.motion = motion
+        self.frame_index = 0
+        self.scene = self._build_scene(np.random.default_rng(seed))
+
+    def _build_scene(self, rng):
+        """배경 노이즈 위에 타겟 색상 블롭을 배치한 장면 생성"""
+        # 배경은 각 채널이 타겟과 64 이상 차이나도록 생성 (임계값 63 이하에서 오탐 없음)
+        target = np.array(self.target_rgb, dtype=np.uint8)
+        noise = rng.integers(0, 64, (self.height, self.width, 3), dtype=np.uint8)
+        scene = (target ^ 0x80) ^ noise
+
+        # 블롭 격자 위에서 밀도에 맞춰 블롭 위치 선택
+        size = self.blob_size
+        cells_y, cells_x = self.height // size, self.width // size
+        blob_count = min(int(round(self.density * cells_y * cells_x)), cells_y * cells_x)
+        if blob_count > 0:
+            cells = rng.choice(cells_y * cells_x, size=blob_count, replace=False)
+            top = (cells // cells_x) * size
+            left = (cells % cells_x) * size
+            for dy in range(size):
+                for dx in range(size):
+                    scene[top + dy, left + dx] = target
+
+        return scene
+
+    def grab(self, rect):
+        """현재 프레임에서 영역 추출 (장면 경계에서는 반복)"""
+        x, y, w, h = rect_to_tuple(rect)
+        offset_x = x + self.frame_index * self.motion[0]
+        offset_y = y + self.frame_index * self.motion[1]
+        self.frame_index += 1
+
+        rows = np.arange(offset_y, offset_y + h) % self.height
+        cols = np.arange(offset_x, offset_x + w) % self.width
+        return self.scene[rows[:, np.newaxis], cols], time.monotonic()
+
+
+class ReplayFrameSource(FrameSource):
+    """이미지 파일 또는 NPZ 프레임 묶음을 순서대로 재생하는 공급원"""
+
+    def __init__(self, path, loop=True, origin=None):
+        """
+        Args:
+            path: 이미지 디렉터리, 글롭 패턴, 이미지 파일 또는 .npz 파일 경로
+                  (.npz는 (N, H, W, 3) 'frames'와 선택적 'timestamps' 배열 포함)
+            loop: 마지막 프레임 이후 처음부터 다시 재생할지 여부
+            origin: 녹화된 프레임 좌상단의 화면 좌표 (x, y)
+                    (None이면 프레임을 요청 영역 자체로 보고 좌상단부터 추출)
+        """
+        self.loop = loop
+        self.origin = origin
+        self.position = 0
+        self.frames = None
+        self.timestamps = None
+        self.paths = []
+
+        if str(path).lower().endswith(".npz"):
+            with np.load(path) as data:
+                self.frames = data["frames"]
+                if "timestamps" in data:
+                    self.timestamps = data["timestamps"]
+        else:
+            self.paths = collect_frame_paths(path)
+            if not self.paths:
+                raise FileNotFoundError(f"No frames found: {path}")
+
+    def __len__(self):
+        return len(self.frames) if self.frames is not None else len(self.paths)
+
+    def _load_frame(self, index):
+        """index 번째 프레임과 타임스탬프 로드"""
+        if self.frames is not None:
+            frame = self.frames[index]
+        else:
+            frame = load_image_frame(self.paths[index])
+
+        if self.timestamps is not None:
+            timestamp = float(self.timestamps[index])
+        else:
+            timestamp = time.monotonic()
+        return frame, timestamp
+
+    def grab(self, rect):
+        """다음 프레임에서 영역 추출"""
+        if self.position >= len(self):
+            # 프레임이 없는 NPZ 묶음은 반복 재생해도 읽을 프레임이 없음
+            if not self.loop or not len(self):
+                raise EOFError("Replay finished")
+            self.position = 0
+
+        frame, timestamp = self._load_frame(self.position)
+        self.position += 1
+
+        x, y, w, h = rect_to_tuple(rect)
+        left, top = 0, 0
+        if self.origin is not None:
+            left = max(0, x - self.origin[0])
+            top = max(0, y - self.origin[1])
+        return frame[top:top + h, left:left + w, :3], timestamp
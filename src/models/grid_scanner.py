@@ -0,0 +1,127 @@
+"""
+격자 단위 색상 검사를 위한 벡터화 엔진 모듈 (Qt 의존성 없음)
+"""
+import numpy as np
+
+
+# 모니터링 영역을 나누는 격자 수 (GRID_COUNT x GRID_COUNT)
+GRID_COUNT = 4
+
+# 격자 내부 검사 간격 (픽셀)
+SCAN_STEP = 2
+
+
+def grid_sample_indices(height, width, grid_count=GRID_COUNT, step=SCAN_STEP):
+    """
+    격자 검사에서 방문하는 행/열 인덱스를 계산합니다.
+
+    각 격자는 (height // grid_count) x (width // grid_count) 크기이며
+    격자 시작점부터 step 간격으로 검사합니다. 나머지 픽셀은 검사하지 않습니다.
+
+    Args:
+        height, width: 이미지 크기
+        grid_count: 한 축당 격자 수
+        step: 격자 내부 검사 간격
+
+    Returns:
+        tuple: (ys, xs) 형태의 정수 배열 튜플
+    """
+    grid_height = height // grid_count
+    grid_width = width // grid_count
+
+    ys = np.concatenate([np.arange(row * grid_height, (row + 1) * grid_height, step) for row in range(grid_count)])
+    xs = np.concatenate([np.arange(col * grid_width, (col + 1) * grid_width, step) for col in range(grid_count)])
+
+    return ys.astype(np.intp), xs.astype(np.intp)
+
+
+def sample_grid(array, ys, xs):
+    """
+    격자 검사 위치의 값만 추출합니다.
+
+    인덱스가 등간격이면 복사 없이 슬라이스 뷰를 반환합니다.
+
+    Args:
+        array: (H, W, ...) 형태의 배열
+        ys, xs: grid_sample_indices()가 반환한 인덱스
+
+    Returns:
+        ndarray: (len(ys), len(xs), ...) 형태의 배열
+    """
+    if len(ys) == 0 or len(xs) == 0:
+        return array[:0, :0]
+
+    # 격자 크기가 step의 배수이면 등간격 슬라이스로 표현 가능
+    if _is_uniform(ys) and _is_uniform(xs):
+        y_step = int(ys[1] - ys[0]) if len(ys) > 1 else 1
+        x_step = int(xs[1] - xs[0]) if len(xs) > 1 else 1
+        return array[ys[0]:ys[-1] + 1:y_step, xs[0]:xs[-1] + 1:x_step]
+
+    return array[np.ix_(ys, xs)]
+
+
+def find_first_matches(sampled_mask, ys, xs, grid_count=GRID_COUNT):
+    """
+    각 격자에서 처음 일치하는 위치를 찾습니다 (격자당 최대 1개).
+
+    격자 내부는 행 우선 순서로 검사한 것과 같은 결과를 돌려주며,
+    결과는 격자 행/열 순서로 정렬됩니다.
+
+    Args:
+        sampled_mask: sample_grid()로 추출한 (len(ys), len(xs)) bool 마스크
+        ys, xs: grid_sample_indices()가 반환한 인덱스
+        grid_count: 한 축당 격자 수
+
+    Returns:
+        list: 이미지 기준 (x, y) 튜플 목록
+    """
+    rows, cols = sampled_mask.shape[:2]
+    cell_rows = rows // grid_count
+    cell_cols = cols // grid_count
+    if cell_rows == 0 or cell_cols == 0:
+        return []
+
+    # (격자 행, 격자 열, 격자 내부 픽셀) 형태로 재배열 후 블록별 argmax
+    blocks = sampled_mask.reshape(grid_count, cell_rows, grid_count, cell_cols)
+    blocks = blocks.transpose(0, 2, 1, 3).reshape(grid_count, grid_count, cell_rows * cell_cols)
+    first = blocks.argmax(axis=2)
+    found = np.take_along_axis(blocks, first[..., np.newaxis], axis=2)[..., 0]
+
+    matches = []
+    for grid_row, grid_col in zip(*np.nonzero(found)):
+        index = first[grid_row, grid_col]
+        y = ys[grid_row * cell_rows + index // cell_cols]
+        x = xs[grid_col * cell_cols + index % cell_cols]
+        matches.append((int(x), int(y)))
+
+    return matches
+
+
+def sample_shift(indices, offset):
+    """
+    영역을 offset 픽셀 옮겼을 때 검사 위치 배열 기준 이동량을 계산합니다.
+
+    검사 위치가 등간격이고 offset이 그 간격의 배수일 때만 옮긴 영역의 검사 위치가
+    이전 검사 위치와 같은 화면 픽셀에 놓입니다.
+
+    Args:
+        indices: grid_sample_indices()가 반환한 한 축의 인덱스
+        offset: 영역 이동량 (픽셀)
+
+    Returns:
+        int: 검사 위치 기준 이동량 (옮길 수 없으면 None)
+    """
+    if len(indices) == 0 or not _is_uniform(indices):
+        return None
+    step = int(indices[1] - indices[0]) if len(indices) > 1 else 1
+    if offset % step:
+        return None
+    return offset // step
+
+
+def _is_uniform(indices):
+    """인덱스 배열이 등간격인지 확인"""
+    if len(indices) < 3:
+        return True
+    diffs = np.diff(indices)
+    return bool((diffs == diffs[0]).all())
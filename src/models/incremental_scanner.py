@@ -0,0 +1,178 @@
+"""
+프레임 차분 기반 증분 검사 모듈 (Qt 의존성 없음)
+"""
+import numpy as np
+
+
+# 타일 한 변의 길이 (검사 위치 기준, 기본 검사 간격 2px이면 화면상 32px)
+DEFAULT_TILE_SIZE = 16
+
+# 변경된 타일 비율이 이 값을 넘으면 부분 갱신 대신 전체를 다시 검사
+FULL_RESCAN_RATIO = 0.5
+
+
+class IncrementalScanner:
+    """이전 프레임과 비교해 바뀐 타일만 다시 매칭하고 나머지는 캐시된 결과를 재사용하는 검사기"""
+
+    def __init__(self, tile_size=DEFAULT_TILE_SIZE, full_rescan_ratio=FULL_RESCAN_RATIO):
+        """
+        Args:
+            tile_size: 타일 한 변의 길이 (입력 배열 기준 픽셀)
+            full_rescan_ratio: 전체 재검사로 전환하는 변경 타일 비율
+        """
+        self.tile_size = tile_size
+        self.full_rescan_ratio = full_rescan_ratio
+        self.reset()
+
+        # 통계
+        self.ticks = 0
+        self.rescanned_tiles = 0
+        self.total_tiles = 0
+        self.last_rescan_ratio = 1.0
+        self.translations = 0
+
+    def reset(self):
+        """캐시된 프레임과 매칭 결과 삭제"""
+        self.previous = None
+        self.mask = None
+        self.matcher = None
+        self.key = None
+        self.diff = None
+        self.changed = None
+        self.stale = None  # 영역 이동으로 새로 드러나 다음 틱에 반드시 다시 매칭할 위치
+
+    def translate(self, dx, dy, key=None):
+        """
+        영역이 크기 변화 없이 옮겨졌을 때 캐시를 버리지 않고 이동
+
+        이전 프레임과 매칭 결과를 (dx, dy)만큼 옮겨 새 영역과 겹치는 부분은 재사용하고,
+        새로 드러난 부분은 다음 match()에서 바뀐 것으로 간주해 다시 매칭합니다.
+
+        Args:
+            dx, dy: 영역 이동량 (입력 배열 기준 위치 수)
+            key: 이동한 영역의 캐시 키 (다음 match()에 전달할 값)
+        """
+        if self.previous is None:
+            return
+        height, width = self.mask.shape
+        if abs(dx) >= width or abs(dy) >= height:
+            self.reset()
+            return
+
+        rows_dst, rows_src = _shift_slices(height, dy)
+        cols_dst, cols_src = _shift_slices(width, dx)
+        if self.stale is None:
+            self.stale = np.zeros((height, width), dtype=bool)
+        # 겹치는 슬라이스 대입은 NumPy가 임시 버퍼로 처리하므로 제자리 이동이 안전함
+        for array in (self.previous, self.mask, self.stale):
+            array[rows_dst, cols_dst] = array[rows_src, cols_src]
+
+        # 새로 드러난 띠 (이전 프레임에 없던 위치)
+        if dy > 0:
+            self.stale[height - dy:] = True
+        elif dy < 0:
+            self.stale[:-dy] = True
+        if dx > 0:
+            self.stale[:, width - dx:] = True
+        elif dx < 0:
+            self.stale[:, :-dx] = True
+
+        self.key = key
+        self.translations += 1
+
+    def match(self, img_array, matcher, key=None):
+        """
+        바뀐 타일만 다시 매칭한 일치 마스크 반환
+
+        반환된 마스크는 내부 캐시이므로 수정하지 말고 필요하면 복사해서 사용합니다.
+
+        Args:
+            img_array: (H, W, 3) 이미지 배열 (격자 검사 위치만 추출한 뷰도 가능)
+            matcher: match(array) -> bool 마스크를 제공하는 매처
+            key: 캐시를 구분하는 추가 키 (예: 모니터링 영역 좌표, 바뀌면 전체 재검사)
+
+        Returns:
+            ndarray: (H, W) bool 일치 마스크
+        """
+        height, width = img_array.shape[:2]
+        tiles_y = -(-height // self.tile_size)
+        tiles_x = -(-width // self.tile_size)
+        tile_count = tiles_y * tiles_x
+
+        if (self.previous is None or self.previous.shape != img_array.shape
+                or matcher is not self.matcher or key != self.key):
+            # 캐시를 쓸 수 없으면 전체 검사
+            self.mask = matcher.match(img_array)
+            self.previous = np.array(img_array, copy=True)
+            self.matcher = matcher
+            self.key = key
+            # 비교용 임시 배열을 재사용해 매 틱 대용량 할당을 피함
+            self.diff = np.empty(img_array.shape, dtype=bool)
+            self.changed = np.empty((height, width), dtype=bool)
+            self.stale = None
+            self._record(tile_count, tile_count)
+            return self.mask
+
+        # 픽셀 단위 변경 여부를 타일 단위로 축소 (작은 축에 대한 any()보다 채널별 OR가 빠름)
+        diff, changed = self.diff, self.changed
+        np.not_equal(img_array, self.previous, out=diff)
+        np.bitwise_or(diff[..., 0], diff[..., 1], out=changed)
+        changed |= diff[..., 2]
+        if self.stale is not None:
+            changed |= self.stale
+            self.stale = None
+        dirty_tiles = self._reduce_tiles(changed, tiles_y, tiles_x)
+        dirty_count = int(dirty_tiles.sum())
+
+        if dirty_count > self.full_rescan_ratio * tile_count:
+            self.mask = matcher.match(img_array)
+        elif dirty_count:
+            # 변경된 타일에 속한 위치만 모아서 다시 매칭
+            dirty = np.repeat(np.repeat(dirty_tiles, self.tile_size, axis=0), self.tile_size, axis=1)[:height, :width]
+            self.mask[dirty] = matcher.match(img_array[dirty])
+
+        if dirty_count:
+            np.copyto(self.previous, img_array)
+        self._record(dirty_count, tile_count)
+        return self.mask
+
+    def _reduce_tiles(self, changed, tiles_y, tiles_x):
+        """(H, W) 변경 마스크를 (tiles_y, tiles_x) 타일 변경 마스크로 축소"""
+        height, width = changed.shape
+        padded = np.zeros((tiles_y * self.tile_size, tiles_x * self.tile_size), dtype=bool)
+        padded[:height, :width] = changed
+        return padded.reshape(tiles_y, self.tile_size, tiles_x, self.tile_size).any(axis=(1, 3))
+
+    def _record(self, rescanned, total):
+        """다시 검사한 타일 수 기록"""
+        self.ticks += 1
+        self.rescanned_tiles += rescanned
+        self.total_tiles += total
+        self.last_rescan_ratio = rescanned / total if total else 0.0
+
+    def stats(self):
+        """
+        타일 재검사 통계 반환
+
+        Returns:
+            dict: 틱 수, 마지막/평균 재검사 타일 비율
+        """
+        return {
+            "ticks": self.ticks,
+            "tile_size": self.tile_size,
+            "last_rescan_ratio": self.last_rescan_ratio,
+            "mean_rescan_ratio": self.rescanned_tiles / self.total_tiles if self.total_tiles else 0.0,
+            "translations": self.translations,
+        }
+
+
+def _shift_slices(length, offset):
+    """
+    한 축을 offset만큼 옮길 때의 (대상, 원본) 슬라이스 (새 위치 i는 이전 위치 i + offset)
+
+    Returns:
+        tuple: (dst, src) 슬라이스
+    """
+    if offset >= 0:
+        return slice(0, length - offset), slice(offset, length)
+    return slice(-offset, length), slice(0, length + offset)
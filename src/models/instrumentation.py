@@ -0,0 +1,196 @@
+"""
+단계별 소요 시간 측정 모듈 (Qt 의존성 없음)
+
+캡처, 변환, 검사, 신호 전달, 그리기 등 각 단계를 단조 시계 구간(span)으로 감싸고
+단계마다 최근 SPAN_WINDOW개의 측정값을 고정 크기 링 버퍼에 보관해 백분위수를 계산합니다.
+비활성화 상태에서는 span()이 아무 일도 하지 않는 공용 객체를 반환하므로 비용이 거의 없습니다.
+"""
+import json
+import threading
+import time
+
+import numpy as np
+
+
+# 단계별로 보관하는 최근 측정값 수
+SPAN_WINDOW = 256
+
+# 보고하는 백분위수
+PERCENTILES = (50, 95, 99)
+
+# 상태 표시줄 한 줄 요약에 표시하는 단계 순서 (capture는 공급원과 무관한 캡처 전체, grab/convert는 화면 캡처 내부)
+SUMMARY_STAGES = ("capture", "grab", "convert", "scan", "signal", "paint")
+
+
+class RingBuffer:
+    """최근 capacity개의 float 값만 보관하는 고정 크기 버퍼"""
+
+    def __init__(self, capacity=SPAN_WINDOW):
+        self.values = np.zeros(capacity, dtype=np.float64)
+        self.index = 0
+        self.count = 0  # 지금까지 추가된 전체 값 수
+
+    def append(self, value):
+        """값 추가 (가득 차면 가장 오래된 값을 덮어씀)"""
+        self.values[self.index] = value
+        self.index = (self.index + 1) % self.values.size
+        self.count += 1
+
+    def snapshot(self):
+        """보관 중인 값 배열 복사본 (순서 무관)"""
+        return self.values[:min(self.count, self.values.size)].copy()
+
+
+class _Span:
+    """with 블록의 소요 시간을 측정해 기록하는 구간"""
+
+    __slots__ = ("instrumentation", "stage", "start")
+
+    def __init__(self, instrumentation, stage):
+        self.instrumentation = instrumentation
+        self.stage = stage
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.instrumentation.record(self.stage, time.perf_counter() - self.start)
+        return False
+
+
+class _NullSpan:
+    """비활성화 상태에서 사용하는 아무 일도 하지 않는 구간"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Instrumentation:
+    """단계별 소요 시간 측정기"""
+
+    def __init__(self, window=SPAN_WINDOW, enabled=False):
+        """
+        Args:
+            window: 단계별로 보관하는 최근 측정값 수
+            enabled: 처음부터 측정할지 여부
+        """
+        self.window = window
+        self.enabled = enabled
+        self.buffers = {}
+        self.marks = {}
+        self._lock = threading.Lock()
+
+    def set_enabled(self, enabled):
+        """측정 활성화/비활성화 (활성화할 때 이전 측정값 삭제)"""
+        if enabled and not self.enabled:
+            self.reset()
+        self.enabled = enabled
+
+    def reset(self):
+        """모든 측정값 삭제"""
+        with self._lock:
+            self.buffers = {}
+            self.marks = {}
+
+    def span(self, stage):
+        """
+        with 블록의 소요 시간을 stage 단계로 기록하는 구간 반환
+
+        Example:
+            with instrumentation.span("grab"):
+                frame = source.grab(rect)
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, stage)
+
+    def record(self, stage, seconds):
+        """stage 단계의 소요 시간 (초) 기록"""
+        if not self.enabled:
+            return
+        buffer = self.buffers.get(stage)
+        if buffer is None:
+            # 단계 버퍼 생성만 잠그고 추가는 단계별 단일 쓰레드 기록을 가정
+            with self._lock:
+                buffer = self.buffers.setdefault(stage, RingBuffer(self.window))
+        buffer.append(seconds)
+
+    def mark(self, name):
+        """현재 시각을 name으로 표시 (다른 쓰레드에서 record_since()로 경과 시간 기록)"""
+        if self.enabled:
+            self.marks[name] = time.perf_counter()
+
+    def record_since(self, stage, name):
+        """name으로 표시한 시각부터 지금까지의 시간을 stage 단계로 기록 (예: 신호 전달 지연)"""
+        if not self.enabled:
+            return
+        start = self.marks.get(name)
+        if start is not None:
+            self.record(stage, time.perf_counter() - start)
+
+    def stats(self):
+        """
+        단계별 통계 반환
+
+        Returns:
+            dict: 단계 이름 -> {count, last_ms, mean_ms, p50_ms, p95_ms, p99_ms}
+        """
+        result = {}
+        for stage, buffer in list(self.buffers.items()):
+            values = buffer.snapshot() * 1000.0
+            if not values.size:
+                continue
+            entry = {
+                "count": buffer.count,
+                "last_ms": float(buffer.values[(buffer.index - 1) % buffer.values.size] * 1000.0),
+                "mean_ms": float(values.mean()),
+            }
+            for p, value in zip(PERCENTILES, np.percentile(values, PERCENTILES)):
+                entry[f"p{p}_ms"] = float(value)
+            result[stage] = entry
+        return result
+
+    def summary_line(self, stages=SUMMARY_STAGES):
+        """
+        상태 표시줄용 한 줄 요약 (단계별 p50/p95 ms)
+
+        Returns:
+            str: 예) "grab 3.1/5.0 · scan 0.8/1.2 · paint 0.2/0.4 ms (p50/p95)"
+        """
+        stats = self.stats()
+        parts = [f"{stage} {stats[stage]['p50_ms']:.1f}/{stats[stage]['p95_ms']:.1f}"
+                 for stage in stages if stage in stats]
+        if not parts:
+            return "측정값 없음"
+        return " · ".join(parts) + " ms (p50/p95)"
+
+    def dump_json(self, path=None):
+        """
+        단계별 통계를 JSON 문자열로 반환 (path를 지정하면 파일로도 저장)
+
+        Returns:
+            str: JSON 문자열
+        """
+        text = json.dumps({"window": self.window, "stages": self.stats()}, indent=2, sort_keys=True)
+        if path is not None:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+        return text
+
+
+_instrumentation = Instrumentation()
+
+
+def get_instrumentation():
+    """애플리케이션 전체가 공유하는 측정기 반환"""
+    return _instrumentation
@@ -0,0 +1,120 @@
+"""
+컴파일 비용이 큰 매처를 백그라운드 쓰레드에서 준비하는 모듈 (Qt 의존성 없음)
+
+lab/hue 매칭 방식과 팔레트는 2^24 색상 테이블을 만드는 데 수백 ms 이상 걸리므로,
+감지 쓰레드(와 상태 잠금을 기다리는 GUI 쓰레드)를 막지 않도록 별도 쓰레드에서 컴파일합니다.
+다른 설정의 매처로 판정한 결과를 현재 설정의 결과로 내보내지 않도록, 요청한 설정의 매처가
+준비되기 전에는 None을 반환하며 호출 측은 그 틱을 건너뜁니다.
+"""
+import threading
+import time
+
+
+# 컴파일 완료를 기다릴 때의 확인 간격 (초)
+WAIT_POLL_INTERVAL = 0.005
+
+
+class BackgroundMatcherCompiler:
+    """요청된 설정의 매처를 백그라운드에서 컴파일하고 준비된 매처를 반환하는 컴파일러"""
+
+    def __init__(self):
+        self.current_key = None  # 준비된 매처의 설정 키
+        self.current = None  # 준비된 매처 (아직 없으면 None)
+        self.requested_key = None  # 컴파일을 기다리는 가장 최근 설정 키
+        self.requested_build = None
+        self.building = False
+        self.generation = 0  # 호출한 쓰레드에서 매처를 바로 바꿀 때마다 증가 (진행 중인 컴파일 결과를 버리기 위함)
+        self.builds = 0  # 백그라운드에서 완료한 컴파일 수
+        self.skipped = 0  # 컴파일 전에 더 새로운 요청으로 대체되어 건너뛴 요청 수
+        self._lock = threading.Lock()
+
+    def get(self, key, build, cheap=False):
+        """
+        key 설정의 매처 반환 (아직 준비되지 않았으면 백그라운드 컴파일을 요청하고 None 반환)
+
+        슬라이더를 끄는 동안처럼 요청이 연달아 들어오면 진행 중인 컴파일이 끝난 뒤
+        가장 마지막 요청만 컴파일합니다.
+
+        Args:
+            key: 매처 설정을 나타내는 해시 가능한 값 (같으면 같은 매처)
+            build: 인자 없이 매처를 만드는 함수 (캐시된 생성 함수면 다시 요청해도 비용이 없음)
+            cheap: True면 비용이 작으므로 호출한 쓰레드에서 바로 만듦 (채널별 LUT 매처 등)
+
+        Returns:
+            key 설정의 매처 (컴파일 중이면 None)
+        """
+        with self._lock:
+            if key == self.current_key:
+                return self.current
+            if cheap:
+                self.current_key, self.current = key, build()
+                self.generation += 1
+                # 이미 대체된 비싼 요청은 컴파일하지 않음
+                self._drop_request()
+                return self.current
+            if key != self.requested_key:
+                if self.requested_key is not None:
+                    self.skipped += 1
+                self.requested_key, self.requested_build = key, build
+            if not self.building:
+                self.building = True
+                threading.Thread(target=self._run, name="matcher-compiler", daemon=True).start()
+            return None
+
+    def ready(self, key):
+        """key 설정의 매처가 준비됐으면 반환 (컴파일을 요청하지 않음, 준비되지 않았으면 None)"""
+        with self._lock:
+            return self.current if key == self.current_key else None
+
+    def _drop_request(self):
+        """대기 중인 요청 취소 (잠금 안에서 호출)"""
+        if self.requested_key is not None:
+            self.skipped += 1
+        self.requested_key = self.requested_build = None
+
+    def _run(self):
+        """대기 중인 요청이 없을 때까지 가장 최근 요청을 컴파일 (컴파일 쓰레드)"""
+        while True:
+            with self._lock:
+                key, build, generation = self.requested_key, self.requested_build, self.generation
+                if key is None:
+                    self.building = False
+                    return
+            try:
+                matcher = build()
+            except Exception as e:
+                print(f"Matcher compile error: {e}")
+                with self._lock:
+                    if self.requested_key == key:
+                        self.requested_key = self.requested_build = None
+                continue
+            with self._lock:
+                self.builds += 1
+                # 그 사이 더 새로운 요청이 있었으면 이 매처는 쓰이지 않지만, 설정을 되돌리면 바로 사용
+                if generation == self.generation:
+                    self.current_key, self.current = key, matcher
+                if self.requested_key == key:
+                    self.requested_key = self.requested_build = None
+
+    def wait(self, timeout=None):
+        """
+        대기 중인 컴파일이 끝날 때까지 대기 (측정/테스트용)
+
+        Returns:
+            bool: timeout 안에 끝났으면 True
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.building:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(WAIT_POLL_INTERVAL)
+        return True
+
+    def stats(self):
+        """
+        컴파일 통계 반환
+
+        Returns:
+            dict: 완료한 컴파일 수, 건너뛴 요청 수, 컴파일 진행 여부
+        """
+        return {"builds": self.builds, "skipped": self.skipped, "building": self.building}
@@ -0,0 +1,81 @@
+"""
+여러 타겟 색상을 한 번에 검사하는 멀티 컬러 엔진 모듈 (Qt 의존성 없음)
+"""
+import numpy as np
+
+from src.models.grid_scanner import grid_sample_indices, sample_grid, find_first_matches
+
+
+# 비트마스크 한 개로 표현할 수 있는 최대 타겟 수
+MAX_TARGETS = 32
+
+
+class MultiColorEngine:
+    """N개의 (색상, 임계값) 타겟을 픽셀당 비트마스크 한 번으로 분류하는 엔진"""
+
+    def __init__(self, specs):
+        """
+        Args:
+            specs: ((r, g, b), threshold) 튜플 목록 (목록 순서가 타겟 인덱스)
+        """
+        if len(specs) > MAX_TARGETS:
+            raise ValueError(f"At most {MAX_TARGETS} targets are supported, got {len(specs)}")
+
+        self.specs = [(tuple(int(c) for c in rgb), int(threshold)) for rgb, threshold in specs]
+
+        # 타겟 수에 맞는 가장 작은 비트마스크 자료형 선택
+        if len(self.specs) <= 8:
+            self.dtype = np.uint8
+        elif len(self.specs) <= 16:
+            self.dtype = np.uint16
+        else:
+            self.dtype = np.uint32
+
+        # 채널별 LUT: 채널 값이 타겟 i의 범위 안이면 비트 i가 켜짐
+        self.luts = np.zeros((3, 256), dtype=self.dtype)
+        for index, (rgb, threshold) in enumerate(self.specs):
+            bit = self.dtype(1 << index)
+            for channel, value in enumerate(rgb):
+                lo, hi = max(0, value - threshold), min(255, value + threshold)
+                self.luts[channel, lo:hi + 1] |= bit
+
+    def __len__(self):
+        return len(self.specs)
+
+    def classify(self, img_array):
+        """
+        픽셀별로 일치한 타겟 비트마스크 계산
+
+        세 채널 LUT의 AND이므로 비트 i는 모든 채널이 타겟 i의 범위 안일 때만 켜집니다.
+
+        Args:
+            img_array: (..., 3 이상) 형태의 uint8 배열
+
+        Returns:
+            ndarray: (...) 형태의 비트마스크 배열
+        """
+        return self.luts[0][img_array[..., 0]] & self.luts[1][img_array[..., 1]] & self.luts[2][img_array[..., 2]]
+
+    def find_matches(self, img_array, excluded_masks=None):
+        """
+        타겟별로 격자당 첫 번째 일치 위치 검색
+
+        Args:
+            img_array: 이미지 배열
+            excluded_masks: 타겟별 이미지 크기의 bool 제외 마스크 목록 (항목이 None이면 제외 없음)
+
+        Returns:
+            list: 타겟별 이미지 기준 (x, y) 튜플 목록의 목록
+        """
+        height, width = img_array.shape[:2]
+        ys, xs = grid_sample_indices(height, width)
+        bits = self.classify(sample_grid(img_array, ys, xs))
+
+        results = []
+        for index in range(len(self.specs)):
+            mask = (bits & self.dtype(1 << index)) != 0
+            excluded = excluded_masks[index] if excluded_masks else None
+            if excluded is not None:
+                mask &= ~sample_grid(excluded, ys, xs)
+            results.append(find_first_matches(mask, ys, xs))
+        return results
@@ -0,0 +1,156 @@
+"""
+여러 색상을 한 번의 캡처와 한 번의 검사로 모니터링하는 쓰레드 클래스
+"""
+from PyQt5.QtCore import QThread, pyqtSignal, QPoint, QRect
+from PyQt5.QtGui import QColor
+
+from src.models.exclusion_mask import ExclusionMask
+from src.models.frame_buffer import FrameBufferPool
+from src.models.frame_source import PILFrameSource
+from src.models.multi_color_engine import MultiColorEngine
+from src.models.point_delta import DeltaTracker
+
+
+class MultiColorMonitorThread(QThread):
+    """여러 타겟 색상을 단일 패스로 모니터링하는 쓰레드 클래스"""
+
+    # 신호 정의 (ColorMonitorThread와 동일)
+    color_detected = pyqtSignal(list, QColor, int)  # 감지된 포인트 목록, 색상, 색상 인덱스
+    detection_delta = pyqtSignal(list, list, QColor, int)  # 직전 결과와 달라졌을 때만 추가/제거된 포인트 목록, 색상, 색상 인덱스
+
+    def __init__(self, targets, frame_source=None):
+        """
+        Args:
+            targets: (QColor, 임계값) 튜플 목록 (목록 순서가 색상 인덱스)
+            frame_source: 프레임 공급원 (None이면 PIL 화면 캡처)
+        """
+        super().__init__()
+
+        self.target_colors = [color for color, _ in targets]
+        self.thresholds = [threshold for _, threshold in targets]
+        self.monitoring_area = QRect(0, 0, 300, 300)
+        self.frame_source = frame_source if frame_source is not None else PILFrameSource()
+        self.frame_pool = FrameBufferPool()
+        self.engine = None
+
+        # 감지 관련 변수 (색상 인덱스별)
+        self.is_monitoring = False
+        self.last_match_points = [[] for _ in targets]
+
+        # 하이라이트된 영역 추적 (색상 인덱스별 점유 마스크)
+        self.highlighted_areas = [ExclusionMask(self.monitoring_area) for _ in targets]
+
+        # 마지막으로 알린 결과 (색상 인덱스별 detection_delta 계산용)
+        self.delta_trackers = [DeltaTracker() for _ in targets]
+
+    def _reset_index(self, color_index):
+        """색상 인덱스별 감지 상태 초기화"""
+        self.last_match_points[color_index] = []
+        self.highlighted_areas[color_index].clear()
+
+    def set_target_color(self, color_index, color):
+        """타겟 색상 설정"""
+        if self.target_colors[color_index] != color:
+            self._reset_index(color_index)
+            self.engine = None
+        self.target_colors[color_index] = color
+
+    def set_threshold(self, color_index, value):
+        """임계값 설정"""
+        if self.thresholds[color_index] != value:
+            self._reset_index(color_index)
+            self.engine = None
+        self.thresholds[color_index] = value
+
+    def set_monitoring_area(self, rect):
+        """모니터링 영역 설정"""
+        if self.monitoring_area != rect:
+            if self.monitoring_area.size() == rect.size():
+                # 크기 변화 없이 옮겨졌으면 새 영역과 겹치는 하이라이트 영역과 포인트는 유지 (화면 좌표)
+                self.last_match_points = [[point for point in points if rect.contains(point)]
+                                          for points in self.last_match_points]
+                for areas in self.highlighted_areas:
+                    areas.move_to(rect)
+            else:
+                self.last_match_points = [[] for _ in self.target_colors]
+                for areas in self.highlighted_areas:
+                    areas.reset(rect)
+        self.monitoring_area = rect
+
+    def set_frame_source(self, frame_source):
+        """프레임 공급원 설정"""
+        self.frame_source = frame_source
+
+    def start_monitoring(self):
+        """모니터링 시작"""
+        self.is_monitoring = True
+        if not self.isRunning():
+            self.start()
+
+    def stop_monitoring(self):
+        """모니터링 중지"""
+        self.is_monitoring = False
+        for color_index in range(len(self.target_colors)):
+            self._reset_index(color_index)
+            self.delta_trackers[color_index].reset()
+
+    def _emit_detection(self, color_index, points):
+        """전체 목록 신호를 발생하고 직전 결과와 달라졌으면 차이 신호도 발생"""
+        target_color = self.target_colors[color_index]
+        self.color_detected.emit(points, target_color, color_index)
+        added, removed = self.delta_trackers[color_index].update(points, target_color)
+        if added or removed:
+            self.detection_delta.emit(added, removed, target_color, color_index)
+
+    def add_highlighted_area(self, color_index, point):
+        """하이라이트된 영역 추가 (10x10 픽셀 사각형)"""
+        self.highlighted_areas[color_index].add_point(point.x(), point.y())
+
+    def _get_engine(self):
+        """현재 타겟 설정으로 컴파일된 엔진 반환 (설정 변경 시 재생성)"""
+        if self.engine is None:
+            specs = [((c.red(), c.green(), c.blue()), t) for c, t in zip(self.target_colors, self.thresholds)]
+            self.engine = MultiColorEngine(specs)
+        return self.engine
+
+    def detect_once(self):
+        """
+        한 번 캡처하고 모든 타겟을 한 번에 검사
+
+        Returns:
+            list: 색상 인덱스별 감지된 QPoint 목록
+        """
+        x, y, w, h = self.monitoring_area.x(), self.monitoring_area.y(), self.monitoring_area.width(), self.monitoring_area.height()
+        img_array, _ = self.frame_source.grab_into(self.monitoring_area, self.frame_pool.acquire(w, h))
+
+        # 타겟별 하이라이트 영역을 캡처 영역 기준 제외 마스크로 전달
+        height, width = img_array.shape[:2]
+        excluded = [areas.region(x, y, width, height) if areas else None for areas in self.highlighted_areas]
+        matches = self._get_engine().find_matches(img_array, excluded)
+        return [[QPoint(x + px, y + py) for px, py in points] for points in matches]
+
+    def run(self):
+        """쓰레드 실행 메소드"""
+        while True:
+            if self.is_monitoring:
+                try:
+                    for color_index, match_points in enumerate(self.detect_once()):
+                        target_color = self.target_colors[color_index]
+
+                        # 감지된 색상이 있으면 신호 발생 (ColorMonitorThread와 같은 규칙)
+                        if match_points:
+                            for point in match_points:
+                                self.add_highlighted_area(color_index, point)
+                            self.last_match_points[color_index] = match_points
+                            self._emit_detection(color_index, match_points)
+                        elif match_points != self.last_match_points[color_index]:
+                            # 감지된 위치가 변경되면 빈 목록으로 신호 발생
+                            self.last_match_points[color_index] = []
+                            self._emit_detection(color_index, [])
+
+                except Exception as e:
+                    print(f"Multi color thread error: {str(e)}")
+                    self.last_match_points = [[] for _ in self.target_colors]
+
+            # 잠시 대기 (CPU 사용량 감소)
+            self.msleep(100)  # 100ms 대기
@@ -0,0 +1,89 @@
+"""
+여러 타겟 색상(팔레트)을 한 번에 판정하는 팔레트 매처 모듈 (Qt 의존성 없음)
+"""
+from functools import lru_cache
+
+import numpy as np
+
+
+# 팔레트 최대 항목 수 (uint8 인덱스 테이블, 0은 일치 없음)
+MAX_PALETTE_ENTRIES = 255
+
+# 캐시에 유지할 컴파일된 팔레트 수 (팔레트당 16MB)
+PALETTE_CACHE_SIZE = 2
+
+
+class PaletteMatcher:
+    """
+    모든 24비트 색상에 대해 일치하는 팔레트 항목 번호를 저장한 테이블로 판정하는 매처
+
+    항목이 몇 개든 픽셀당 조회는 한 번이므로 단일 색상과 비용이 같습니다.
+    범위가 겹치면 목록에서 앞선 항목이 우선합니다.
+    """
+
+    def __init__(self, entries):
+        """
+        Args:
+            entries: ((r, g, b), threshold) 튜플 목록 (목록 순서가 항목 번호)
+        """
+        if len(entries) > MAX_PALETTE_ENTRIES:
+            raise ValueError(f"At most {MAX_PALETTE_ENTRIES} palette entries are supported, got {len(entries)}")
+
+        self.entries = [(tuple(int(c) for c in rgb), int(threshold)) for rgb, threshold in entries]
+
+        # (R, G, B) 인덱스 테이블에 항목별 범위 상자를 역순으로 채워 앞선 항목이 마지막에 덮어쓰도록 함
+        self.table = np.zeros((256, 256, 256), dtype=np.uint8)
+        for index in range(len(self.entries) - 1, -1, -1):
+            (r, g, b), threshold = self.entries[index]
+            self.table[max(0, r - threshold):min(255, r + threshold) + 1,
+                       max(0, g - threshold):min(255, g + threshold) + 1,
+                       max(0, b - threshold):min(255, b + threshold) + 1] = index + 1
+
+    def __len__(self):
+        return len(self.entries)
+
+    def lookup(self, img_array):
+        """
+        픽셀별 테이블 값 (일치한 항목 번호 + 1, 일치 없으면 0) 계산
+
+        Args:
+            img_array: (..., 3 이상) 형태의 uint8 배열
+
+        Returns:
+            ndarray: (...) 형태의 uint8 배열
+        """
+        return self.table[img_array[..., 0], img_array[..., 1], img_array[..., 2]]
+
+    def match(self, img_array):
+        """이미지 배열 전체에 대해 일치 마스크 계산 (어느 항목이든 일치하면 True)"""
+        return self.lookup(img_array) != 0
+
+    def match_pixel(self, pixel):
+        """단일 픽셀 (r, g, b) 일치 여부"""
+        return bool(self.table[pixel[0], pixel[1], pixel[2]])
+
+    def classify(self, img_array):
+        """
+        픽셀별로 일치한 팔레트 항목 번호 계산
+
+        Returns:
+            ndarray: (...) 형태의 int 배열 (일치 없으면 -1)
+        """
+        return self.lookup(img_array).astype(np.int16) - 1
+
+    def __repr__(self):
+        return f"PaletteMatcher(entries={len(self.entries)})"
+
+
+@lru_cache(maxsize=PALETTE_CACHE_SIZE)
+def get_palette_matcher(entries):
+    """
+    팔레트에 대한 매처를 반환합니다 (LRU 캐시).
+
+    Args:
+        entries: ((r, g, b), threshold) 튜플의 튜플
+
+    Returns:
+        PaletteMatcher: 컴파일된 매처
+    """
+    return PaletteMatcher(entries)
@@ -0,0 +1,109 @@
+"""
+큰 프레임을 가로 띠로 나눠 쓰레드 풀에서 동시에 매칭하는 모듈 (Qt 의존성 없음)
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+
+# 이 위치 수보다 작은 프레임은 쓰레드 전환 비용이 더 커서 단일 쓰레드로 처리
+PARALLEL_MIN_POSITIONS = 256 * 1024
+
+# 띠 하나가 가져야 하는 최소 위치 수 (띠가 너무 작으면 작업 분배 비용이 커짐)
+MIN_BAND_POSITIONS = 64 * 1024
+
+
+def default_worker_count():
+    """기본 작업 쓰레드 수 (CPU 수, 최대 8)"""
+    return max(1, min(8, os.cpu_count() or 1))
+
+
+class ParallelMatcher:
+    """
+    매칭을 가로 띠 단위로 나눠 제한된 크기의 쓰레드 풀에서 실행하는 실행기
+
+    LUT 조회와 AND 연산은 NumPy가 GIL을 해제하므로 띠들이 실제로 병렬 실행됩니다.
+    띠별 결과는 하나의 마스크에 모이므로 격자별 첫 번째 일치 규칙은 그대로 유지됩니다.
+    """
+
+    def __init__(self, workers=None, min_positions=PARALLEL_MIN_POSITIONS):
+        """
+        Args:
+            workers: 쓰레드 풀 크기 (None이면 CPU 수, 최대 8)
+            min_positions: 병렬 처리를 시작하는 최소 검사 위치 수
+        """
+        self.workers = workers if workers else default_worker_count()
+        self.min_positions = min_positions
+        self.executor = None
+
+        # 통계
+        self.parallel_calls = 0
+        self.serial_calls = 0
+        self.last_band_rows = 0
+
+    def band_rows(self, height, width):
+        """
+        프레임 크기에 맞춘 띠 높이 계산
+
+        쓰레드마다 최소 한 개의 띠를 주되, 띠 하나가 MIN_BAND_POSITIONS보다 작아지지 않게 합니다.
+
+        Returns:
+            int: 띠 하나의 행 수 (height 이상이면 분할하지 않음)
+        """
+        if height * width < self.min_positions or self.workers < 2:
+            return height
+        bands = max(1, min(self.workers, (height * width) // MIN_BAND_POSITIONS))
+        return -(-height // bands)
+
+    def match(self, img_array, matcher):
+        """
+        띠별로 나눠 매칭한 일치 마스크 반환
+
+        Args:
+            img_array: (H, W, 3) 이미지 배열 (격자 검사 위치만 추출한 뷰도 가능)
+            matcher: match(array) -> bool 마스크를 제공하는 매처
+
+        Returns:
+            ndarray: (H, W) bool 일치 마스크
+        """
+        height, width = img_array.shape[:2]
+        rows = self.band_rows(height, width)
+        self.last_band_rows = rows
+        if rows >= height:
+            self.serial_calls += 1
+            return matcher.match(img_array)
+
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="band-matcher")
+
+        mask = np.empty((height, width), dtype=bool)
+
+        def match_band(top):
+            mask[top:top + rows] = matcher.match(img_array[top:top + rows])
+
+        # 결과를 모두 기다리면서 띠에서 발생한 예외는 호출한 쪽으로 다시 전달
+        for future in [self.executor.submit(match_band, top) for top in range(0, height, rows)]:
+            future.result()
+        self.parallel_calls += 1
+        return mask
+
+    def shutdown(self):
+        """쓰레드 풀 종료 (다음 match 호출 시 다시 생성)"""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+    def stats(self):
+        """
+        병렬 매칭 통계 반환
+
+        Returns:
+            dict: 쓰레드 수, 병렬/단일 호출 횟수, 마지막 띠 높이
+        """
+        return {
+            "workers": self.workers,
+            "parallel_calls": self.parallel_calls,
+            "serial_calls": self.serial_calls,
+            "last_band_rows": self.last_band_rows,
+        }
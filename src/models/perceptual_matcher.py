@@ -0,0 +1,182 @@
+"""
+지각 색 거리(CIELAB ΔE, HSV 색상각) 기반 매처 모듈 (Qt 의존성 없음)
+
+모든 24비트 RGB 색상의 일치 여부를 2^24 비트 (2MB) 테이블로 한 번 컴파일하고,
+프레임마다 패킹한 RGB 값으로 테이블을 한 번 조회합니다.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+from src.models.color_matcher import get_color_matcher
+
+
+# 매칭 방식
+MODE_RGB = "rgb"  # 채널별 |c - t| <= threshold (기존 방식)
+MODE_LAB = "lab"  # CIELAB ΔE(CIE76) <= threshold
+MODE_HUE = "hue"  # HSV 색상각 차이 <= threshold 도
+COLOR_MODES = (MODE_RGB, MODE_LAB, MODE_HUE)
+
+# 캐시에 유지할 컴파일된 테이블 수 (테이블당 2MB)
+TABLE_CACHE_SIZE = 8
+
+# 테이블을 만들 때 한 번에 계산하는 R 채널 값 수 (16 x 65536 색상)
+BUILD_CHUNK_RED = 16
+
+# 색상각 모드에서 무채색으로 보고 제외하는 채도/명도 하한 (0 ~ 1)
+HUE_MIN_SATURATION = 0.25
+HUE_MIN_VALUE = 0.2
+
+# sRGB D65 기준 백색점
+_WHITE_XYZ = (0.95047, 1.0, 1.08883)
+_RGB_TO_XYZ = np.array([
+    [0.4124564, 0.3575761, 0.1804375],
+    [0.2126729, 0.7151522, 0.0721750],
+    [0.0193339, 0.1191920, 0.9503041],
+], dtype=np.float64)
+
+
+class PackedColorMatcher:
+    """2^24 비트 멤버십 테이블로 픽셀을 판정하는 매처 (ColorMatcher와 같은 인터페이스)"""
+
+    def __init__(self, bits, description=""):
+        """
+        Args:
+            bits: (2^21,) uint8 배열 (색상 (r << 16 | g << 8 | b)의 일치 여부가 비트 단위로 저장됨)
+            description: repr에 표시할 설명
+        """
+        self.bits = bits
+        self.description = description
+
+    def match(self, img_array):
+        """
+        이미지 배열 전체에 대해 일치 마스크 계산
+
+        Args:
+            img_array: (..., 3 이상) 형태의 uint8 배열
+
+        Returns:
+            ndarray: (...) 형태의 bool 마스크
+        """
+        packed = (img_array[..., 0].astype(np.uint32) << 16) | (img_array[..., 1].astype(np.uint32) << 8)
+        packed |= img_array[..., 2]
+        return ((self.bits[packed >> 3] >> (packed & 7).astype(np.uint8)) & 1).astype(bool)
+
+    def match_pixel(self, pixel):
+        """단일 픽셀 (r, g, b) 일치 여부"""
+        index = (int(pixel[0]) << 16) | (int(pixel[1]) << 8) | int(pixel[2])
+        return bool((self.bits[index >> 3] >> (index & 7)) & 1)
+
+    def __repr__(self):
+        return f"PackedColorMatcher({self.description})"
+
+
+def get_mode_matcher(mode, target_rgb, threshold):
+    """
+    매칭 방식에 맞는 매처 반환 (컴파일된 매처는 캐시되어 색상을 바꿨다가 돌아와도 재사용)
+
+    Args:
+        mode: COLOR_MODES 중 하나
+        target_rgb: (r, g, b) 튜플
+        threshold: rgb는 채널별 차이, lab은 ΔE, hue는 색상각(도)
+
+    Returns:
+        match(array) / match_pixel(pixel)을 제공하는 매처
+    """
+    target_rgb = tuple(int(c) for c in target_rgb)
+    if mode == MODE_RGB:
+        return get_color_matcher(target_rgb, threshold)
+    if mode == MODE_LAB:
+        return _get_lab_matcher(target_rgb, float(threshold))
+    if mode == MODE_HUE:
+        return _get_hue_matcher(target_rgb, float(threshold))
+    raise ValueError(f"Unknown color mode: {mode!r} (expected one of {COLOR_MODES})")
+
+
+@lru_cache(maxsize=TABLE_CACHE_SIZE)
+def _get_lab_matcher(target_rgb, threshold):
+    """CIELAB ΔE 매처 컴파일 (LRU 캐시)"""
+    target = _rgb_to_lab(*(np.array([c], dtype=np.uint8) for c in target_rgb))
+    limit = threshold * threshold
+
+    def members(r, g, b):
+        lab = _rgb_to_lab(r, g, b)
+        return ((lab[0] - target[0]) ** 2 + (lab[1] - target[1]) ** 2 + (lab[2] - target[2]) ** 2) <= limit
+
+    return PackedColorMatcher(_build_table(members), f"lab, target={target_rgb}, delta_e={threshold}")
+
+
+@lru_cache(maxsize=TABLE_CACHE_SIZE)
+def _get_hue_matcher(target_rgb, threshold):
+    """HSV 색상각 매처 컴파일 (LRU 캐시)"""
+    target_hue = _rgb_to_hsv(*(np.array([c], dtype=np.uint8) for c in target_rgb))[0]
+
+    def members(r, g, b):
+        hue, saturation, value = _rgb_to_hsv(r, g, b)
+        distance = np.abs(hue - target_hue)
+        distance = np.minimum(distance, 360.0 - distance)
+        return (distance <= threshold) & (saturation >= HUE_MIN_SATURATION) & (value >= HUE_MIN_VALUE)
+
+    return PackedColorMatcher(_build_table(members), f"hue, target={target_rgb}, degrees={threshold}")
+
+
+def _build_table(members):
+    """
+    모든 24비트 색상에 대해 members(r, g, b)를 계산해 비트 테이블 생성
+
+    메모리 사용량을 줄이기 위해 R 채널을 BUILD_CHUNK_RED개씩 나눠 계산합니다.
+
+    Args:
+        members: (r, g, b) uint8 배열을 받아 bool 배열을 반환하는 함수
+
+    Returns:
+        ndarray: (2^21,) uint8 비트 테이블 (리틀 엔디언 비트 순서)
+    """
+    bits = np.empty(1 << 21, dtype=np.uint8)
+    channel = np.arange(256, dtype=np.uint8)
+    g, b = channel[np.newaxis, :, np.newaxis], channel[np.newaxis, np.newaxis, :]
+    chunk_bytes = (BUILD_CHUNK_RED << 16) >> 3
+
+    for start in range(0, 256, BUILD_CHUNK_RED):
+        # (BUILD_CHUNK_RED, 256, 256) 브로드캐스트로 계산 (색상 순서는 r << 16 | g << 8 | b)
+        r = channel[start:start + BUILD_CHUNK_RED, np.newaxis, np.newaxis]
+        member = np.broadcast_to(members(r, g, b), (BUILD_CHUNK_RED, 256, 256))
+        offset = (start << 16) >> 3
+        bits[offset:offset + chunk_bytes] = np.packbits(member.ravel(), bitorder="little")
+    return bits
+
+
+@lru_cache(maxsize=1)
+def _channel_xyz_luts():
+    """채널 값별 XYZ 기여분 LUT (백색점으로 정규화, (3 채널, 3 성분, 256) float32)"""
+    c = np.arange(256, dtype=np.float64) / 255.0
+    linear = np.where(c <= 0.04045, c / 12.92, ((c + 0.055) / 1.055) ** 2.4)
+    scaled = _RGB_TO_XYZ / np.array(_WHITE_XYZ)[:, np.newaxis]
+    return (scaled.T[:, :, np.newaxis] * linear).astype(np.float32)
+
+
+def _rgb_to_lab(r, g, b):
+    """uint8 채널 배열 (브로드캐스트 가능)을 (L, a, b) float 배열 튜플로 변환"""
+    luts = _channel_xyz_luts()
+
+    def f(t):
+        return np.where(t > 216 / 24389, np.cbrt(t), (24389 / 27 * t + 16) / 116)
+
+    # XYZ는 채널별 기여분의 합이므로 채널 LUT 조회 후 더하기만 하면 됨
+    fx, fy, fz = (f(luts[0, i][r] + luts[1, i][g] + luts[2, i][b]) for i in range(3))
+    return 116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz)
+
+
+def _rgb_to_hsv(r, g, b):
+    """uint8 채널 배열 (브로드캐스트 가능)을 (색상각(도), 채도, 명도) float 배열 튜플로 변환"""
+    rgb = np.stack(np.broadcast_arrays(r, g, b)).astype(np.float32) / 255.0
+    value = rgb.max(axis=0)
+    delta = value - rgb.min(axis=0)
+    saturation = np.divide(delta, value, out=np.zeros_like(value), where=value > 0)
+
+    rf, gf, bf = rgb
+    safe = np.where(delta > 0, delta, 1.0)
+    hue = np.where(value == rf, ((gf - bf) / safe) % 6.0,
+                   np.where(value == gf, (bf - rf) / safe + 2.0, (rf - gf) / safe + 4.0)) * 60.0
+    hue = np.where(delta > 0, hue, 0.0)
+    return hue, saturation, value
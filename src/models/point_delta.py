@@ -0,0 +1,90 @@
+"""
+연속한 감지 결과의 차이(추가/제거된 포인트) 계산 모듈 (Qt 의존성 없음)
+"""
+import numpy as np
+
+
+def point_keys(coords):
+    """
+    (N, 2) 정수 좌표 배열을 포인트별 고유 int64 키로 변환 (음수 좌표 허용)
+
+    Returns:
+        ndarray: (N,) int64 배열
+    """
+    coords = np.asarray(coords, dtype=np.int64).reshape(-1, 2)
+    return (coords[:, 0] << 32) + coords[:, 1]
+
+
+def diff_points(previous, current):
+    """
+    두 좌표 배열을 비교해 추가/제거된 위치의 인덱스 계산
+
+    Args:
+        previous, current: (N, 2) 정수 좌표 배열
+
+    Returns:
+        tuple: (current에만 있는 인덱스 배열, previous에만 있는 인덱스 배열)
+    """
+    previous_keys, current_keys = point_keys(previous), point_keys(current)
+    added = np.flatnonzero(~np.isin(current_keys, previous_keys))
+    removed = np.flatnonzero(~np.isin(previous_keys, current_keys))
+    return added, removed
+
+
+class DeltaTracker:
+    """마지막으로 알린 포인트 목록을 기억하고 새 결과와의 차이만 계산하는 추적기"""
+
+    def __init__(self):
+        self.reset()
+
+        # 통계
+        self.updates = 0
+        self.changes = 0
+
+    def reset(self):
+        """기억한 포인트 삭제 (다음 결과는 모두 추가된 것으로 계산)"""
+        self.points = []
+        self.coords = np.empty((0, 2), dtype=np.int64)
+        self.color = None
+
+    def update(self, points, color=None):
+        """
+        새 결과를 기억하고 이전 결과와의 차이 반환
+
+        색상이 바뀌면 이전 포인트는 모두 제거, 새 포인트는 모두 추가된 것으로 계산합니다.
+
+        Args:
+            points: x() / y()를 제공하는 포인트 목록 (예: QPoint)
+            color: 결과를 구분하는 색상 값 (비교만 하므로 형식 무관)
+
+        Returns:
+            tuple: (추가된 포인트 목록, 제거된 포인트 목록) (바뀌지 않았으면 둘 다 빈 목록)
+        """
+        coords = np.fromiter((c for point in points for c in (point.x(), point.y())),
+                             dtype=np.int64, count=2 * len(points)).reshape(-1, 2)
+        self.updates += 1
+
+        if color != self.color:
+            added, removed = list(points), self.points
+        else:
+            added_index, removed_index = diff_points(self.coords, coords)
+            added = [points[i] for i in added_index]
+            removed = [self.points[i] for i in removed_index]
+
+        self.points, self.coords, self.color = list(points), coords, color
+        if added or removed:
+            self.changes += 1
+        return added, removed
+
+    def stats(self):
+        """
+        차이 계산 통계 반환
+
+        Returns:
+            dict: 결과 수, 변화가 있었던 결과 수와 비율
+        """
+        return {
+            "updates": self.updates,
+            "changes": self.changes,
+            "change_ratio": self.changes / self.updates if self.updates else 0.0,
+        }
@@ -0,0 +1,111 @@
+"""
+거친 검사 후 주변만 정밀 검사하는 피라미드 검색 모듈 (Qt 의존성 없음)
+"""
+import numpy as np
+
+from src.models.grid_scanner import SCAN_STEP
+
+
+# 기본 거친 검사 간격 (픽셀, SCAN_STEP의 배수)
+DEFAULT_PYRAMID_FACTOR = 8
+
+# 정밀 검사 후보 비율이 이 값을 넘으면 후보만 모으는 대신 전체를 정밀 검사
+FULL_REFINE_RATIO = 0.5
+
+
+class PyramidMatcher:
+    """
+    격자 검사 위치를 k 픽셀 간격으로 먼저 검사하고, 일치한 주변만 원래 간격으로 다시 검사하는 매처
+
+    보장: 모니터링 영역의 검사 범위 안에 k x k 정사각형을 포함하는 일치 블롭은 절대 놓치지 않습니다.
+    연속한 k개의 픽셀에는 SCAN_STEP 간격 검사 위치가 k / SCAN_STEP개 이상 들어 있고, 그중 하나는
+    반드시 거친 검사 위치이기 때문입니다. 이런 블롭이 걸친 격자 중 적어도 하나는 일치 위치를 보고합니다.
+    정밀 검사는 거친 일치 위치 주변 (3 x 3 거친 칸)의 모든 검사 위치를 원래 해상도로 확인하므로
+    보고되는 좌표는 항상 실제로 일치한 픽셀입니다. 그보다 작은 블롭은 놓칠 수 있습니다.
+    """
+
+    def __init__(self, factor=DEFAULT_PYRAMID_FACTOR, step=SCAN_STEP, full_refine_ratio=FULL_REFINE_RATIO):
+        """
+        Args:
+            factor: 거친 검사 간격 k (픽셀, step의 배수)
+            step: 정밀 검사 간격 (격자 검사 간격)
+            full_refine_ratio: 전체 정밀 검사로 전환하는 후보 비율
+        """
+        if factor < step or factor % step:
+            raise ValueError(f"Pyramid factor must be a positive multiple of {step}, got {factor}")
+
+        self.factor = factor
+        self.stride = factor // step  # 검사 위치 배열 기준 간격
+        self.full_refine_ratio = full_refine_ratio
+
+        # 통계
+        self.ticks = 0
+        self.coarse_hits = 0
+        self.last_refine_ratio = 0.0
+
+    def min_blob_size(self):
+        """놓치지 않는 것이 보장되는 블롭 정사각형의 한 변 (픽셀)"""
+        return self.factor
+
+    def match(self, img_array, matcher):
+        """
+        거친 검사 후 정밀 검사한 일치 마스크 반환
+
+        Args:
+            img_array: 격자 검사 위치만 추출한 (H, W, 3) 배열 (sample_grid() 결과)
+            matcher: match(array) -> bool 마스크를 제공하는 매처
+
+        Returns:
+            ndarray: (H, W) bool 일치 마스크 (정밀 검사하지 않은 위치는 False)
+        """
+        height, width = img_array.shape[:2]
+        stride = self.stride
+        self.ticks += 1
+
+        # 거친 검사 (슬라이스 뷰이므로 복사 없음)
+        coarse = matcher.match(img_array[::stride, ::stride])
+        self.coarse_hits = int(np.count_nonzero(coarse))
+        if not self.coarse_hits:
+            self.last_refine_ratio = 0.0
+            return np.zeros((height, width), dtype=bool)
+
+        # 거친 일치 칸과 이웃 칸을 원래 검사 위치 후보로 확장
+        candidates = _dilate(coarse)
+        candidates = np.repeat(np.repeat(candidates, stride, axis=0), stride, axis=1)
+        # 거친 칸 (i, j)는 검사 위치 (i*stride, j*stride)를 중심으로 양쪽 stride 범위를 덮도록 한 칸 당김
+        offset = stride // 2
+        candidates = candidates[offset:offset + height, offset:offset + width]
+        if candidates.shape != (height, width):
+            # 마지막 거친 칸 뒤의 검사 위치는 마지막 칸의 후보 여부를 그대로 따름
+            candidates = np.pad(candidates, ((0, height - candidates.shape[0]), (0, width - candidates.shape[1])),
+                                mode="edge")
+
+        self.last_refine_ratio = float(candidates.mean())
+        if self.last_refine_ratio > self.full_refine_ratio:
+            return matcher.match(img_array)
+
+        mask = np.zeros((height, width), dtype=bool)
+        mask[candidates] = matcher.match(img_array[candidates])
+        return mask
+
+    def stats(self):
+        """
+        피라미드 검색 통계 반환
+
+        Returns:
+            dict: 거친 검사 간격, 보장 블롭 크기, 마지막 거친 일치 수와 정밀 검사 비율
+        """
+        return {
+            "factor": self.factor,
+            "min_blob_size": self.min_blob_size(),
+            "ticks": self.ticks,
+            "coarse_hits": self.coarse_hits,
+            "last_refine_ratio": self.last_refine_ratio,
+        }
+
+
+def _dilate(mask):
+    """bool 마스크를 3 x 3 이웃으로 확장"""
+    padded = np.pad(mask, 1)
+    rows = padded[:-2] | padded[1:-1] | padded[2:]
+    return rows[:, :-2] | rows[:, 1:-1] | rows[:, 2:]
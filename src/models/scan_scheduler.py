@@ -0,0 +1,120 @@
+"""
+검사 주기를 결과 변화에 맞춰 조절하는 적응형 스케줄러 모듈 (Qt 의존성 없음)
+"""
+import time
+from collections import deque
+
+
+# 기본 검사 간격과 적응 범위 (ms)
+DEFAULT_INTERVAL_MS = 100
+DEFAULT_MIN_INTERVAL_MS = 20
+DEFAULT_MAX_INTERVAL_MS = 500
+
+# 결과가 그대로일 때 간격을 늘리는 배율
+DEFAULT_BACKOFF = 1.5
+
+# 실효 주파수 계산에 사용하는 최근 틱 수
+HZ_WINDOW = 32
+
+
+class ScanScheduler:
+    """
+    마감 시각 기준으로 다음 검사까지의 대기 시간을 계산하는 스케줄러
+
+    감지 결과가 나타나거나 바뀌면 간격을 하한으로 줄이고, 결과가 그대로면
+    상한까지 지수적으로 늘립니다. 대기 시간은 '작업 후 고정 대기'가 아니라
+    틱 시작 시각 + 간격에서 실제 작업 시간을 뺀 값입니다.
+    """
+
+    def __init__(self, interval_ms=DEFAULT_INTERVAL_MS, min_interval_ms=DEFAULT_MIN_INTERVAL_MS,
+                 max_interval_ms=DEFAULT_MAX_INTERVAL_MS, backoff=DEFAULT_BACKOFF, adaptive=True):
+        """
+        Args:
+            interval_ms: 시작 간격 (adaptive가 False면 고정 간격)
+            min_interval_ms: 결과가 바뀌었을 때 사용하는 간격 하한
+            max_interval_ms: 결과가 그대로일 때 늘어나는 간격 상한
+            backoff: 결과가 그대로일 때 틱마다 간격에 곱하는 배율
+            adaptive: False면 interval_ms 고정 (마감 시각 기준 대기는 유지)
+        """
+        if not 0 < min_interval_ms <= max_interval_ms:
+            raise ValueError("Interval bounds must satisfy 0 < min_interval_ms <= max_interval_ms")
+
+        self.base_interval_ms = interval_ms
+        self.min_interval_ms = min_interval_ms
+        self.max_interval_ms = max_interval_ms
+        self.backoff = backoff
+        self.adaptive = adaptive
+
+        self.tick_starts = deque(maxlen=HZ_WINDOW)
+        self.reset()
+
+    def reset(self):
+        """간격과 통계를 시작 상태로 되돌림"""
+        self.interval_ms = self.base_interval_ms
+        self.tick_start = None
+        self.tick_starts.clear()
+        self.ticks = 0
+        self.overruns = 0
+        self.last_work_ms = 0.0
+
+    def begin_tick(self):
+        """검사 시작 시각 기록"""
+        self.tick_start = time.monotonic()
+        self.tick_starts.append(self.tick_start)
+
+    def end_tick(self, changed):
+        """
+        검사 결과를 반영해 간격을 조절하고 다음 틱까지 대기 시간 반환
+
+        Args:
+            changed: 감지 결과가 나타나거나 바뀌었으면 True
+
+        Returns:
+            int: 다음 검사까지 대기할 ms
+        """
+        self.ticks += 1
+        if self.adaptive:
+            if changed:
+                self.interval_ms = self.min_interval_ms
+            else:
+                self.interval_ms = min(self.max_interval_ms, self.interval_ms * self.backoff)
+
+        if self.tick_start is not None:
+            self.last_work_ms = (time.monotonic() - self.tick_start) * 1000.0
+            if self.last_work_ms > self.interval_ms:
+                self.overruns += 1
+        return self.delay_ms()
+
+    def delay_ms(self):
+        """
+        현재 틱의 마감 시각까지 남은 시간 반환
+
+        Returns:
+            int: 대기할 ms (작업이 간격을 넘겼으면 0)
+        """
+        if self.tick_start is None:
+            return int(self.interval_ms)
+        deadline = self.tick_start + self.interval_ms / 1000.0
+        return max(0, int(round((deadline - time.monotonic()) * 1000.0)))
+
+    def effective_hz(self):
+        """최근 틱 시작 간격으로 계산한 실제 검사 주파수 (틱이 2개 미만이면 0)"""
+        if len(self.tick_starts) < 2:
+            return 0.0
+        elapsed = self.tick_starts[-1] - self.tick_starts[0]
+        return (len(self.tick_starts) - 1) / elapsed if elapsed > 0 else 0.0
+
+    def stats(self):
+        """
+        스케줄링 통계 반환
+
+        Returns:
+            dict: 현재 간격, 실효 주파수, 틱 수, 간격 초과 횟수, 마지막 작업 시간
+        """
+        return {
+            "interval_ms": self.interval_ms,
+            "effective_hz": self.effective_hz(),
+            "ticks": self.ticks,
+            "overruns": self.overruns,
+            "last_work_ms": self.last_work_ms,
+        }
@@ -0,0 +1,348 @@
+"""
+여러 프로세스가 프레임을 복사 없이 공유하는 공유 메모리 링 버퍼 모듈 (Qt 의존성 없음)
+
+캡처 쪽 하나가 고정 크기 슬롯에 프레임을 차례로 기록하고, 감지 프로세스 여럿이 같은 공유 메모리에서
+가장 최근 프레임의 NumPy 뷰를 직접 읽습니다 (최신 프레임 우선, 놓친 프레임은 건너뜀).
+
+슬롯마다 시퀀스 잠금(seqlock) 번호를 둡니다. 기록 중에는 홀수, 기록이 끝나면 2 x 프레임 번호(짝수)입니다.
+읽는 쪽은 사용 전후로 번호가 같은지 확인해 그 사이에 덮어쓰였는지 판단합니다.
+기록하는 쪽은 링 하나에 하나만 있어야 합니다.
+"""
+import sys
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from src.models.frame_source import FrameSource, rect_to_tuple
+
+
+# 기본 슬롯 수 (읽는 쪽이 최신 프레임을 처리하는 동안 기록이 돌아와 덮어쓰지 않도록 여유를 둠)
+DEFAULT_SLOTS = 4
+
+# 새 프레임을 기다릴 때의 확인 간격 (초)
+DEFAULT_POLL_INTERVAL = 0.001
+
+RING_MAGIC = 0x52494E47  # "RING"
+
+# 헤더와 슬롯 데이터 정렬 단위 (바이트)
+ALIGNMENT = 64
+
+HEADER_DTYPE = np.dtype([
+    ("magic", "<u4"), ("slots", "<u4"), ("max_width", "<u4"), ("max_height", "<u4"),
+    ("latest", "<u8"),  # 마지막으로 기록을 마친 프레임 번호 (0이면 아직 없음)
+])
+
+SLOT_DTYPE = np.dtype([
+    ("sequence", "<u8"),  # 시퀀스 잠금 번호 (홀수: 기록 중, 짝수: 2 x 프레임 번호)
+    ("timestamp", "<f8"),
+    ("x", "<i4"), ("y", "<i4"), ("width", "<u4"), ("height", "<u4"),
+])
+
+
+def _align(size):
+    """ALIGNMENT 배수로 올림"""
+    return -(-size // ALIGNMENT) * ALIGNMENT
+
+
+def max_area_size(rects):
+    """
+    여러 모니터링 영역을 모두 담을 수 있는 슬롯 크기 계산
+
+    Args:
+        rects: QRect 또는 (x, y, w, h) 튜플 목록
+
+    Returns:
+        tuple: (최대 너비, 최대 높이)
+    """
+    sizes = [rect_to_tuple(rect)[2:] for rect in rects]
+    return max(w for w, _ in sizes), max(h for _, h in sizes)
+
+
+class RingFrame:
+    """링 슬롯의 프레임 뷰 (사용 후 valid()로 그 사이에 덮어쓰이지 않았는지 확인)"""
+
+    __slots__ = ("ring", "slot", "stamp", "array", "sequence", "timestamp", "rect")
+
+    def __init__(self, ring, slot, stamp, array, sequence, timestamp, rect):
+        self.ring = ring
+        self.slot = slot
+        self.stamp = stamp
+        self.array = array
+        self.sequence = sequence
+        self.timestamp = timestamp
+        self.rect = rect
+
+    def valid(self):
+        """뷰를 얻은 뒤 기록하는 쪽이 이 슬롯을 덮어쓰지 않았으면 True"""
+        return int(self.ring.slot_table["sequence"][self.slot]) == self.stamp
+
+
+class SharedFrameRing:
+    """multiprocessing.shared_memory 위의 고정 크기 프레임 슬롯 링"""
+
+    def __init__(self, shm, owner):
+        """
+        create() 또는 attach()로 생성합니다.
+
+        Args:
+            shm: SharedMemory 객체
+            owner: True면 이 객체가 공유 메모리를 만들었으며 unlink() 책임이 있음
+        """
+        self.shm = shm
+        self.owner = owner
+        self.header = np.ndarray((), dtype=HEADER_DTYPE, buffer=shm.buf)
+        if int(self.header["magic"]) != RING_MAGIC:
+            raise ValueError(f"Not a shared frame ring: {shm.name}")
+
+        self.slot_count = int(self.header["slots"])
+        self.max_width = int(self.header["max_width"])
+        self.max_height = int(self.header["max_height"])
+        table_offset = _align(HEADER_DTYPE.itemsize)
+        self.slot_table = np.ndarray((self.slot_count,), dtype=SLOT_DTYPE, buffer=shm.buf, offset=table_offset)
+        data_offset = table_offset + _align(self.slot_count * SLOT_DTYPE.itemsize)
+        self.slot_bytes = _align(self.max_width * self.max_height * 3)
+        self.slot_data = np.ndarray((self.slot_count, self.slot_bytes), dtype=np.uint8,
+                                    buffer=shm.buf, offset=data_offset)
+
+        # 통계 (이 프로세스 기준)
+        self.published = 0
+        self.reads = 0
+        self.torn_reads = 0
+        self.skipped_frames = 0
+
+    @classmethod
+    def create(cls, max_width, max_height, slots=DEFAULT_SLOTS, name=None):
+        """
+        새 링 생성 (슬롯 크기는 max_width x max_height 프레임)
+
+        Args:
+            max_width, max_height: 슬롯에 담을 수 있는 최대 프레임 크기 (가장 큰 모니터링 영역)
+            slots: 슬롯 수
+            name: 공유 메모리 이름 (None이면 자동 생성)
+
+        Returns:
+            SharedFrameRing: 생성한 링 (사용이 끝나면 close()와 unlink() 호출)
+        """
+        if max_width <= 0 or max_height <= 0 or slots < 2:
+            raise ValueError(f"Invalid ring geometry: {max_width}x{max_height}, {slots} slots")
+        size = (_align(HEADER_DTYPE.itemsize) + _align(slots * SLOT_DTYPE.itemsize)
+                + slots * _align(max_width * max_height * 3))
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        header = np.ndarray((), dtype=HEADER_DTYPE, buffer=shm.buf)
+        header["slots"], header["max_width"], header["max_height"] = slots, max_width, max_height
+        header["latest"] = 0
+        header["magic"] = RING_MAGIC
+        del header
+        return cls(shm, owner=True)
+
+    @classmethod
+    def for_areas(cls, rects, slots=DEFAULT_SLOTS, name=None):
+        """설정된 모니터링 영역 중 가장 큰 크기에 맞춘 링 생성"""
+        width, height = max_area_size(rects)
+        return cls.create(width, height, slots, name)
+
+    @classmethod
+    def attach(cls, name):
+        """
+        다른 프로세스가 만든 링에 연결
+
+        Args:
+            name: 공유 메모리 이름 (생성한 쪽의 ring.name)
+
+        Returns:
+            SharedFrameRing: 연결한 링 (사용이 끝나면 close() 호출)
+        """
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            # 3.13 이전에는 연결만 한 프로세스도 종료 시 공유 메모리를 지우려 하므로 등록을 건너뜀
+            # (등록 후 해제하면 multiprocessing 자식 프로세스와 공유하는 추적기에서 생성한 쪽의 등록까지 지워짐)
+            from multiprocessing import resource_tracker
+            register = resource_tracker.register
+            resource_tracker.register = lambda name, rtype: None
+            try:
+                shm = shared_memory.SharedMemory(name=name)
+            finally:
+                resource_tracker.register = register
+        return cls(shm, owner=False)
+
+    @property
+    def name(self):
+        """다른 프로세스에서 attach()할 때 사용할 공유 메모리 이름"""
+        return self.shm.name
+
+    @property
+    def latest_sequence(self):
+        """마지막으로 기록을 마친 프레임 번호 (0이면 아직 없음)"""
+        return int(self.header["latest"])
+
+    def fits(self, width, height):
+        """프레임이 슬롯에 들어가는지 확인"""
+        return width <= self.max_width and height <= self.max_height
+
+    def publish(self, frame, timestamp, rect):
+        """
+        다음 슬롯에 프레임 기록 (기록하는 쪽은 하나여야 함)
+
+        Args:
+            frame: (h, w, 3 이상) uint8 배열
+            timestamp: 캡처 시각 (초)
+            rect: 프레임이 덮는 화면 영역 (QRect 또는 (x, y, w, h) 튜플, 좌상단만 사용)
+
+        Returns:
+            int: 기록한 프레임 번호
+
+        Raises:
+            ValueError: 프레임이 슬롯보다 큰 경우
+        """
+        height, width = frame.shape[:2]
+        if not self.fits(width, height):
+            raise ValueError(f"Frame {width}x{height} does not fit ring slots {self.max_width}x{self.max_height}")
+        x, y, _, _ = rect_to_tuple(rect)
+
+        sequence = self.latest_sequence + 1
+        slot = sequence % self.slot_count
+        sequences = self.slot_table["sequence"]
+
+        # 홀수로 바꿔 기록 중임을 알리고, 데이터와 메타데이터를 쓴 뒤 짝수로 완료 표시
+        sequences[slot] = 2 * sequence - 1
+        np.copyto(self._slot_view(slot, width, height), frame[..., :3])
+        entry = self.slot_table[slot]
+        entry["timestamp"], entry["x"], entry["y"] = timestamp, x, y
+        entry["width"], entry["height"] = width, height
+        sequences[slot] = 2 * sequence
+        self.header["latest"] = sequence
+        self.published += 1
+        return sequence
+
+    def read_latest(self, after=0):
+        """
+        가장 최근 프레임의 복사 없는 뷰 반환 (최신 프레임 우선)
+
+        Args:
+            after: 이미 처리한 마지막 프레임 번호 (이보다 새 프레임이 없으면 None)
+
+        Returns:
+            RingFrame: 최신 프레임 뷰 (없거나 읽는 중 덮어쓰였으면 None)
+        """
+        sequence = self.latest_sequence
+        if sequence == 0 or sequence <= after:
+            return None
+
+        slot = sequence % self.slot_count
+        stamp = 2 * sequence
+        sequences = self.slot_table["sequence"]
+        entry = self.slot_table[slot].copy()
+        view = self._slot_view(slot, int(entry["width"]), int(entry["height"]))
+        if int(sequences[slot]) != stamp or int(entry["sequence"]) != stamp:
+            # 메타데이터를 읽는 사이 기록하는 쪽이 한 바퀴 돌아와 덮어씀
+            self.torn_reads += 1
+            return None
+
+        self.reads += 1
+        if after:
+            self.skipped_frames += sequence - after - 1
+        rect = (int(entry["x"]), int(entry["y"]), int(entry["width"]), int(entry["height"]))
+        return RingFrame(self, slot, stamp, view, sequence, float(entry["timestamp"]), rect)
+
+    def wait_latest(self, after=0, timeout=None, poll_interval=DEFAULT_POLL_INTERVAL):
+        """
+        after보다 새 프레임이 올 때까지 기다려 최신 프레임 뷰 반환
+
+        Returns:
+            RingFrame: 최신 프레임 뷰 (timeout 안에 없으면 None)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            frame = self.read_latest(after)
+            if frame is not None:
+                return frame
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            time.sleep(poll_interval)
+
+    def _slot_view(self, slot, width, height):
+        """슬롯 데이터의 (height, width, 3) 뷰"""
+        return self.slot_data[slot, :width * height * 3].reshape(height, width, 3)
+
+    def stats(self):
+        """
+        링 통계 반환 (이 프로세스 기준)
+
+        Returns:
+            dict: 슬롯 구성, 기록/읽기 수, 덮어쓰여 버린 읽기 수, 건너뛴 프레임 수
+        """
+        return {
+            "name": self.name,
+            "slots": self.slot_count,
+            "slot_size": (self.max_width, self.max_height),
+            "latest_sequence": self.latest_sequence,
+            "published": self.published,
+            "reads": self.reads,
+            "torn_reads": self.torn_reads,
+            "skipped_frames": self.skipped_frames,
+        }
+
+    def close(self):
+        """이 프로세스의 연결 해제 (이전에 반환한 뷰는 더 이상 사용할 수 없음)"""
+        self.header = self.slot_table = self.slot_data = None
+        try:
+            self.shm.close()
+        except BufferError:
+            # 외부에 남은 뷰가 있으면 가비지 컬렉션 시 해제됨
+            pass
+
+    def unlink(self):
+        """공유 메모리 삭제 (생성한 쪽에서 모든 프로세스가 끝난 뒤 호출)"""
+        if self.owner:
+            self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        if self.owner:
+            self.unlink()
+        return False
+
+
+class SharedRingFrameSource(FrameSource):
+    """
+    공유 메모리 링의 최신 프레임을 감지기에 주는 공급원 (다른 프로세스의 감지기용)
+
+    반환한 배열은 복사 없는 뷰이므로 다음 grab() 전까지만 사용하고,
+    결과를 쓰기 전에 last_frame.valid()로 덮어쓰이지 않았는지 확인할 수 있습니다.
+    """
+
+    def __init__(self, name, timeout=1.0):
+        """
+        Args:
+            name: 링 공유 메모리 이름
+            timeout: 새 프레임을 기다리는 최대 시간 (초)
+        """
+        self.ring = SharedFrameRing.attach(name)
+        self.timeout = timeout
+        self.last_frame = None
+
+    def grab(self, rect):
+        """최신 프레임에서 요청 영역 뷰 추출 (이미 본 프레임이면 새 프레임을 기다림)"""
+        after = self.last_frame.sequence if self.last_frame is not None else 0
+        frame = self.ring.wait_latest(after, self.timeout)
+        if frame is None:
+            raise TimeoutError(f"No new frame in shared ring {self.ring.name} within {self.timeout}s")
+        self.last_frame = frame
+
+        x, y, w, h = rect_to_tuple(rect)
+        left, top = max(0, x - frame.rect[0]), max(0, y - frame.rect[1])
+        return frame.array[top:top + h, left:left + w], frame.timestamp
+
+    def grab_into(self, rect, out):
+        """공유 프레임 뷰를 그대로 반환 (out 버퍼는 사용하지 않음)"""
+        return self.grab(rect)
+
+    def close(self):
+        """링 연결 해제"""
+        self.last_frame = None
+        self.ring.close()
@@ -3,6 +3,8 @@
 """
 from PyQt5.QtGui import QColor
 
+from src.models.color_matcher import get_color_matcher, get_range_matcher
+
 
 def calculate_color_range(color, threshold):
     """
@@ -50,13 +52,24 @@ def is_color_in_range(check_color, target_color, threshold):
     Returns:
         bool: 범위 내에 있으면 True, 아니면 False
     """
-    check_r, check_g, check_b = check_color
-    target_r, target_g, target_b = target_color.red(), target_color.green(), target_color.blue()
+    target_rgb = (target_color.red(), target_color.green(), target_color.blue())
     
-    # 각 채널별로 임계값 내에 있는지 확인 (오버플로우 방지를 위해 int 변환)
-    r_in_range = abs(int(check_r) - int(target_r)) <= threshold
-    g_in_range = abs(int(check_g) - int(target_g)) <= threshold
-    b_in_range = abs(int(check_b) - int(target_b)) <= threshold
+    # (타겟 색상, 임계값)별로 캐시된 LUT 매처로 판정
+    return get_color_matcher(target_rgb, threshold).match_pixel(check_color)
+
+
+def color_range_matcher(color, threshold):
+    """
+    calculate_color_range가 계산한 채널별 최소/최대 범위로 매처를 생성합니다.
     
-    # 모든 채널이 임계값 내에 있어야 True
-    return r_in_range and g_in_range and b_in_range
+    Args:
+        color (QColor): 기준 색상
+        threshold (int): 색상 임계값
+        
+    Returns:
+        ColorMatcher: 채널별 범위가 컴파일된 매처 (LRU 캐시)
+    """
+    min_color, max_color, _, _ = calculate_color_range(color, threshold)
+    min_rgb = (min_color.red(), min_color.green(), min_color.blue())
+    max_rgb = (max_color.red(), max_color.green(), max_color.blue())
+    return get_range_matcher(min_rgb, max_rgb)
@@ -3,19 +3,25 @@
 """
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
-    QColorDialog, QSlider, QSpinBox, QCheckBox
+    QColorDialog, QSlider, QSpinBox, QCheckBox, QComboBox
 )
 from PyQt5.QtCore import Qt, pyqtSignal, QRect
 from PyQt5.QtGui import QColor
 
+from src.models.perceptual_matcher import MODE_RGB, MODE_LAB, MODE_HUE
+
 
 class ControlPanel(QWidget):
     """컨트롤 패널 위젯"""
     color_changed = pyqtSignal(QColor)
     threshold_changed = pyqtSignal(int)
+    color_mode_changed = pyqtSignal(str)
+    palette_changed = pyqtSignal(list)  # (QColor, 임계값) 목록
     monitoring_toggled = pyqtSignal(bool)
     area_interaction_toggled = pyqtSignal(bool)
     debug_mode_toggled = pyqtSignal(bool)
+    blob_mode_toggled = pyqtSignal(bool)
+    timing_stats_toggled = pyqtSignal(bool)
     exit_requested = pyqtSignal()
     
     def __init__(self):
@@ -43,6 +49,18 @@ class ControlPanel(QWidget):
         color_layout.addStretch()
         layout.addLayout(color_layout)
         
+        # 팔레트 영역 (여러 색상을 한 번에 감지)
+        palette_layout = QHBoxLayout()
+        self.palette_info = QLabel("팔레트: 없음")
+        palette_layout.addWidget(self.palette_info)
+        self.palette_add_btn = QPushButton("팔레트에 추가")
+        self.palette_add_btn.clicked.connect(self.add_palette_color)
+        palette_layout.addWidget(self.palette_add_btn)
+        self.palette_clear_btn = QPushButton("팔레트 비우기")
+        self.palette_clear_btn.clicked.connect(self.clear_palette)
+        palette_layout.addWidget(self.palette_clear_btn)
+        layout.addLayout(palette_layout)
+        
         # 임계값 조절 영역
         threshold_layout = QHBoxLayout()
         threshold_layout.addWidget(QLabel("임계값:"))
@@ -58,6 +76,18 @@ class ControlPanel(QWidget):
         threshold_layout.addWidget(self.threshold_display)
         layout.addLayout(threshold_layout)
         
+        # 매칭 방식 선택 영역 (임계값은 방식에 따라 채널 차이, ΔE, 색상각으로 해석)
+        mode_layout = QHBoxLayout()
+        mode_layout.addWidget(QLabel("매칭 방식:"))
+        self.mode_combo = QComboBox()
+        self.mode_combo.addItem("RGB 채널 차이", MODE_RGB)
+        self.mode_combo.addItem("CIELAB ΔE", MODE_LAB)
+        self.mode_combo.addItem("HSV 색상각", MODE_HUE)
+        self.mode_combo.currentIndexChanged.connect(self.update_color_mode)
+        mode_layout.addWidget(self.mode_combo)
+        mode_layout.addStretch()
+        layout.addLayout(mode_layout)
+        
         # 색상 범위 표시
         range_layout = QHBoxLayout()
         range_layout.addWidget(QLabel("색상 범위:"))
@@ -85,6 +115,16 @@ class ControlPanel(QWidget):
         self.debug_checkbox.toggled.connect(self.debug_toggled)
         layout.addWidget(self.debug_checkbox)
         
+        # 블롭 모드 토글 (켜면 포인트 대신 연결 요소 경계 상자로 하이라이트)
+        self.blob_checkbox = QCheckBox("블롭 모드 (연결된 영역을 상자로 표시)")
+        self.blob_checkbox.toggled.connect(self.blob_mode_toggled)
+        layout.addWidget(self.blob_checkbox)
+        
+        # 단계별 소요 시간 표시 토글 (켜면 상태 표시줄에 p50/p95 요약 표시)
+        self.timing_checkbox = QCheckBox("단계별 소요 시간 표시 (p50/p95)")
+        self.timing_checkbox.toggled.connect(self.timing_toggled)
+        layout.addWidget(self.timing_checkbox)
+        
         # 모니터링 영역 버튼
         self.area_select_btn = QPushButton("모니터링 영역 조절 모드")
         self.area_select_btn.setCheckable(True)
@@ -115,6 +155,9 @@ class ControlPanel(QWidget):
         # 현재 타겟 색상
         self.current_color = QColor(255, 0, 0)
         
+        # 팔레트 항목 ((QColor, 임계값) 목록)
+        self.palette = []
+        
         # 초기 색상 범위 표시 업데이트
         self.update_color_range(self.current_color, 10)
     
@@ -127,12 +170,38 @@ class ControlPanel(QWidget):
             self.update_color_range(color, self.threshold_slider.value())
             self.color_changed.emit(color)
     
+    def add_palette_color(self):
+        """현재 타겟 색상과 임계값을 팔레트에 추가"""
+        self.palette.append((QColor(self.current_color), self.threshold_slider.value()))
+        self.update_palette_info()
+        self.palette_changed.emit(list(self.palette))
+    
+    def clear_palette(self):
+        """팔레트 비우기 (단일 타겟 색상으로 복귀)"""
+        self.palette = []
+        self.update_palette_info()
+        self.palette_changed.emit([])
+    
+    def update_palette_info(self, matched_indices=None):
+        """팔레트 항목 수와 마지막으로 일치한 항목 번호 표시"""
+        if not self.palette:
+            self.palette_info.setText("팔레트: 없음")
+            return
+        text = f"팔레트: {len(self.palette)}색"
+        if matched_indices:
+            text += " (일치: " + ", ".join(str(i + 1) for i in sorted(set(matched_indices))) + ")"
+        self.palette_info.setText(text)
+    
     def update_threshold(self, value):
         """임계값 업데이트 및 색상 범위 표시 업데이트"""
         self.threshold_display.setValue(value)
         self.update_color_range(self.current_color, value)
         self.threshold_changed.emit(value)
     
+    def update_color_mode(self, index):
+        """매칭 방식 변경"""
+        self.color_mode_changed.emit(self.mode_combo.itemData(index))
+    
     def update_color_range(self, color, threshold):
         """색상 범위 업데이트 및 표시"""
         # RGB 값 가져오기
@@ -172,10 +241,24 @@ class ControlPanel(QWidget):
         if enabled:
             self.status_label.setText("디버깅 모드 활성화 - 마우스 아래 픽셀 색상 확인 중...")
         else:
-            if self.monitor_btn.isChecked():
-                self.status_label.setText("모니터링 중...")
-            else:
-                self.status_label.setText("대기 중...")
+            self.restore_status()
+    
+    def timing_toggled(self, enabled):
+        """단계별 소요 시간 표시 토글"""
+        self.timing_stats_toggled.emit(enabled)
+        if not enabled:
+            self.restore_status()
+    
+    def restore_status(self):
+        """모니터링 상태에 맞는 기본 상태 문구 표시"""
+        if self.monitor_btn.isChecked():
+            self.status_label.setText("모니터링 중...")
+        else:
+            self.status_label.setText("대기 중...")
+    
+    def update_timing_stats(self, text):
+        """상태 표시줄에 단계별 소요 시간 요약 표시"""
+        self.status_label.setText(text)
     
     def update_selection_info(self, rect):
         """선택 영역 정보 업데이트"""
@@ -13,6 +13,10 @@ from src.views.resize_handle import ResizeHandle
 from src.utils.window_utils import set_window_clickthrough, set_window_topmost
 
 
+# 드래그/크기 조절 중 area_changed 신호의 최소 간격 (ms, 그 사이의 변경은 마지막 영역 하나로 합침)
+AREA_EMIT_INTERVAL_MS = 50
+
+
 class MonitoringArea(QMainWindow):
     """조절 가능한 모니터링 영역 윈도우"""
     area_changed = pyqtSignal(QRect)  # 영역 변경 시 신호
@@ -54,6 +58,13 @@ class MonitoringArea(QMainWindow):
         self.resizing = False
         self.resize_handle = None
         
+        # 드래그 중 영역 변경 신호 스로틀 (첫 변경은 즉시, 이후는 간격마다 최신 영역만 발생)
+        self.last_emitted_rect = None
+        self.area_change_pending = False
+        self.area_emit_timer = QTimer(self)
+        self.area_emit_timer.setSingleShot(True)
+        self.area_emit_timer.timeout.connect(self._flush_area_changed)
+        
         # 윈도우 핸들 설정
         self.hwnd = None
         self.install_window_hook()
@@ -120,6 +131,28 @@ class MonitoringArea(QMainWindow):
         """현재 모니터링 영역 가져오기"""
         return QRect(self.pos().x(), self.pos().y(), self.width(), self.height())
     
+    def _schedule_area_changed(self):
+        """드래그 중 영역 변경 신호를 AREA_EMIT_INTERVAL_MS 간격으로 합쳐서 발생"""
+        if self.area_emit_timer.isActive():
+            self.area_change_pending = True
+            return
+        self._emit_area_changed()
+        self.area_emit_timer.start(AREA_EMIT_INTERVAL_MS)
+    
+    def _flush_area_changed(self):
+        """간격 동안 쌓인 변경이 있으면 최신 영역으로 신호 발생"""
+        if self.area_change_pending:
+            self._emit_area_changed()
+            self.area_emit_timer.start(AREA_EMIT_INTERVAL_MS)
+    
+    def _emit_area_changed(self):
+        """현재 영역으로 area_changed 신호 발생 (직전에 보낸 영역과 같으면 생략)"""
+        self.area_change_pending = False
+        rect = self.get_monitoring_rect()
+        if rect != self.last_emitted_rect:
+            self.last_emitted_rect = rect
+            self.area_changed.emit(rect)
+    
     def mousePressEvent(self, event):
         """마우스 클릭 이벤트"""
         if not self.interaction_enabled:
@@ -181,15 +214,15 @@ class MonitoringArea(QMainWindow):
                 # 핸들 위치 업데이트
                 self.update_handle_positions()
                 
-                # 영역 변경 신호 발생
-                self.area_changed.emit(self.get_monitoring_rect())
+                # 영역 변경 신호 발생 (간격 내 변경은 합쳐짐)
+                self._schedule_area_changed()
             
             elif self.dragging:
                 # 드래그로 이동
                 self.move(event.globalPos() - self.drag_position)
                 
-                # 영역 변경 신호 발생
-                self.area_changed.emit(self.get_monitoring_rect())
+                # 영역 변경 신호 발생 (간격 내 변경은 합쳐짐)
+                self._schedule_area_changed()
             
             event.accept()
     
@@ -203,8 +236,9 @@ class MonitoringArea(QMainWindow):
             self.resizing = False
             self.resize_handle = None
             
-            # 영역 변경 신호 발생
-            self.area_changed.emit(self.get_monitoring_rect())
+            # 놓은 위치의 최종 영역은 대기 없이 바로 신호 발생
+            self.area_emit_timer.stop()
+            self._emit_area_changed()
     
     def paintEvent(self, event):
         """화면 그리기 이벤트"""
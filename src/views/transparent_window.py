@@ -1,14 +1,36 @@
 """
 투명 오버레이 윈도우 모듈
 """
+import time
+
+import numpy as np
 from PyQt5.QtWidgets import QMainWindow
-from PyQt5.QtCore import Qt, QRect, QTimer
-from PyQt5.QtGui import QPainter, QPen, QColor, QBrush, QGuiApplication
+from PyQt5.QtCore import Qt, QRect
+from PyQt5.QtGui import QPainter, QPen, QColor, QBrush, QGuiApplication, QRegion
 import win32gui
 
+from src.models.blob_labeler import merge_boxes
+from src.models.instrumentation import get_instrumentation
 from src.utils.window_utils import set_window_transparent, set_window_topmost, set_window_clickthrough
 
 
+# 하이라이트 사각형 크기 (포인트 중심 10x10)
+SQUARE_SIZE = 10
+
+# 디버그 커서 확대 상자 크기와 정보 텍스트 배경 크기
+DEBUG_BOX_SIZE = 40
+DEBUG_TEXT_SIZE = (150, 45)
+
+# 테두리 두께를 고려해 다시 그릴 영역에 더하는 여백 (픽셀)
+PAINT_MARGIN = 2
+
+# 하이라이트 포인트가 이 개수를 넘으면 겹치는 사각형을 합쳐서 그림
+MERGE_THRESHOLD = 256
+
+# 다시 그릴 상자가 이 개수를 넘으면 상자별 영역 대신 전체를 덮는 사각형 하나로 요청
+DIRTY_BOX_LIMIT = 64
+
+
 class TransparentWindow(QMainWindow):
     """투명 오버레이 윈도우"""
     
@@ -33,8 +55,14 @@ class TransparentWindow(QMainWindow):
         self.hwnd = None
         self.install_window_hook()
         
-        # 하이라이트할 포인트 목록
+        # 하이라이트할 포인트 목록과 미리 계산한 사각형 목록 (paintEvent에서 한 번에 그림)
         self.highlight_points = []
+        self.point_rects = []
+        
+        # 하이라이트할 블롭 목록과 경계 상자 사각형 목록 (블롭마다 하나)
+        self.highlight_blobs = []
+        self.blob_rects = []
+        self.blob_color = QColor(255, 0, 255, 180)
         self.highlight_color = QColor(255, 0, 0, 150)  # 반투명 빨간색
         
         # 하이라이트 점 크기
@@ -45,10 +73,16 @@ class TransparentWindow(QMainWindow):
         self.debug_cursor_pos = None
         self.debug_pixel_color = None
         
-        # 화면 업데이트 타이머
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update)
-        self.update_timer.start(100)  # 100ms 간격으로 화면 갱신
+        # 마지막으로 다시 그리도록 요청한 상자 목록 ((x, y, w, h) 집합, 바뀐 상자만 다시 그림)
+        self.painted_boxes = set()
+        
+        # 다시 그리기 통계
+        self.repaint_requests = 0
+        self.paint_count = 0
+        self.paint_time_total = 0.0
+        self.paint_time_max = 0.0
+        self.last_paint_ms = 0.0
+        self.last_dirty_area = 0
     
     def install_window_hook(self):
         """윈도우 핸들을 가져와서 입력 패스스루 설정"""
@@ -82,20 +116,38 @@ class TransparentWindow(QMainWindow):
     def highlight_area(self, points, color):
         """색상 발견 위치 하이라이트"""
         self.highlight_points = points
+        self.point_rects = self._build_point_rects(points)
         # 기존 코드처럼 마젠타색 고정 사용 (전달받은 color 무시)
         self.highlight_color = QColor(255, 0, 255, 180)  # 마젠타색, 반투명
-        self.update()
+        self.refresh_dirty_region()
+    
+    def apply_highlight_delta(self, added, removed, color):
+        """이전 하이라이트에서 제거된 위치를 빼고 추가된 위치를 더함 (detection_delta 신호용)"""
+        removed_keys = {(point.x(), point.y()) for point in removed}
+        points = [point for point in self.highlight_points if (point.x(), point.y()) not in removed_keys]
+        self.highlight_area(points + list(added), color)
+    
+    def highlight_blob_areas(self, blobs, color):
+        """감지된 블롭의 경계 상자 하이라이트"""
+        self.highlight_blobs = blobs
+        # 테두리가 블롭을 가리지 않도록 경계 상자보다 1픽셀 바깥에 그림
+        self.blob_rects = [QRect(blob.left - 1, blob.top - 1, blob.width + 1, blob.height + 1) for blob in blobs]
+        self.refresh_dirty_region()
     
     def clear_highlight(self):
         """하이라이트 제거"""
         self.highlight_points = []
-        self.update()
+        self.point_rects = []
+        self.highlight_blobs = []
+        self.blob_rects = []
+        self.refresh_dirty_region()
     
     def set_debug_info(self, cursor_pos, pixel_color):
         """디버깅 정보 설정"""
         self.debug_cursor_pos = cursor_pos
         self.debug_pixel_color = pixel_color
-        self.update()
+        # 같은 위치에서 색상만 바뀌면 상자가 같으므로 디버그 영역은 항상 다시 그림
+        self.refresh_dirty_region(force=self._debug_boxes())
     
     def set_debug_mode(self, enabled):
         """디버깅 모드 설정"""
@@ -103,32 +155,125 @@ class TransparentWindow(QMainWindow):
         if not enabled:
             self.debug_cursor_pos = None
             self.debug_pixel_color = None
-        self.update()
+        self.refresh_dirty_region()
+    
+    def refresh_dirty_region(self, force=()):
+        """
+        이전과 현재 하이라이트 상자를 비교해 바뀐 상자 영역만 다시 그리도록 요청
+        
+        Args:
+            force: 바뀌지 않았어도 다시 그릴 (x, y, w, h) 상자 목록
+        """
+        boxes = self._current_boxes()
+        dirty = (boxes ^ self.painted_boxes).union(force)
+        self.painted_boxes = boxes
+        if not dirty:
+            return
+        
+        if len(dirty) > DIRTY_BOX_LIMIT:
+            # 상자가 많으면 영역 합치기 비용이 더 크므로 전체를 덮는 사각형 하나로 요청
+            xs, ys, ws, hs = np.array(list(dirty)).T
+            left, top = int(xs.min()), int(ys.min())
+            region = QRegion(left, top, int((xs + ws).max()) - left, int((ys + hs).max()) - top)
+        else:
+            region = QRegion()
+            for box in dirty:
+                region = region.united(QRect(*box))
+        self.last_dirty_area = sum(rect.width() * rect.height() for rect in region.rects())
+        self.repaint_requests += 1
+        self.update(region)
+    
+    def _build_point_rects(self, points):
+        """
+        포인트 목록을 그릴 사각형 목록으로 변환 (포인트가 많으면 겹치는 사각형을 합침)
+        
+        Returns:
+            list: QRect 목록
+        """
+        half = SQUARE_SIZE // 2
+        if len(points) <= MERGE_THRESHOLD:
+            return [QRect(point.x() - half, point.y() - half, SQUARE_SIZE, SQUARE_SIZE) for point in points]
+        
+        xs = np.fromiter((point.x() for point in points), dtype=np.int64, count=len(points)) - half
+        ys = np.fromiter((point.y() for point in points), dtype=np.int64, count=len(points)) - half
+        sizes = np.full(len(points), SQUARE_SIZE)
+        return [QRect(*box) for box in merge_boxes(xs, ys, sizes, sizes)]
+    
+    def _current_boxes(self):
+        """현재 상태에서 그려지는 모든 상자 ((x, y, w, h) 집합, 테두리 여백 포함)"""
+        m = PAINT_MARGIN
+        boxes = {
+            (rect.x() - m, rect.y() - m, rect.width() + 2 * m + 1, rect.height() + 2 * m + 1)
+            for rect in self.point_rects + self.blob_rects
+        }
+        boxes.update(self._debug_boxes())
+        return boxes
+    
+    def _debug_boxes(self):
+        """디버그 커서 상자와 정보 텍스트 배경 영역 목록"""
+        if not (self.debug_mode and self.debug_cursor_pos and self.debug_pixel_color):
+            return []
+        m = PAINT_MARGIN
+        x = self.debug_cursor_pos.x() - DEBUG_BOX_SIZE // 2
+        y = self.debug_cursor_pos.y() - DEBUG_BOX_SIZE // 2
+        text_width, text_height = DEBUG_TEXT_SIZE
+        return [
+            (x - m, y - m, DEBUG_BOX_SIZE + 2 * m + 1, DEBUG_BOX_SIZE + 2 * m + 1),
+            (x - m, y + DEBUG_BOX_SIZE + 5 - m, text_width + 2 * m, text_height + 2 * m),
+        ]
+    
+    def get_paint_stats(self):
+        """
+        다시 그리기 통계 반환
+        
+        Returns:
+            dict: 다시 그리기 요청 수, 실제 그리기 횟수, 마지막/평균/최대 그리기 시간(ms), 마지막 요청 영역 넓이
+        """
+        return {
+            "repaint_requests": self.repaint_requests,
+            "paint_count": self.paint_count,
+            "last_paint_ms": self.last_paint_ms,
+            "mean_paint_ms": self.paint_time_total / self.paint_count if self.paint_count else 0.0,
+            "max_paint_ms": self.paint_time_max,
+            "last_dirty_area": self.last_dirty_area,
+        }
     
     def close_application(self):
         """애플리케이션 종료"""
         self.close()
     
     def paintEvent(self, event):
-        """화면 그리기 이벤트"""
+        """화면 그리기 이벤트 (그리기 시간 측정)"""
+        start = time.perf_counter()
+        self._paint(event)
+        elapsed = (time.perf_counter() - start) * 1000.0
+        get_instrumentation().record("paint", elapsed / 1000.0)
+        
+        self.paint_count += 1
+        self.last_paint_ms = elapsed
+        self.paint_time_total += elapsed
+        self.paint_time_max = max(self.paint_time_max, elapsed)
+    
+    def _paint(self, event):
+        """하이라이트와 디버그 정보 그리기"""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+        # 축에 정렬된 사각형만 그리므로 안티앨리어싱 없이 그림
+        painter.setRenderHint(QPainter.Antialiasing, False)
         
-        # 하이라이트 포인트 그리기
-        if self.highlight_points:
+        # 하이라이트 포인트 그리기 (highlight_area에서 계산한 사각형을 한 번에 그림)
+        if self.point_rects:
             # 마젠타색 네모 상자 테두리만 그리기 (내부는 투명)
             pen = QPen(self.highlight_color, 2, Qt.SolidLine)  # 더 굵은 테두리(2픽셀)
             painter.setPen(pen)
             painter.setBrush(Qt.NoBrush)  # 내부는 채우지 않음 (투명)
-            
-            # 사각형 크기 설정
-            square_size = 10  # 10x10 사각형
-            
-            for point in self.highlight_points:
-                # 사각형 그리기 (중앙이 point 위치가 되도록)
-                x = point.x() - square_size // 2
-                y = point.y() - square_size // 2
-                painter.drawRect(x, y, square_size, square_size)
+            painter.drawRects(self.point_rects)
+        
+        # 하이라이트 블롭 그리기 (블롭마다 경계 상자를 테두리만 그림)
+        if self.blob_rects:
+            pen = QPen(self.blob_color, 2, Qt.SolidLine)
+            painter.setPen(pen)
+            painter.setBrush(Qt.NoBrush)
+            painter.drawRects(self.blob_rects)
         
         # 디버깅 모드 정보 표시
         if self.debug_mode and self.debug_cursor_pos and self.debug_pixel_color:
@@ -137,7 +282,7 @@ class TransparentWindow(QMainWindow):
             painter.setPen(pen)
             
             # 커서 위치에 20x20 사각형 그리기
-            rect_size = 40  # 확대해서 보기 위한 크기
+            rect_size = DEBUG_BOX_SIZE  # 확대해서 보기 위한 크기
             x = self.debug_cursor_pos.x() - rect_size // 2
             y = self.debug_cursor_pos.y() - rect_size // 2
             
@@ -155,7 +300,7 @@ class TransparentWindow(QMainWindow):
             painter.setBrush(Qt.NoBrush)
             
             # 배경 사각형 (텍스트 가독성 향상)
-            text_bg_rect = QRect(x, y + rect_size + 5, 150, 45)
+            text_bg_rect = QRect(x, y + rect_size + 5, *DEBUG_TEXT_SIZE)
             painter.fillRect(text_bg_rect, QColor(0, 0, 0, 180))
             
             # 색상 정보 텍스트